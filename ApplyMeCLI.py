@@ -0,0 +1,357 @@
+"""Apply Me tanpa GUI: import, export, query dan statistik dari command line.
+
+Tidak memuat PySide6 sama sekali; semua file dibaca / ditulis secara streaming
+(memori konstan berapa pun ukuran file). Database yang dipakai sama dengan
+aplikasi (data/apply_me.db), jadi jalankan dari root project:
+
+    python ApplyMeCLI.py import applications.csv
+    python ApplyMeCLI.py import applications.xlsx
+    python ApplyMeCLI.py import applications.jsonl
+    python ApplyMeCLI.py export backup.csv
+    python ApplyMeCLI.py export - > backup.csv
+    python ApplyMeCLI.py query --search "backend jakarta" --status Interview --format jsonl
+    python ApplyMeCLI.py stats --json
+    python ApplyMeCLI.py analytics --report funnel --group-by month -o funnel.csv
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+from app.database.Database import init_db
+
+FORMATS_BY_EXTENSION = {".csv": "csv", ".xlsx": "excel", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+
+class CLIError(Exception):
+    """Error yang cukup ditampilkan sebagai satu baris pesan (tanpa traceback)."""
+
+
+def _detect_format(path, given):
+    if given:
+        return given
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS_BY_EXTENSION:
+        raise CLIError(f"Cannot tell the format of {path}; use --format")
+    return FORMATS_BY_EXTENSION[extension]
+
+
+def _progress_printer(args, unit):
+    """progress(done, total) ke stderr; None kalau --quiet atau stderr bukan terminal."""
+    if args.quiet or not sys.stderr.isatty():
+        return None
+
+    def progress(done, total):
+        if unit == "bytes":
+            text = f"{done / 1048576:.1f} / {total / 1048576:.1f} MB"
+        else:
+            text = f"{done} / {total} rows"
+        print(f"\r{text}", end="", file=sys.stderr, flush=True)
+
+    return progress
+
+
+def _finish_progress(progress):
+    if progress:
+        print(file=sys.stderr)
+
+
+def _to_json_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+# === import ===
+def run_import(args):
+    from app.import_feature.CSVImportEngine import MANDATORY_FIELDS, read_header, import_csv
+
+    file_format = _detect_format(args.file, args.format)
+    if not os.path.isfile(args.file):
+        raise CLIError(f"File not found: {args.file}")
+
+    if file_format == "csv":
+        # Default: kolom CSV yang namanya sama dengan field database; --map untuk sisanya
+        mapping = {header: header for header in read_header(args.file) if header in MANDATORY_FIELDS}
+        for item in args.map:
+            column, _, field = item.partition("=")
+            if field not in MANDATORY_FIELDS:
+                raise CLIError(f"Unknown field in --map {item!r}; fields: {', '.join(MANDATORY_FIELDS)}")
+            mapping[column] = field
+        progress = _progress_printer(args, "bytes")
+        result = import_csv(args.file, mapping, progress=progress, chunk_size=args.chunk_size)
+    elif file_format == "excel":
+        from app.import_feature.ExcelImportEngine import InvalidExcelFormat, import_excel
+
+        progress = _progress_printer(args, "rows")
+        try:
+            result = import_excel(args.file, progress=progress, chunk_size=args.chunk_size)
+        except InvalidExcelFormat as e:
+            raise CLIError(str(e).replace("\n", " "))
+    else:
+        from app.import_feature.JSONImportEngine import import_json_lines
+
+        progress = _progress_printer(args, "bytes")
+        result = import_json_lines(args.file, progress=progress, chunk_size=args.chunk_size)
+    _finish_progress(progress)
+
+    print(f"Imported: {result.imported}, skipped: {result.skipped}", file=sys.stderr)
+    for message in result.errors:
+        print(f"  {message}", file=sys.stderr)
+    if result.skipped > len(result.errors):
+        print(f"  ... and {result.skipped - len(result.errors)} more", file=sys.stderr)
+    return 1 if args.strict and result.skipped else 0
+
+
+# === export / query ===
+def _write_rows(output, file_format, batches, headers, fields):
+    """Tulis batch baris ke file object; return jumlah baris."""
+    from app.export_feature.ExportEngine import format_row
+
+    written = 0
+    if file_format == "csv":
+        writer = csv.writer(output)
+        writer.writerow(headers)
+        for batch in batches:
+            writer.writerows(format_row(row) for row in batch)
+            written += len(batch)
+    else:
+        for batch in batches:
+            for row in batch:
+                output.write(json.dumps(
+                    {field: _to_json_value(value) for field, value in zip(fields, row)}, ensure_ascii=False
+                ))
+                output.write("\n")
+            written += len(batch)
+    return written
+
+
+def _open_output(path):
+    if path == "-":
+        return sys.stdout
+    # utf-8-sig: sama dengan export dari aplikasi, supaya langsung terbaca di Excel
+    return open(path, "w", newline="", encoding="utf-8-sig")
+
+
+def run_export(args):
+    from app.export_feature import ExportEngine
+
+    file_format = "csv" if args.file == "-" and not args.format else _detect_format(args.file, args.format)
+
+    if file_format == "excel":
+        if args.file == "-":
+            raise CLIError("Excel export needs a file path")
+        progress = _progress_printer(args, "rows")
+        result = ExportEngine.export_excel(args.file, progress=progress, batch_size=args.batch_size)
+        _finish_progress(progress)
+        written = result.written
+    elif file_format == "csv" and args.file != "-":
+        progress = _progress_printer(args, "rows")
+        result = ExportEngine.export_csv(args.file, progress=progress, batch_size=args.batch_size)
+        _finish_progress(progress)
+        written = result.written
+    else:
+        written = _write_query(args.file, file_format, ExportEngine.export_statement(), args.batch_size)
+
+    print(f"Exported: {written}", file=sys.stderr)
+    return 0
+
+
+def _write_query(path, file_format, statement, batch_size):
+    from app.export_feature.ExportEngine import EXPORT_COLUMNS, export_headers, iter_row_batches
+
+    fields = [column.key for _, column in EXPORT_COLUMNS]
+    output = _open_output(path)
+    try:
+        return _write_rows(output, file_format, iter_row_batches(batch_size, statement), export_headers(), fields)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def run_query(args):
+    from app.database.FullTextSearch import apply_search
+    from app.database.Models import Application
+    from app.export_feature.ExportEngine import EXPORT_COLUMNS, export_statement
+
+    statement = export_statement()
+    if args.status:
+        statement = statement.where(Application.status == args.status)
+    statement, rank = apply_search(statement, args.search)
+
+    fields = {column.key: column for _, column in EXPORT_COLUMNS}
+    if args.sort:
+        if args.sort not in fields:
+            raise CLIError(f"Unknown --sort field {args.sort!r}; fields: {', '.join(fields)}")
+        column = fields[args.sort]
+        statement = statement.order_by(column.desc() if args.desc else column.asc(), Application.id)
+    elif rank is not None:
+        statement = statement.order_by(rank, Application.id)  # paling relevan dulu
+    else:
+        statement = statement.order_by(Application.created_at.desc(), Application.id)
+
+    if args.limit:
+        statement = statement.limit(args.limit)
+
+    written = _write_query(args.output, args.format, statement, args.batch_size)
+    if not args.quiet:
+        print(f"{written} row(s)", file=sys.stderr)
+    return 0
+
+
+# === stats ===
+def collect_stats(session):
+    from sqlalchemy import func
+
+    from app.database.Models import Application
+    from app.database.StatusAnalytics import days_in_stage
+
+    def grouped(column):
+        rows = session.query(column, func.count()).group_by(column).order_by(func.count().desc(), column)
+        return {key or "": count for key, count in rows}
+
+    since = date.today() - timedelta(days=30)
+    return {
+        "total": session.query(func.count(Application.id)).scalar(),
+        "last_30_days": session.query(func.count(Application.id)).filter(
+            Application.date_applied >= since
+        ).scalar(),
+        "by_status": grouped(Application.status),
+        "by_source": grouped(Application.source),
+        # {status sekarang: [jumlah, rata-rata hari di status itu]}
+        "time_in_stage": {
+            status or "": [count, round(days, 1)] for status, (count, days) in days_in_stage(session).items()
+        },
+    }
+
+
+def run_stats(args):
+    from app.database.Database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        stats = collect_stats(session)
+    finally:
+        session.close()
+
+    if args.json:
+        print(json.dumps(stats, indent=2, ensure_ascii=False))
+        return 0
+
+    print(f"Applications: {stats['total']} ({stats['last_30_days']} in the last 30 days)")
+    for title, key in (("By status", "by_status"), ("By source", "by_source")):
+        print(f"\n{title}:")
+        width = max((len(name) for name in stats[key]), default=0)
+        for name, count in stats[key].items():
+            print(f"  {name or '(empty)':<{width}}  {count:>8}")
+
+    print("\nTime in current stage:")
+    width = max((len(name) for name in stats["time_in_stage"]), default=0)
+    for name, (count, days) in stats["time_in_stage"].items():
+        print(f"  {name or '(empty)':<{width}}  {count:>8}  {days:>8.1f} days avg")
+    return 0
+
+
+# === analytics ===
+def run_analytics(args):
+    from app.database.Database import engine
+    from app.database.StatusAnalytics import REPORT_COLUMNS, load_timeline, report_rows
+
+    with engine.connect() as conn:
+        timeline = load_timeline(conn)
+    rows = report_rows(args.report, timeline, args.group_by)
+    columns = REPORT_COLUMNS[args.report]
+
+    output = _open_output(args.output)
+    try:
+        if args.format == "csv":
+            writer = csv.writer(output)
+            writer.writerow([header for header, _ in columns])
+            writer.writerows([round(v, 2) if isinstance(v, float) else v for v in row] for row in rows)
+        else:
+            for row in rows:
+                output.write(json.dumps(dict(zip((field for _, field in columns), row)), ensure_ascii=False))
+                output.write("\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if not args.quiet:
+        print(f"{len(rows)} row(s) from {timeline.history_count} status changes", file=sys.stderr)
+    return 0
+
+
+# === main ===
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="ApplyMeCLI.py", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress output")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="import applications from CSV, Excel or JSON Lines")
+    import_parser.add_argument("file")
+    import_parser.add_argument("--format", choices=["csv", "excel", "jsonl"], help="default: from the file extension")
+    import_parser.add_argument(
+        "--map", action="append", default=[], metavar="COLUMN=FIELD",
+        help="CSV column for a database field (repeatable); columns named like the field map automatically",
+    )
+    import_parser.add_argument("--chunk-size", type=int, default=2000, help="rows per transaction")
+    import_parser.add_argument("--strict", action="store_true", help="exit code 1 if any row was skipped")
+    import_parser.set_defaults(handler=run_import)
+
+    export_parser = commands.add_parser("export", help="export all applications")
+    export_parser.add_argument("file", help="output file, or - for stdout")
+    export_parser.add_argument("--format", choices=["csv", "excel", "jsonl"], help="default: from the file extension")
+    export_parser.add_argument("--batch-size", type=int, default=1000)
+    export_parser.set_defaults(handler=run_export)
+
+    query_parser = commands.add_parser("query", help="search applications like the dashboard")
+    query_parser.add_argument("--search", default="", help="full-text search (same as the search bar)")
+    query_parser.add_argument("--status", help="only this status")
+    query_parser.add_argument("--sort", help="field to sort by (default: relevance, or newest first)")
+    query_parser.add_argument("--desc", action="store_true", help="sort descending")
+    query_parser.add_argument("--limit", type=int)
+    query_parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    query_parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    query_parser.add_argument("--batch-size", type=int, default=1000)
+    query_parser.set_defaults(handler=run_query)
+
+    stats_parser = commands.add_parser("stats", help="application counts per status and source")
+    stats_parser.add_argument("--json", action="store_true")
+    stats_parser.set_defaults(handler=run_stats)
+
+    analytics_parser = commands.add_parser("analytics", help="conversion funnel and time in stage from status history")
+    analytics_parser.add_argument("--report", choices=["funnel", "stages"], default="funnel")
+    analytics_parser.add_argument("--group-by", choices=["all", "source", "month"], default="source")
+    analytics_parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    analytics_parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    analytics_parser.set_defaults(handler=run_analytics)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # stdout hanya untuk data (export -, query); pesan dari init (migration, dll) ke stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        init_db()
+    try:
+        return args.handler(args)
+    except CLIError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # Output dipotong (mis. `| head`): bukan error
+        sys.stdout = open(os.devnull, "w")
+        return 0
+    except KeyboardInterrupt:
+        print("\ncancelled (rows already committed are kept)", file=sys.stderr)
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
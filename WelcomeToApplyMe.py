@@ -1,16 +1,25 @@
-from PySide6.QtGui import QIcon
+from app.others import StartupTrace  # paling awal: titik nol untuk --trace-startup
 from PySide6.QtWidgets import QApplication
-from app.MainWindow import MainWindow
 from app.database.Database import init_db
 import sys
 
 from app.login_feature.LoginWindow import LoginWindow
+from app.others.Icons import icon
+from app.others.Theme import apply_theme
+
+# MainWindow (dan semua fitur import / export) tidak di-import di sini supaya
+# login window tampil secepat mungkin; import di tempat MainWindow dibuka.
 
 if __name__ == "__main__":
+    StartupTrace.mark("imports")
     init_db()
+    StartupTrace.mark("init_db")
     app = QApplication(sys.argv)
+    apply_theme(app)  # satu stylesheet untuk semua window
     # window = MainWindow()
     window = LoginWindow()
-    window.setWindowIcon(QIcon("assets/others_icon/apply_me_job_tracker_logo.png"))
+    window.setWindowIcon(icon("app_logo"))
+    StartupTrace.mark("LoginWindow created")
+    StartupTrace.report_first_paint(window)
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
@@ -4,16 +4,30 @@ from PySide6.QtWidgets import (
     QToolBar, QLineEdit, QComboBox, QLabel,
     QStackedWidget, QPushButton, QGroupBox, QTextEdit, QMessageBox, QMenu, QToolButton
 )
-from PySide6.QtGui import QAction, QStandardItemModel, QStandardItem, QFont, QIcon
+from PySide6.QtGui import QAction, QFont
 from PySide6.QtCore import Qt, QSize, QTimer
 
 # App imports
 from app.add_feature.AddDialog import ApplicationDialog
+from app.dashboard_feature.ApplicationTableModel import ApplicationTableModel, ID_ROLE
+from app.dashboard_feature.ChangeNotifier import ChangeNotifier
+from app.dashboard_feature.DetailCache import ApplicationDetailCache
+from app.dashboard_feature.SearchController import SearchController, DEBOUNCE_MS
 from app.database.Database import SessionLocal
+from app.database import QueryStats
 from app.database.Models import Application
+from app.database.WriteCommands import delete_application
 from app.import_feature.ImportFormatWindow import ImporterWindow
+from app.others.PageRegistry import PageRegistry
 from app.export_feature.ExporterMenu import DataExporter
+from app.settings_feature.AdvancedSettingWindow import AdvancedSettingWindow
+from app.others.DbWriter import db_writer
+from app.others.Icons import icon
 from datetime import datetime
+from functools import partial
+
+# Jumlah baris di atas & bawah baris aktif yang detailnya diambil lebih dulu
+DETAIL_PREFETCH_RADIUS = 5
 
 
 class MainWindow(QMainWindow):
@@ -26,134 +40,68 @@ class MainWindow(QMainWindow):
         self.setFixedSize(self.width(), self.height())
 
         self.session = SessionLocal()
+        self.detail_cache = ApplicationDetailCache(self.session)
 
         self.initUI()
         self.load_data()
 
     # === Add form ===
     def open_add_form(self):
-        dialog = ApplicationDialog(self.session)
+        dialog = ApplicationDialog(parent=self)
         if dialog.exec_():
-            self.load_data()
+            # Baris baru masuk ke tabel lewat ChangeNotifier, tanpa reload
             QMessageBox.information(self, "Success", "Application added successfully.")
 
     # === Edit form ===
     def open_edit_form(self, selected_app):
-        dialog = ApplicationDialog(self.session, application=selected_app)
-        if dialog.exec_():
-            self.load_data()
+        dialog = ApplicationDialog(application=selected_app, parent=self)
+        dialog.exec_()  # tabel & detail cache di-update lewat ChangeNotifier
 
     # === Load data to table ===
     def load_data(self):
-        apps = self.session.query(Application).order_by(Application.created_at.desc()).all()
-
-        model = QStandardItemModel()
-        model.setHorizontalHeaderLabels([
-            "Company", "Position", "Location", "Date Applied", "Status", "Source"
-        ])
-
-        for app in apps:
-            row = [
-                QStandardItem(app.company_name or ""),
-                QStandardItem(app.position or ""),
-                QStandardItem(app.location or ""),
-                QStandardItem(app.formatted_date),
-                QStandardItem(app.status or ""),
-                QStandardItem(app.source or "")
-            ]
-
-            for item in row:
-                item.setEditable(False)
-            model.appendRow(row)
-
-        self.table.setModel(model)
-
-        # Saat baris di tabel diklik, tampilkan detail
-        self.table.selectionModel().selectionChanged.connect(self.show_application_details)
-
-        self.table.clicked.connect(self.show_application_details)
-
-        self.table.setColumnWidth(0, 100)  # Company
-        self.table.setColumnWidth(1, 100)  # Position
-        self.table.setColumnWidth(2, 120)  # Location
-        self.table.setColumnWidth(3, 80)  # Date Applied
-        self.table.setColumnWidth(4, 90)  # Status
-        self.table.horizontalHeader().setStretchLastSection(True)
-
-        self.search_applications()
+        self.table_model.refresh()
+
+    # === Perubahan data dari ChangeNotifier ===
+    # Write dilakukan oleh thread writer dengan session lain, jadi objek ORM di
+    # self.session (dipakai untuk mengisi form edit) di-expire supaya dibaca ulang.
+    def on_applications_updated(self, app_ids):
+        self.session.expire_all()
+        for app_id in app_ids:
+            self.detail_cache.invalidate(app_id)
+        self.table_model.apply_updated(app_ids)
+
+    def on_applications_deleted(self, app_ids):
+        self.session.expire_all()
+        for app_id in app_ids:
+            self.detail_cache.invalidate(app_id)
+        self.table_model.apply_deleted(app_ids)
+
+    def on_applications_reset(self):
+        self.session.expire_all()
+        self.detail_cache.invalidate()
+        self.load_data()
 
     # === Search method ===
-    def search_applications(self):
+    def search_applications(self, delay=DEBOUNCE_MS):
         if not hasattr(self, "search_bar") or not hasattr(self, "filter_dropdown"):
             return  # Pastikan widget sudah ada
 
         search_text = self.search_bar.text().strip().lower()
         selected_status = self.filter_dropdown.currentText()
 
-        # Query dasar
-        query = self.session.query(Application)
-
-        # Filter berdasarkan status
-        if selected_status != "All":
-            query = query.filter(Application.status == selected_status)
-
-        # Filter berdasarkan teks pencarian
-        if search_text:
-            query = query.filter(
-                (Application.company_name.ilike(f"%{search_text}%")) |
-                (Application.position.ilike(f"%{search_text}%"))
-            )
-
-        apps = query.order_by(Application.created_at.desc()).all()
-
-        # === Bangun ulang tabel ===
-        model = QStandardItemModel()
-        model.setHorizontalHeaderLabels([
-            "Company", "Position", "Location", "Date Applied", "Status", "Source"
-        ])
-
-        for app in apps:
-            row = [
-                QStandardItem(app.company_name or ""),
-                QStandardItem(app.position or ""),
-                QStandardItem(app.location or ""),
-                QStandardItem(str(app.date_applied) if app.date_applied else ""),
-                QStandardItem(app.status or ""),
-                QStandardItem(app.source or "")
-            ]
-            for item in row:
-                item.setEditable(False)
-            model.appendRow(row)
-
-        self.table.setModel(model)
-
-        # Lebar kolom stabil
-        self.table.setColumnWidth(0, 95)  # Company
-        self.table.setColumnWidth(1, 120)  # Position
-        self.table.setColumnWidth(2, 100)  # Location
-        self.table.setColumnWidth(3, 85)  # Date Applied
-        self.table.setColumnWidth(4, 70)  # Status
-        self.table.horizontalHeader().setStretchLastSection(True)
+        # Query jalan di worker thread setelah user berhenti mengetik
+        self.search_controller.request(search_text, selected_status, delay)
 
     # === Detail panel ===
+    @QueryStats.tagged("Select row")
     def show_application_details(self, index):
         """Tampilkan detail lamaran di panel kanan saat user klik di tabel"""
         if not index.isValid():
             return
 
-        # Ambil baris yang diklik
+        # Ambil baris yang diklik → cari berdasarkan primary key (lewat LRU cache)
         row = index.row()
-        company = self.table.model().item(row, 0).text()  # Kolom Company
-        position = self.table.model().item(row, 1).text()  # Kolom Position
-        location = self.table.model().item(row, 2).text() # Kolom Location
-        status = self.table.model().item(row, 4).text() # Kolom Status
-
-        # Cari data lengkap di database
-        app = (
-            self.session.query(Application)
-            .filter_by(company_name=company, position=position, location=location, status=status)
-            .first()
-        )
+        app = self.detail_cache.get(index.data(ID_ROLE))
 
         if not app:
             return
@@ -163,7 +111,7 @@ class MainWindow(QMainWindow):
         self.detail_position.setText(f"Position: {app.position}")
         self.detail_location.setText(f"Location: {app.location}")
         self.detail_status.setText(f"Status: {app.status}")
-        self.detail_notes.setPlainText(app.notes or "")
+        self.detail_notes.setPlainText(self.detail_cache.notes(app.id) or "")
 
         # Simpan path file untuk tombol "Open"
         self.current_resume_path = app.resume_file
@@ -173,6 +121,15 @@ class MainWindow(QMainWindow):
         self.open_resume_button.setEnabled(bool(app.resume_file))
         self.open_cover_button.setEnabled(bool(app.cover_letter_file))
 
+        # Setelah panel ter-paint, ambil detail baris tetangga dalam satu query
+        QTimer.singleShot(0, lambda: self.prefetch_neighbour_details(row))
+
+    @QueryStats.tagged("Select row: prefetch")
+    def prefetch_neighbour_details(self, row):
+        radius = DETAIL_PREFETCH_RADIUS
+        app_ids = [self.table_model.cached_application_id(r) for r in range(row - radius, row + radius + 1)]
+        self.detail_cache.prefetch(app_ids)
+
     # === Right click feature to Edit and Delete
     def open_context_menu(self, position):
         index = self.table.indexAt(position)
@@ -180,15 +137,7 @@ class MainWindow(QMainWindow):
             return
 
         menu = QMenu()
-        menu.setStyleSheet("""
-            QMenu::item {
-                padding-left: 12px;   /* default biasanya 20px, kurangi */
-                padding-right: 10px;
-            }
-            QMenu {
-                margin: 5px;         /* hilangkan margin tambahan */
-            }
-        """)
+        menu.setProperty("variant", "context")
         edit_action = menu.addAction("✏️  Edit")
         delete_action = menu.addAction("🗑️  Delete")
 
@@ -200,15 +149,11 @@ class MainWindow(QMainWindow):
             self.delete_selected_application(index.row())
 
     def get_application_by_row(self, row):
-        """Ambil Application dari database berdasarkan baris yang diklik."""
-        company = self.table.model().item(row, 0).text()
-        position = self.table.model().item(row, 1).text()
-        return (
-            self.session.query(Application)
-            .filter_by(company_name=company, position=position)
-            .first()
-        )
+        """Ambil Application dari database berdasarkan baris yang diklik (primary key)."""
+        app_id = self.table_model.application_id(row)
+        return self.session.get(Application, app_id) if app_id else None
 
+    @QueryStats.tagged("Open edit form")
     def edit_selected_application(self, row):
         """Buka dialog edit untuk data yang dipilih."""
         app = self.get_application_by_row(row)
@@ -216,35 +161,49 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Not Found", "Application not found in database.")
             return
 
-        dialog = ApplicationDialog(self.session, application=app)
+        # updated_at diisi oleh save_application di thread writer
+        dialog = ApplicationDialog(application=app, parent=self)
         if dialog.exec_():
-            app.updated_at = datetime.now() # Jika ada update pada row, maka update UPDATED_AT
-            self.session.commit()
-            self.load_data()
             QMessageBox.information(self, "Updated", "Application updated successfully.")
 
     def delete_selected_application(self, row):
-        """Hapus data dari database."""
-        app = self.get_application_by_row(row)
-        if not app:
+        """Hapus data dari database (lewat thread writer)."""
+        record = self.table_model.row_at(row)
+        if not record:
             QMessageBox.warning(self, "Not Found", "Application not found in database.")
             return
 
+        app_id, company_name = record[0], record[1]
         confirm = QMessageBox.question(
             self,
             "Delete Confirmation",
-            f"Are you sure you want to delete application for '{app.company_name}'?",
+            f"Are you sure you want to delete application for '{company_name}'?",
             QMessageBox.Yes | QMessageBox.No,
         )
         if confirm == QMessageBox.Yes:
-            self.session.delete(app)
-            self.session.commit()
-            self.load_data()
-            QMessageBox.information(self, "Deleted", "Application deleted successfully.")
+            # Baris hilang dari tabel lewat ChangeNotifier setelah commit
+            job = db_writer().submit(partial(delete_application, app_id=app_id))
+            job.succeeded.connect(
+                lambda _: QMessageBox.information(self, "Deleted", "Application deleted successfully.")
+            )
+            job.failed.connect(lambda message: QMessageBox.warning(self, "Delete Failed", message))
 
     # === Switch Page ===
-    def switch_page(self, index):
-        self.pages.setCurrentIndex(index)
+    def switch_page(self, key):
+        self.page_registry.open(key)
+
+    # === Lazy pages (dibuat oleh PageRegistry saat pertama kali dibuka) ===
+    def build_statistics_page(self):
+        from app.statistics_feature.StatisticsPage import StatisticsPage
+        return StatisticsPage(self.session)
+
+    def build_reminders_page(self):
+        from app.reminders_feature.RemindersPage import RemindersPage
+        return RemindersPage(self.session)
+
+    def build_contacts_page(self):
+        from app.contacts_feature.ContactsPage import ContactsPage
+        return ContactsPage(self.session)
 
     # === Init UI ===
     def initUI(self):
@@ -265,23 +224,14 @@ class MainWindow(QMainWindow):
         export_button.setText("Export")
         export_button.setPopupMode(QToolButton.MenuButtonPopup)
         export_button.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
-        export_button.setStyleSheet("padding-left: 15px; qproperty-iconSize: 18px")
+        export_button.setProperty("variant", "toolbar-menu")
 
         # === EXPORT - SUB MENU ===
         export_menu = QMenu(export_button)
         to_csv_action = export_menu.addAction("Export to CSV")
-        to_csv_action.setIcon(QIcon("assets/head_menu/csv-file.png"))
+        to_csv_action.setIcon(icon("csv_file"))
         to_excel_action = export_menu.addAction("Export to Excel")
-        to_excel_action.setIcon(QIcon("assets/head_menu/xlsx-file.png"))
-        export_menu.setStyleSheet("""
-                    QMenu::item {
-                        padding-left: 12px;    /* default biasanya 20px, kurangi */
-                        padding-right: 10px;
-                    }
-                    QMenu {
-                        margin: 8px;           /* hilangkan margin tambahan */
-                    }
-                """)
+        to_excel_action.setIcon(icon("xlsx_file"))
         export_button.setMenu(export_menu)
 
         # === EXPORTER CLASS ===
@@ -294,29 +244,22 @@ class MainWindow(QMainWindow):
         setting_button.setText("Preferences")
         setting_button.setPopupMode(QToolButton.MenuButtonPopup)
         setting_button.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
-        setting_button.setStyleSheet("padding-left: 15px; qproperty-iconSize: 18px")
+        setting_button.setProperty("variant", "toolbar-menu")
 
         setting_menu = QMenu(setting_button)
 
         database_management = setting_menu.addAction("Database Management")
-        database_management.setIcon(QIcon("assets/head_menu/database_management.png"))
+        database_management.setIcon(icon("database_management"))
         data_management = setting_menu.addAction("Data Management")
-        data_management.setIcon(QIcon("assets/head_menu/data_management.png"))
+        data_management.setIcon(icon("data_management"))
         notification_and_reminders = setting_menu.addAction("Notification and Reminders")
-        notification_and_reminders.setIcon(QIcon("assets/head_menu/notification.png"))
+        notification_and_reminders.setIcon(icon("notification"))
         advanced_setting = setting_menu.addAction("Advanced Setting")
-        advanced_setting.setIcon(QIcon("assets/head_menu/advanced-setting.png"))
-        setting_menu.setStyleSheet("""
-                            QMenu::item {
-                                padding-left: 12px;    /* default biasanya 20px, kurangi */
-                                padding-right: 10px;
-                            }
-                            QMenu {
-                                margin: 8px;           /* hilangkan margin tambahan */
-                            }
-                        """)
+        advanced_setting.setIcon(icon("advanced_setting"))
         setting_button.setMenu(setting_menu)
 
+        advanced_setting.triggered.connect(lambda: AdvancedSettingWindow.open_advanced_setting_window(self))
+
 
         # === MASUKKAN KE TOOLBAR ===
         toolbar.addAction(add_action)
@@ -339,12 +282,7 @@ class MainWindow(QMainWindow):
         container_layout.setContentsMargins(0, 0, 0, 0)
         container_layout.setSpacing(0)
 
-        self.side_menu_container.setStyleSheet("""
-            QWidget {
-                background-color: #212121;
-                border-right: 1px solid #FFFFFF;
-            }
-        """)
+        self.side_menu_container.setObjectName("sideMenuContainer")
 
         # === Side Menu ===
         self.side_menu = QWidget()
@@ -353,42 +291,23 @@ class MainWindow(QMainWindow):
         side_layout.setSpacing(0)
         self.side_menu.setFixedWidth(180)
 
-        self.side_menu.setStyleSheet("""
-            QPushButton {
-                text-align: left;
-                padding: 10px 16px;
-                font-size: 13px;
-                color: #dddddd;
-                border: none;
-                background-color: transparent;
-            }
-            QPushButton:hover {
-                background-color: #1f1f1f;
-                color: #ffffff;
-            }
-            QPushButton:checked {
-                background-color: #2563eb;
-                color: white;
-                font-weight: bold;
-                border-right: none; /* Pastikan border tidak muncul di tombol aktif */
-            }
-        """)
+        self.side_menu.setObjectName("sideMenu")
 
         # Tombol menu dengan ikon
         btn_dashboard = QPushButton("  Dashboard")
-        btn_dashboard.setIcon(QIcon("assets/side_menu/home.png"))
+        btn_dashboard.setIcon(icon("home"))
         btn_dashboard.setIconSize(QSize(18, 18))
 
         btn_stats = QPushButton("  Statistics")
-        btn_stats.setIcon(QIcon("assets/side_menu/statistics.png"))
+        btn_stats.setIcon(icon("statistics"))
         btn_stats.setIconSize(QSize(18, 18))
 
         btn_reminders = QPushButton("  Reminders")
-        btn_reminders.setIcon(QIcon("assets/side_menu/reminders.png"))
+        btn_reminders.setIcon(icon("reminders"))
         btn_reminders.setIconSize(QSize(18, 18))
 
         btn_contacts = QPushButton("  Contacts")
-        btn_contacts.setIcon(QIcon("assets/side_menu/contacts.png"))
+        btn_contacts.setIcon(icon("contacts"))
         btn_contacts.setIconSize(QSize(18, 18))
 
         # Tambahkan tombol ke layout
@@ -402,10 +321,10 @@ class MainWindow(QMainWindow):
         container_layout.addWidget(self.side_menu)
 
         # === Hubungkan tombol ke halaman ===
-        btn_dashboard.clicked.connect(lambda: self.pages.setCurrentWidget(self.home_page))
-        btn_stats.clicked.connect(lambda: self.pages.setCurrentWidget(self.stats_page))
-        btn_reminders.clicked.connect(lambda: self.pages.setCurrentWidget(self.reminders_page))
-        btn_contacts.clicked.connect(lambda: self.pages.setCurrentWidget(self.contact_page))
+        btn_dashboard.clicked.connect(lambda: self.switch_page("dashboard"))
+        btn_stats.clicked.connect(lambda: self.switch_page("statistics"))
+        btn_reminders.clicked.connect(lambda: self.switch_page("reminders"))
+        btn_contacts.clicked.connect(lambda: self.switch_page("contacts"))
 
         # === Buat agar tombol aktif (checked) berubah otomatis ===
         def set_active_button(active_button):
@@ -421,7 +340,12 @@ class MainWindow(QMainWindow):
         btn_dashboard.setChecked(True)
 
         # === Pages Container ===
+        # Dashboard dibuat sekarang; halaman lain baru dibuat saat pertama kali dibuka
         self.pages = QStackedWidget()
+        self.page_registry = PageRegistry(self.pages)
+        self.page_registry.register("statistics", self.build_statistics_page)
+        self.page_registry.register("reminders", self.build_reminders_page)
+        self.page_registry.register("contacts", self.build_contacts_page)
 
         # === PAGE 1: Home ===
         self.home_page = QWidget()
@@ -435,17 +359,17 @@ class MainWindow(QMainWindow):
         header_font = QFont("Segoe UI", 16, QFont.Bold)
         header_label.setFont(header_font)
         header_label.setAlignment(Qt.AlignCenter)
-        header_label.setStyleSheet("color: #EDEDED; margin-bottom: 10px;")
+        header_label.setObjectName("dashboardHeader")
 
         # Search & Filter
         # === Search & Filter ===
         self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("Search company or position...")
-        self.search_bar.textChanged.connect(self.search_applications)  # Realtime search
+        self.search_bar.setPlaceholderText("Search company, position, location, source or notes...")
+        self.search_bar.textChanged.connect(lambda: self.search_applications())  # Realtime search (debounced)
 
         self.filter_dropdown = QComboBox()
         self.filter_dropdown.addItems(["All", "Applied", "Interview", "Offer", "Rejected", "Withdrawn"])
-        self.filter_dropdown.currentTextChanged.connect(self.search_applications)
+        self.filter_dropdown.currentTextChanged.connect(lambda: self.search_applications(delay=0))
 
         search_filter_layout = QHBoxLayout()
         search_filter_layout.addWidget(self.search_bar)
@@ -455,6 +379,33 @@ class MainWindow(QMainWindow):
         self.table = QTableView()
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)  # aktifkan klik kanan
         self.table.customContextMenuRequested.connect(self.open_context_menu)
+
+        # Model dibuat sekali; data diambil per halaman dari database
+        self.table_model = ApplicationTableModel(self.session, self)
+        self.table.setModel(self.table_model)
+        self.search_controller = SearchController(self.table_model, self)
+
+        # Add / edit / delete / import → update baris yang berubah saja
+        self.change_notifier = ChangeNotifier(self)
+        self.change_notifier.inserted.connect(self.table_model.apply_inserted)
+        self.change_notifier.updated.connect(self.on_applications_updated)
+        self.change_notifier.deleted.connect(self.on_applications_deleted)
+        self.change_notifier.reset.connect(self.on_applications_reset)
+
+        # Halaman lain (statistik, dll) cukup ditandai; dimuat ulang saat dibuka lagi
+        for signal in (self.change_notifier.inserted, self.change_notifier.updated, self.change_notifier.deleted):
+            signal.connect(lambda _ids: self.page_registry.mark_dirty())
+        self.change_notifier.reset.connect(self.page_registry.mark_dirty)
+
+        # Saat baris di tabel diklik, tampilkan detail
+        # currentChanged sudah mencakup klik mouse dan panah keyboard (clicked tidak perlu,
+        # dulu membuat satu klik menampilkan detail dua kali)
+        self.table.selectionModel().currentChanged.connect(
+            lambda current, previous: self.show_application_details(current)
+        )
+
+        # Sort lewat ORDER BY di model; -1 = urutan default (created_at terbaru)
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.DescendingOrder)
         self.table.setSortingEnabled(True)
 
         # Hapus kolom nomor (row header)
@@ -464,23 +415,16 @@ class MainWindow(QMainWindow):
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.horizontalHeader().setDefaultSectionSize(160)
 
-        # Styling agar lebih menyatu dengan tema gelap
-        self.table.setStyleSheet("""
-            QTableView {
-                background-color: #1e1e1e;
-                color: #ddd;
-                gridline-color: #333;
-                border: none;
-                selection-background-color: #1565c0;
-                selection-color: white;
-            }
-            QHeaderView::section {
-                background-color: #2b2b2b;
-                color: #ddd;
-                padding: 4px;
-                border: none;
-            }
-        """)
+        # Lebar kolom stabil
+        self.table.setColumnWidth(0, 95)  # Company
+        self.table.setColumnWidth(1, 120)  # Position
+        self.table.setColumnWidth(2, 100)  # Location
+        self.table.setColumnWidth(3, 85)  # Date Applied
+        self.table.setColumnWidth(4, 70)  # Status
+        self.table.setColumnWidth(5, 90)  # Source
+
+        # Styling tema gelap: lihat #applicationTable di Theme.py
+        self.table.setObjectName("applicationTable")
 
         # Tambahkan ke layout kiri
         left_layout.addWidget(header_label)
@@ -498,15 +442,7 @@ class MainWindow(QMainWindow):
         # === REAL-TIME CLOCK (di atas panel) ===
         self.running_time_label = QLabel()
         self.running_time_label.setAlignment(Qt.AlignCenter)
-        self.running_time_label.setStyleSheet("""
-            font-size: 13px;
-            color: #e0e0e0;
-            background-color: #212121;
-            padding: 6px 10px;
-            border-bottom: 1px solid #333;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-        """)
+        self.running_time_label.setObjectName("runningTimeLabel")
 
         def update_running_time():
             now = datetime.now()
@@ -520,26 +456,7 @@ class MainWindow(QMainWindow):
 
         # === (Right) APPLICATION DETAILS BOX ===
         right_box = QGroupBox("Application Details")
-        right_box.setStyleSheet("""
-            QGroupBox {
-                background-color: #212121;
-                border: 1px solid #2e2e2e;
-                border-radius: 8px;
-                margin-top: 6px;
-                color: #e0e0e0;
-                font-weight: 600;
-                font-size: 12.5px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 8px;
-                color: #FFFFFF;
-                font-weight: bold;
-                background-color: #212121;
-            }
-        """)
+        right_box.setObjectName("detailsBox")
 
         self.detail_company = QLabel("Company: -")
         self.detail_position = QLabel("Position: -")
@@ -556,22 +473,7 @@ class MainWindow(QMainWindow):
         self.open_cover_button.setEnabled(False)
 
         for btn in [self.open_resume_button, self.open_cover_button]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2a2a2a;
-                    color: #999;
-                    border: 1px solid #444;
-                    border-radius: 4px;
-                    padding: 5px;
-                }
-                QPushButton:enabled {
-                    background-color: #1e88e5;
-                    color: white;
-                }
-                QPushButton:hover:enabled {
-                    background-color: #1565c0;
-                }
-            """)
+            btn.setProperty("variant", "detail")
 
         vbox = QVBoxLayout()
         vbox.addWidget(self.detail_company)
@@ -602,38 +504,8 @@ class MainWindow(QMainWindow):
         home_main_layout.setStretch(0, 2)  # kiri fleksibel
         home_main_layout.setStretch(1, 0)  # kanan tetap
 
-        # === PAGE 2: Statistics ===
-        self.stats_page = QWidget()
-        stats_layout = QVBoxLayout(self.stats_page)
-        stats_label = QLabel("Statistics Page — coming soon...")
-        stats_label.setAlignment(Qt.AlignCenter)
-        stats_label.setStyleSheet("font-size: 14px; color: #555;")
-        stats_layout.addWidget(stats_label)
-
-        # === PAGE 3: Reminders ===
-        self.reminders_page = QWidget()
-        reminders_layout = QVBoxLayout(self.reminders_page)
-        reminders_label = QLabel("Reminders Page — coming soon...")
-        reminders_label.setAlignment(Qt.AlignCenter)
-        reminders_label.setStyleSheet("font-size: 14px; color: #555;")
-        reminders_layout.addWidget(reminders_label)
-
-        # === PAGE 4: Contacts ===
-        self.contact_page = QWidget()
-        contact_layout = QVBoxLayout(self.contact_page)
-
-        contact_label = QLabel("Contact Page — coming soon...")
-        contact_label.setAlignment(Qt.AlignCenter)
-        contact_label.setStyleSheet("font-size: 14px; color: #555;")
-
-        contact_layout.addWidget(contact_label)
-
-
-        # Tambahkan ke stacked widget
-        self.pages.addWidget(self.home_page)
-        self.pages.addWidget(self.stats_page)
-        self.pages.addWidget(self.reminders_page)
-        self.pages.addWidget(self.contact_page)
+        # Tambahkan ke stacked widget (Statistics, Reminders, Contacts → lihat build_*_page)
+        self.page_registry.add("dashboard", self.home_page)
 
         # Gabungkan Side Menu + Pages
         main_layout.addWidget(self.side_menu)
@@ -1,28 +1,29 @@
+from functools import partial
+
 from PySide6.QtWidgets import (
     QDialog, QLineEdit, QTextEdit, QComboBox, QDateEdit,
-    QLabel, QPushButton, QFileDialog, QGridLayout, QHBoxLayout, QVBoxLayout
+    QLabel, QPushButton, QFileDialog, QGridLayout, QHBoxLayout, QVBoxLayout, QMessageBox
 )
 
-from PySide6.QtGui import QIcon
-
 from app.add_feature.SalaryLineEdit import SalaryLineEdit
 from app.others.Util import qdate_to_date
-from app.database.Models import Application
+from app.database.WriteCommands import save_application
+from app.others.DbWriter import db_writer
+from app.others.Icons import icon
 
 class ApplicationDialog(QDialog):
-    def __init__(self, session, application=None, parent=None):
+    def __init__(self, application=None, parent=None):
         super().__init__(parent)
-        self.session = session
         self.application = application
         self.resume_path = None
         self.cover_path = None
 
         if application:
             self.setWindowTitle("Edit Application")
-            self.setWindowIcon(QIcon("assets/others_icon/edit_form.png"))
+            self.setWindowIcon(icon("edit_form"))
         else:
             self.setWindowTitle("Add Application")
-            self.setWindowIcon(QIcon("assets/others_icon/add_new_form.png"))
+            self.setWindowIcon(icon("add_form"))
 
         self.resize(500, 600)
         self.initUI()
@@ -151,10 +152,6 @@ class ApplicationDialog(QDialog):
 
     # === Save Handler ===
     def save_data(self):
-        from PySide6.QtWidgets import QMessageBox
-        from datetime import datetime
-        from app.database.Models import StatusHistory
-
         company = self.company_input.text().strip()
         position = self.position_input.text().strip()
 
@@ -162,88 +159,27 @@ class ApplicationDialog(QDialog):
             QMessageBox.warning(self, "Error", "Company name and position are required.")
             return
 
-        if self.application:
-            # === Edit mode ===
-            app = self.application
-            old_status = app.status  # Simpan status lama sebelum diubah
-        else:
-            # === Add mode ===
-            app = Application()
-
-            # === Generate custom ID (e.g. TO001, TO002) ===
-            prefix = company[:2].upper()
-            last_app = (
-                self.session.query(Application)
-                .filter(Application.id.like(f"{prefix}%"))
-                .order_by(Application.id.desc())
-                .first()
-            )
-
-            if last_app:
-                last_num = int(last_app.id[-3:])
-                new_num = last_num + 1
-            else:
-                new_num = 1
-
-            app.id = f"{prefix}{new_num:03d}"
-            app.created_at = datetime.now()
-            app.updated_at = None
-            self.session.add(app)
-            old_status = None  # Tidak ada status lama karena data baru
-
-        # === Simpan data ke Application ===
-        app.company_name = company
-        app.position = position
-        app.location = self.location_input.text().strip()
-        app.date_applied = qdate_to_date(self.date_input.date().currentDate())
-        app.source = self.source_input.text().strip()
-        new_status = self.status_input.currentText()
-        app.status = new_status
-        app.salary_expectation = self.salary_input.text().strip()
-        app.notes = self.notes_input.toPlainText().strip()
-        app.resume_file = self.resume_path
-        app.cover_letter_file = self.cover_path
-
-        # === Commit dulu untuk pastikan ID tersimpan ===
-        self.session.commit()
-
-        # === Tambahkan ke StatusHistory ===
-        # Jika data baru, tambahkan entri awal
-        if not self.application:
-            self.session.query(StatusHistory).filter(
-                StatusHistory.application_id == app.id
-            ).update({StatusHistory.active_status: "N"})
-
-            # Data baru → selalu catat status awal
-            history = StatusHistory(
-                application_id=app.id,
-                old_status=None,
-                new_status=new_status,
-                updated_at=datetime.now(),
-                active_status="Y"
-            )
-            self.session.add(history)
-
-        else:
-            # Data lama → catat history HANYA jika status berubah
-            if old_status != new_status:
-                # Status berubah → buat history baru
-
-                # Matikan semua history lama
-                self.session.query(StatusHistory).filter(
-                    StatusHistory.application_id == app.id
-                ).update({StatusHistory.active_status: "N"})
-
-                # Tambahkan history baru
-                history = StatusHistory(
-                    application_id=app.id,
-                    old_status=old_status,
-                    new_status=new_status,
-                    updated_at=datetime.now(),
-                    active_status="Y"
-                )
-                self.session.add(history)
-
-        # === Simpan semua ke DB ===
-        self.session.commit()
-        self.accept()
\ No newline at end of file
+        values = {
+            "company_name": company,
+            "position": position,
+            "location": self.location_input.text().strip(),
+            "date_applied": qdate_to_date(self.date_input.date().currentDate()),
+            "source": self.source_input.text().strip(),
+            "status": self.status_input.currentText(),
+            "salary_expectation": self.salary_input.text().strip(),
+            "notes": self.notes_input.toPlainText().strip(),
+            "resume_file": self.resume_path,
+            "cover_letter_file": self.cover_path,
+        }
+        app_id = self.application.id if self.application else None
+
+        # Application + StatusHistory ditulis oleh thread writer dalam satu commit;
+        # dialog ditutup setelah commit selesai (tabel di-update lewat ChangeNotifier)
+        self.save_button.setEnabled(False)
+        job = db_writer().submit(partial(save_application, values=values, app_id=app_id))
+        job.succeeded.connect(lambda _: self.accept())
+        job.failed.connect(self.save_failed)
+
+    def save_failed(self, message):
+        self.save_button.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to save application:\n{message}")
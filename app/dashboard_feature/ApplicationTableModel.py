@@ -0,0 +1,485 @@
+from bisect import bisect_right
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from sqlalchemy import Float, and_, literal_column, or_
+
+from app.database import FullTextSearch, QueryStats
+from app.database.Models import Application, SALARY_VALUE_SQL
+
+# Role untuk mengambil Application.id dari index tabel
+ID_ROLE = Qt.UserRole
+
+# Jumlah baris per query dan jumlah halaman yang boleh disimpan di memori
+PAGE_SIZE = 200
+MAX_CACHED_PAGES = 10
+
+# (Header, kolom database) — urutan sama dengan tabel lama
+COLUMNS = [
+    ("Company", Application.company_name),
+    ("Position", Application.position),
+    ("Location", Application.location),
+    ("Date Applied", Application.date_applied),
+    ("Status", Application.status),
+    ("Source", Application.source),
+    ("Salary", Application.salary_expectation),
+]
+
+# Kolom yang nilai sort-nya berbeda dari teks yang ditampilkan.
+# Salary disimpan sebagai teks berformat ("12,500,000.00") → diurutkan sebagai angka.
+# Date Applied tidak perlu: kolom DATE disimpan ISO (YYYY-MM-DD) dan dikembalikan sebagai date.
+SORT_KEYS = {
+    "Salary": literal_column(SALARY_VALUE_SQL, Float),
+}
+
+# Posisi nilai kolom urutan aktif di dalam row tuple: (id, kolom tabel..., sort_value)
+SORT_VALUE_INDEX = len(COLUMNS) + 1
+
+
+def build_query(session, search_text, status, sort_column=-1, sort_order=Qt.DescendingOrder):
+    """Query baris tabel sesuai filter dan urutan yang aktif.
+
+    Dipisah dari model supaya bisa dipakai juga oleh worker pencarian di thread lain
+    (dengan session milik worker itu sendiri).
+    """
+    query = session.query(
+        Application.id, *[column for _, column in COLUMNS], _sort_expression(sort_column)
+    ).select_from(Application)
+
+    # Filter berdasarkan status
+    if status != "All":
+        query = query.filter(Application.status == status)
+
+    # Filter berdasarkan teks pencarian (FTS5: prefix match + ranking bm25, fallback LIKE)
+    query, rank = FullTextSearch.apply_search(query, search_text)
+
+    return query.order_by(*_order_by(sort_column, sort_order, rank))
+
+
+def is_rank_ordered(search_text, sort_column):
+    """True kalau hasil diurutkan berdasarkan relevansi FTS, bukan kolom tabel."""
+    return (
+        sort_column < 0 and bool(search_text) and FullTextSearch.fts_available
+        and bool(FullTextSearch.to_match_query(search_text))
+    )
+
+
+def _sort_expression(sort_column):
+    if sort_column < 0 or sort_column >= len(COLUMNS):
+        return Application.created_at
+    header, column = COLUMNS[sort_column]
+    return SORT_KEYS.get(header, column)
+
+
+def _is_descending(sort_column, sort_order):
+    # Urutan default (sort_column = -1) selalu terbaru di atas
+    return sort_column < 0 or sort_column >= len(COLUMNS) or sort_order == Qt.DescendingOrder
+
+
+def _order_by(sort_column, sort_order, rank=None):
+    # Default: hasil paling relevan dulu (kalau sedang search), lalu data terbaru di atas
+    expression = _sort_expression(sort_column)
+    if rank is not None and (sort_column < 0 or sort_column >= len(COLUMNS)):
+        return [rank.asc(), expression.desc(), Application.id.desc()]
+
+    if _is_descending(sort_column, sort_order):
+        return [expression.desc(), Application.id.desc()]
+    return [expression.asc(), Application.id.asc()]
+
+
+def keyset_segments(sort_column, sort_order, key, inclusive=False):
+    """Kondisi WHERE untuk baris sesudah `key` (lihat row_key), dalam urutan tampil.
+
+    Dipecah per segmen karena NULL ada di ujung urutan (awal untuk ASC, akhir untuk DESC)
+    dan `kolom IS NULL OR ...` membuat SQLite tidak bisa memakai index; setiap segmen
+    berupa range di index (kolom, id) sehingga halaman berikutnya cukup satu seek.
+    """
+    expression = _sort_expression(sort_column)
+    (has_value, value), app_id = key
+
+    if _is_descending(sort_column, sort_order):
+        after_id = Application.id <= app_id if inclusive else Application.id < app_id
+        if not has_value:
+            return [and_(expression.is_(None), after_id)]
+        return [
+            or_(expression < value, and_(expression == value, after_id)),
+            expression.is_(None),
+        ]
+
+    after_id = Application.id >= app_id if inclusive else Application.id > app_id
+    if not has_value:
+        return [and_(expression.is_(None), after_id), expression.is_not(None)]
+    return [or_(expression > value, and_(expression == value, after_id))]
+
+
+def row_key(row):
+    """Key urutan satu baris: (nilai kolom sort, id). NULL paling kecil, seperti di SQLite."""
+    value = row[SORT_VALUE_INDEX]
+    return ((0, "") if value is None else (1, value)), row[0]
+
+
+class _Page:
+    """Blok baris yang berurutan. `rows` = None kalau sudah dibuang dari memori;
+    `size` dan key pertama/terakhir tetap disimpan supaya posisinya tetap diketahui."""
+
+    __slots__ = ("rows", "size", "first_key", "last_key")
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.size = len(rows)
+        self.first_key = self.last_key = None
+        self.update_keys()
+
+    def update_keys(self):
+        if self.rows:
+            self.first_key = row_key(self.rows[0])
+            self.last_key = row_key(self.rows[-1])
+
+
+class ApplicationTableModel(QAbstractTableModel):
+    """Model tabel lamaran yang membaca data per halaman langsung dari database.
+
+    Baris baru diambil lewat canFetchMore / fetchMore saat user scroll, dan hanya
+    MAX_CACHED_PAGES halaman terakhir yang disimpan. Halaman yang sudah dibuang
+    akan di-query ulang kalau view membutuhkannya lagi.
+
+    Perubahan data dari ChangeNotifier diterapkan langsung ke halaman yang
+    bersangkutan (apply_inserted / apply_updated / apply_deleted), tanpa reset.
+    """
+
+    def __init__(self, session, parent=None):
+        super().__init__(parent)
+        self.session = session
+
+        # Filter & sort aktif
+        self.search_text = ""
+        self.status = "All"
+        self.sort_column = -1
+        self.sort_order = Qt.DescendingOrder
+
+        self._row_count = 0
+        self._has_more = True
+        self._pages = []              # list of _Page, sesuai urutan tabel
+        self._starts = []             # nomor baris pertama tiap halaman (untuk bisect)
+        self._loaded = OrderedDict()  # halaman yang rows-nya ada di memori (urutan LRU)
+
+    # === Filter, sort & refresh ===
+    def set_filter(self, search_text, status):
+        self.search_text = search_text
+        self.status = status
+        self.refresh()
+
+    def sort_state(self):
+        return self.sort_column, self.sort_order
+
+    def apply_first_page(self, search_text, status, sort_state, rows):
+        """Pasang hasil halaman pertama yang sudah di-query di thread lain."""
+        if sort_state != self.sort_state():
+            # Urutan berubah saat query berjalan → hasilnya tidak bisa dipakai
+            self.set_filter(search_text, status)
+            return
+
+        self.beginResetModel()
+        self.search_text = search_text
+        self.status = status
+        self._clear()
+        self._has_more = len(rows) == PAGE_SIZE
+        if rows:
+            self._append_page(rows)
+        self.endResetModel()
+
+    @QueryStats.tagged("Sort table")
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_column = column
+        self.sort_order = order
+        self.refresh()
+
+    @QueryStats.tagged("Reload table")
+    def refresh(self):
+        """Buang semua halaman dan muat ulang halaman pertama."""
+        self.beginResetModel()
+        self._clear()
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def _clear(self):
+        self._row_count = 0
+        self._has_more = True
+        self._pages = []
+        self._starts = []
+        self._loaded.clear()
+
+    # === Query helpers ===
+    def _query(self):
+        return build_query(self.session, self.search_text, self.status, self.sort_column, self.sort_order)
+
+    def _precedes(self, a, b):
+        """True kalau key `a` tampil sebelum key `b` pada urutan aktif."""
+        if _is_descending(self.sort_column, self.sort_order):
+            return a > b
+        return a < b
+
+    def _uses_keyset(self):
+        # Urutan relevansi FTS tidak punya key yang bisa dibandingkan → tetap OFFSET
+        return not is_rank_ordered(self.search_text, self.sort_column)
+
+    def _rows_after(self, key, limit, inclusive=False):
+        """Keyset pagination: maksimal `limit` baris sesudah `key` (atau mulai dari `key`)."""
+        rows = []
+        for condition in keyset_segments(self.sort_column, self.sort_order, key, inclusive):
+            query = self._query().filter(condition).limit(limit - len(rows))
+            rows.extend(tuple(r) for r in query)
+            if len(rows) >= limit:
+                break
+        return rows
+
+    def _reindex(self):
+        self._starts = []
+        total = 0
+        for page in self._pages:
+            self._starts.append(total)
+            total += page.size
+        self._row_count = total
+
+    def _append_page(self, rows):
+        page = _Page(rows)
+        self._pages.append(page)
+        self._starts.append(self._row_count)
+        self._row_count += page.size
+        self._touch(page)
+
+    def _touch(self, page):
+        self._loaded[page] = None
+        self._loaded.move_to_end(page)
+        while len(self._loaded) > MAX_CACHED_PAGES:
+            evicted, _ = self._loaded.popitem(last=False)  # buang halaman yang paling lama tidak dipakai
+            evicted.rows = None
+
+    def _page_rows(self, page_index):
+        page = self._pages[page_index]
+        if page.rows is None:
+            with QueryStats.action("Scroll table"):
+                rows, changed = self._reload_page(page_index)
+            if changed:
+                # Data berubah di luar model ini → muat ulang setelah event sekarang selesai
+                QTimer.singleShot(0, self.refresh)
+            page.rows = rows
+            page.update_keys()
+        self._touch(page)
+        return page.rows
+
+    def _reload_page(self, page_index):
+        """Query ulang halaman yang sudah dibuang; return (rows, True kalau isinya berubah)."""
+        page = self._pages[page_index]
+        if self._uses_keyset():
+            rows = self._rows_after(page.first_key, page.size, inclusive=True)
+            return rows, len(rows) != page.size or (rows and row_key(rows[-1]) != page.last_key)
+
+        start = self._starts[page_index]
+        rows = [tuple(r) for r in self._query().offset(start).limit(page.size)]
+        return rows, len(rows) != page.size
+
+    def row_at(self, row):
+        """Ambil tuple (id, company, position, location, date_applied, status, source, sort_value)."""
+        if row < 0 or row >= self._row_count:
+            return None
+
+        page_index = bisect_right(self._starts, row) - 1
+        rows = self._page_rows(page_index)
+        offset = row - self._starts[page_index]
+        return rows[offset] if offset < len(rows) else None
+
+    def application_id(self, row):
+        record = self.row_at(row)
+        return record[0] if record else None
+
+    def cached_application_id(self, row):
+        """Seperti application_id(), tapi tidak memicu query kalau halamannya tidak ada di memori."""
+        if row < 0 or row >= self._row_count:
+            return None
+        page_index = bisect_right(self._starts, row) - 1
+        rows = self._pages[page_index].rows
+        offset = row - self._starts[page_index]
+        return rows[offset][0] if rows is not None and offset < len(rows) else None
+
+    # === Perubahan data (dari ChangeNotifier) ===
+    @QueryStats.tagged("Apply change")
+    def apply_inserted(self, app_ids):
+        if is_rank_ordered(self.search_text, self.sort_column):
+            self.refresh()  # skor bm25 tidak bisa dibandingkan di Python
+            return
+        for record in self._fetch_records(app_ids).values():
+            self._insert_record(record)
+
+    @QueryStats.tagged("Apply change")
+    def apply_updated(self, app_ids):
+        if is_rank_ordered(self.search_text, self.sort_column):
+            self.refresh()
+            return
+
+        records = self._fetch_records(app_ids)
+        for app_id in app_ids:
+            record = records.get(app_id)
+            location = self._find_loaded(app_id)
+
+            if location is None:
+                if self._has_evicted_pages():
+                    # Mungkin ada di halaman yang tidak di memori → posisi lamanya tidak diketahui
+                    self.refresh()
+                    return
+                if record is not None:
+                    self._insert_record(record)  # sebelumnya tidak lolos filter
+                continue
+
+            page_index, offset = location
+            page = self._pages[page_index]
+            if record is not None and row_key(record) == row_key(page.rows[offset]):
+                # Posisi tidak berubah → cukup gambar ulang baris ini
+                page.rows[offset] = record
+                row = self._starts[page_index] + offset
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMNS) - 1))
+            else:
+                self._remove_at(page_index, offset)
+                if record is not None:
+                    self._insert_record(record)
+
+    def apply_deleted(self, app_ids):
+        for app_id in app_ids:
+            location = self._find_loaded(app_id)
+            if location is not None:
+                self._remove_at(*location)
+            elif self._has_evicted_pages():
+                self.refresh()
+                return
+
+    def _has_evicted_pages(self):
+        return any(page.rows is None for page in self._pages)
+
+    def _fetch_records(self, app_ids):
+        """Baris untuk ID tertentu yang lolos filter aktif (lookup lewat primary key)."""
+        rows = self._query().filter(Application.id.in_(list(app_ids))).all()
+        return {row[0]: tuple(row) for row in rows}
+
+    def _find_loaded(self, app_id):
+        for page_index, page in enumerate(self._pages):
+            if page.rows is None:
+                continue
+            for offset, row in enumerate(page.rows):
+                if row[0] == app_id:
+                    return page_index, offset
+        return None
+
+    def _insert_record(self, record):
+        key = row_key(record)
+
+        if not self._pages:
+            if self._has_more:
+                return  # halaman pertama belum dimuat; baris ini ikut saat fetchMore
+            self.beginInsertRows(QModelIndex(), 0, 0)
+            self._append_page([record])
+            self.endInsertRows()
+            return
+
+        # Halaman terakhir yang baris pertamanya tidak tampil sesudah baris baru
+        page_index = 0
+        for i, page in enumerate(self._pages):
+            if page.first_key is not None and not self._precedes(key, page.first_key):
+                page_index = i
+
+        page = self._pages[page_index]
+        if page_index == len(self._pages) - 1 and self._has_more and self._precedes(page.last_key, key):
+            return  # sesudah baris terakhir yang dimuat; nanti terambil oleh fetchMore
+
+        start = self._starts[page_index]
+        if page.rows is None:
+            # Halaman tidak di memori: urutan persisnya didapat saat halaman di-query ulang
+            row = start
+        else:
+            offset = 0
+            while offset < len(page.rows) and self._precedes(row_key(page.rows[offset]), key):
+                offset += 1
+            row = start + offset
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        if page.rows is not None:
+            page.rows.insert(row - start, record)
+            page.update_keys()
+        else:
+            if self._precedes(key, page.first_key):
+                page.first_key = key
+            if self._precedes(page.last_key, key):
+                page.last_key = key
+        page.size += 1
+        self._reindex()
+        self.endInsertRows()
+
+    def _remove_at(self, page_index, offset):
+        page = self._pages[page_index]
+        row = self._starts[page_index] + offset
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del page.rows[offset]
+        page.size -= 1
+        if page.rows:
+            page.update_keys()
+        else:
+            self._pages.pop(page_index)
+            self._loaded.pop(page, None)
+        self._reindex()
+        self.endRemoveRows()
+
+    # === QAbstractTableModel API ===
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, ID_ROLE):
+            return None
+
+        record = self.row_at(index.row())
+        if record is None:
+            return None
+
+        if role == ID_ROLE:
+            return record[0]
+
+        value = record[index.column() + 1]  # index 0 = id
+        if value is None:
+            return ""
+        if COLUMNS[index.column()][1] is Application.date_applied:
+            return value.strftime("%d-%m-%Y")
+        return value
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    @QueryStats.tagged("Scroll table")
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more:
+            return
+
+        if self._pages and self._uses_keyset():
+            rows = self._rows_after(self._pages[-1].last_key, PAGE_SIZE)
+        else:
+            rows = [tuple(r) for r in self._query().offset(self._row_count).limit(PAGE_SIZE)]
+        if len(rows) < PAGE_SIZE:
+            self._has_more = False
+        if not rows:
+            return
+
+        self.beginInsertRows(QModelIndex(), self._row_count, self._row_count + len(rows) - 1)
+        self._append_page(rows)
+        self.endInsertRows()
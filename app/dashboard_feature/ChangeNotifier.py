@@ -0,0 +1,39 @@
+from PySide6.QtCore import QObject, Qt, Signal
+
+from app.database import ChangeFeed
+
+
+class ChangeNotifier(QObject):
+    """Teruskan ChangeFeed ke UI sebagai signal Qt.
+
+    Perubahan selalu dikirim lewat queued connection, baik dari worker thread
+    (import) maupun dari UI thread: callback ChangeFeed jalan di dalam
+    after_commit, saat session yang commit belum boleh menjalankan query lagi.
+    Handler (model tabel, detail cache) baru jalan di putaran event loop berikutnya.
+    """
+
+    inserted = Signal(object)  # list of Application.id
+    updated = Signal(object)
+    deleted = Signal(object)
+    reset = Signal()
+
+    _changed = Signal(str, object)  # kind, ids — internal, selalu queued
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._changed.connect(self._dispatch, Qt.QueuedConnection)
+        ChangeFeed.subscribe(self._on_change)
+        self.destroyed.connect(lambda: ChangeFeed.unsubscribe(self._on_change))
+
+    def _on_change(self, kind, ids):
+        self._changed.emit(kind, ids)
+
+    def _dispatch(self, kind, ids):
+        if kind == ChangeFeed.INSERTED:
+            self.inserted.emit(ids)
+        elif kind == ChangeFeed.UPDATED:
+            self.updated.emit(ids)
+        elif kind == ChangeFeed.DELETED:
+            self.deleted.emit(ids)
+        elif kind == ChangeFeed.RESET:
+            self.reset.emit()
@@ -0,0 +1,92 @@
+from collections import OrderedDict, namedtuple
+
+from app.database.Models import Application
+
+# Snapshot data untuk panel Application Details (bukan objek ORM, jadi aman disimpan lama).
+# Notes tidak ikut: isinya bisa panjang, jadi disimpan terpisah dengan kapasitas kecil (lihat _notes).
+ApplicationDetail = namedtuple("ApplicationDetail", [
+    "id", "company_name", "position", "location", "status",
+    "resume_file", "cover_letter_file",
+])
+
+_DETAIL_COLUMNS = [getattr(Application, field) for field in ApplicationDetail._fields]
+
+# Notes yang disimpan; cukup untuk baris yang dibuka + jendela prefetch di sekitarnya
+NOTES_CAPACITY = 32
+
+
+class ApplicationDetailCache:
+    """LRU cache detail lamaran, diambil berdasarkan primary key.
+
+    prefetch() mengambil beberapa ID sekaligus dengan satu query IN (...), jadi
+    saat user pindah baris dengan panah atas / bawah detailnya sudah ada di cache.
+    Notes (Text) untuk ID yang sama diambil dengan query IN (...) terpisah ke
+    cache notes yang lebih kecil, jadi notes() juga tidak perlu ke database.
+    """
+
+    def __init__(self, session, capacity=256, notes_capacity=NOTES_CAPACITY):
+        self.session = session
+        self.capacity = capacity
+        self.notes_capacity = notes_capacity
+        self._items = OrderedDict()  # id -> ApplicationDetail
+        self._notes = OrderedDict()  # id -> notes (str / None)
+
+    def get(self, app_id):
+        if app_id is None:
+            return None
+
+        detail = self._items.get(app_id)
+        if detail is not None:
+            self._items.move_to_end(app_id)
+            return detail
+
+        self._load([app_id])
+        return self._items.get(app_id)
+
+    def notes(self, app_id):
+        """Notes satu lamaran; query hanya kalau belum ada dari prefetch()."""
+        if app_id is None:
+            return None
+
+        if app_id in self._notes:
+            self._notes.move_to_end(app_id)
+            return self._notes[app_id]
+
+        self._load_notes([app_id])
+        return self._notes.get(app_id)
+
+    def prefetch(self, app_ids):
+        app_ids = [app_id for app_id in app_ids if app_id is not None]
+        missing = [app_id for app_id in app_ids if app_id not in self._items]
+        if missing:
+            self._load(missing)
+        missing_notes = [app_id for app_id in app_ids if app_id not in self._notes]
+        if missing_notes:
+            self._load_notes(missing_notes)
+
+    def invalidate(self, app_id=None):
+        """Hapus satu ID (setelah edit / delete) atau seluruh cache."""
+        if app_id is None:
+            self._items.clear()
+            self._notes.clear()
+        else:
+            self._items.pop(app_id, None)
+            self._notes.pop(app_id, None)
+
+    def _load(self, app_ids):
+        rows = self.session.query(*_DETAIL_COLUMNS).filter(Application.id.in_(app_ids)).all()
+        for row in rows:
+            self._items[row.id] = ApplicationDetail(*row)
+            self._items.move_to_end(row.id)
+
+        while len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+
+    def _load_notes(self, app_ids):
+        rows = self.session.query(Application.id, Application.notes).filter(Application.id.in_(app_ids)).all()
+        for app_id, notes in rows:
+            self._notes[app_id] = notes
+            self._notes.move_to_end(app_id)
+
+        while len(self._notes) > self.notes_capacity:
+            self._notes.popitem(last=False)
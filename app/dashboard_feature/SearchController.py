@@ -0,0 +1,96 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+from sqlalchemy.exc import OperationalError
+
+from app.dashboard_feature.ApplicationTableModel import PAGE_SIZE, build_query
+from app.database import QueryStats
+from app.database.Database import SessionLocal
+
+# Jeda setelah ketikan terakhir sebelum query dijalankan
+DEBOUNCE_MS = 250
+
+
+class _SearchSignals(QObject):
+    # generation, search_text, status, sort_state, rows
+    finished = Signal(int, str, str, object, object)
+
+
+class _SearchTask(QRunnable):
+    """Jalankan query halaman pertama di thread pool dengan session sendiri."""
+
+    def __init__(self, controller, generation, search_text, status, sort_state):
+        super().__init__()
+        self.controller = controller
+        self.generation = generation
+        self.search_text = search_text
+        self.status = status
+        self.sort_state = sort_state
+
+    def is_stale(self):
+        return self.generation != self.controller.generation
+
+    def run(self):
+        # Sudah ada ketikan baru sebelum task sempat jalan → tidak perlu query
+        if self.is_stale():
+            return
+
+        session = SessionLocal()
+        try:
+            # SQLite memanggil handler ini selama query berjalan; return non-zero = batalkan
+            raw_connection = session.connection().connection.dbapi_connection
+            raw_connection.set_progress_handler(lambda: 1 if self.is_stale() else 0, 1000)
+            try:
+                with QueryStats.action("Search"):
+                    query = build_query(session, self.search_text, self.status, *self.sort_state)
+                    rows = [tuple(r) for r in query.limit(PAGE_SIZE)]
+            finally:
+                raw_connection.set_progress_handler(None, 0)
+        except OperationalError:
+            return  # query dibatalkan karena sudah basi
+        finally:
+            session.close()
+
+        if not self.is_stale():
+            self.controller.signals.finished.emit(
+                self.generation, self.search_text, self.status, self.sort_state, rows
+            )
+
+
+class SearchController(QObject):
+    """Debounce input search bar dan jalankan query di thread lain.
+
+    Setiap request menaikkan `generation`; hasil dari generation lama dibuang
+    (dan query-nya dihentikan lewat progress handler SQLite), jadi hanya hasil
+    terbaru yang dipasang ke model tabel.
+    """
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.generation = 0
+        self._pending = ("", "All")
+
+        self.signals = _SearchSignals(self)
+        self.signals.finished.connect(self._apply_result)
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._start_search)
+
+    def request(self, search_text, status, delay=DEBOUNCE_MS):
+        self._pending = (search_text, status)
+        self.generation += 1  # hasil yang sedang berjalan langsung dianggap basi
+        self.timer.start(delay)
+
+    def _start_search(self):
+        search_text, status = self._pending
+        task = _SearchTask(self, self.generation, search_text, status, self.model.sort_state())
+        self.pool.clear()  # task lama yang belum jalan tidak perlu dijalankan
+        self.pool.start(task)
+
+    def _apply_result(self, generation, search_text, status, sort_state, rows):
+        if generation != self.generation:
+            return  # sudah ada input yang lebih baru
+        self.model.apply_first_page(search_text, status, sort_state, rows)
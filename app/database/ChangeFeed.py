@@ -0,0 +1,87 @@
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.database.Models import Application
+
+# =====================================================================
+# Change feed untuk tabel applications
+# ---------------------------------------------------------------------
+# Setiap commit Session yang menyentuh Application dikirim ke subscriber
+# sebagai (kind, ids). Bulk import lewat Core (tanpa Session) memanggil
+# publish(RESET) sendiri setelah selesai.
+# Modul ini tidak bergantung ke Qt; jembatan ke UI thread ada di
+# app/dashboard_feature/ChangeNotifier.py.
+# =====================================================================
+
+INSERTED = "inserted"
+UPDATED = "updated"
+DELETED = "deleted"
+RESET = "reset"  # banyak baris berubah sekaligus → subscriber sebaiknya muat ulang semuanya
+
+_INFO_KEY = "application_changes"
+
+_subscribers = []
+_lock = threading.Lock()
+
+
+def subscribe(callback):
+    """callback(kind, ids) — bisa dipanggil dari thread mana pun yang melakukan commit."""
+    with _lock:
+        if callback not in _subscribers:
+            _subscribers.append(callback)
+
+
+def unsubscribe(callback):
+    with _lock:
+        if callback in _subscribers:
+            _subscribers.remove(callback)
+
+
+def publish(kind, ids=()):
+    with _lock:
+        callbacks = list(_subscribers)
+    for callback in callbacks:
+        callback(kind, list(ids))
+
+
+# === Session events ===
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session, flush_context):
+    changes = session.info.setdefault(_INFO_KEY, {INSERTED: [], UPDATED: [], DELETED: []})
+
+    for obj in session.new:
+        if isinstance(obj, Application):
+            changes[INSERTED].append(obj.id)
+    for obj in session.dirty:
+        if isinstance(obj, Application) and session.is_modified(obj, include_collections=False):
+            changes[UPDATED].append(obj.id)
+    for obj in session.deleted:
+        if isinstance(obj, Application):
+            changes[DELETED].append(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changes(session):
+    changes = session.info.pop(_INFO_KEY, None)
+    if not changes:
+        return
+
+    inserted = set(changes[INSERTED])
+    deleted = set(changes[DELETED])
+    # Baris yang dibuat lalu diubah di transaksi yang sama cukup dikirim sebagai INSERTED
+    updated = set(changes[UPDATED]) - inserted - deleted
+    inserted -= deleted
+
+    if deleted:
+        publish(DELETED, sorted(deleted))
+    if inserted:
+        publish(INSERTED, sorted(inserted))
+    if updated:
+        publish(UPDATED, sorted(updated))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changes(session, previous_transaction):
+    session.info.pop(_INFO_KEY, None)
@@ -0,0 +1,90 @@
+import sqlite3
+
+from app.others.Settings import get_setting, set_setting
+
+SETTING_KEY = "connection_profile"
+
+# PRAGMA yang dipasang ke setiap koneksi baru dari pool; journal_mode hanya
+# sekali saat startup (lihat apply_journal_mode).
+# "Default" = perilaku bawaan SQLite (rollback journal + fsync penuh tiap commit).
+PROFILES = {
+    "Default": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+        "cache_size": -2000,        # 2 MB
+        "temp_store": "DEFAULT",
+        "mmap_size": 0,
+    },
+    "Performance": {
+        "journal_mode": "WAL",      # reader tidak memblokir writer
+        "synchronous": "NORMAL",    # fsync hanya saat checkpoint WAL, aman dari korupsi
+        "busy_timeout": 5000,       # tunggu lock maksimal 5 detik, bukan langsung error
+        "cache_size": -65536,       # 64 MB page cache
+        "temp_store": "MEMORY",     # tabel sementara (ORDER BY, GROUP BY) di RAM
+        "mmap_size": 268435456,     # 256 MB memory-mapped I/O
+    },
+    "Safe": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+        "cache_size": -16384,
+        "temp_store": "MEMORY",
+        "mmap_size": 0,
+    },
+}
+
+PROFILE_DESCRIPTIONS = {
+    "Default": "SQLite defaults. Every commit waits for a full disk sync.",
+    "Performance": "WAL journal, synchronous=NORMAL, 64 MB cache, in-memory temp tables "
+                   "and memory-mapped I/O. Fastest; the last commits may be lost on power failure.",
+    "Safe": "WAL journal with a full sync on every commit. Concurrent reads, slower writes.",
+}
+
+DEFAULT_PROFILE = "Performance"
+
+# busy_timeout dulu, supaya PRAGMA berikutnya menunggu lock, bukan langsung error
+_PRAGMA_ORDER = ("busy_timeout", "synchronous", "cache_size", "temp_store", "mmap_size")
+
+
+def get_active_profile():
+    name = get_setting(SETTING_KEY, DEFAULT_PROFILE)
+    return name if name in PROFILES else DEFAULT_PROFILE
+
+
+def set_active_profile(name):
+    if name not in PROFILES:
+        raise ValueError(f"Unknown connection profile: {name}")
+    set_setting(SETTING_KEY, name)
+
+
+def apply_profile(dbapi_connection, name=None):
+    """Jalankan PRAGMA per-koneksi dari profile ke satu koneksi sqlite3 (tanpa journal_mode)."""
+    pragmas = PROFILES[name or get_active_profile()]
+
+    cursor = dbapi_connection.cursor()
+    try:
+        for key in _PRAGMA_ORDER:
+            if key in pragmas:
+                cursor.execute(f"PRAGMA {key} = {pragmas[key]}")
+    finally:
+        cursor.close()
+
+
+def apply_journal_mode(dbapi_connection, name=None):
+    """Set journal_mode dari profile; return journal mode yang aktif.
+
+    journal_mode tersimpan di file database dan pindah dari WAL butuh akses
+    eksklusif, jadi hanya dipanggil saat startup sebelum koneksi lain dibuka.
+    Kalau database sedang dipakai (mis. proses lain), mode lama tetap dipakai.
+    """
+    mode = PROFILES[name or get_active_profile()]["journal_mode"]
+
+    cursor = dbapi_connection.cursor()
+    try:
+        try:
+            return cursor.execute(f"PRAGMA journal_mode = {mode}").fetchone()[0].upper()
+        except sqlite3.OperationalError:
+            return cursor.execute("PRAGMA journal_mode").fetchone()[0].upper()
+    finally:
+        cursor.close()
@@ -1,14 +1,53 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
 
+from app.database.ConnectionProfile import PROFILES, apply_journal_mode, apply_profile, get_active_profile
+
 Base = declarative_base()
 
 DB_PATH = os.path.join("data", "apply_me.db")
-engine = create_engine(f"sqlite:///{DB_PATH}", echo=False)
+# check_same_thread=False: koneksi dari pool boleh dipakai oleh worker thread (search, import, dll)
+engine = create_engine(f"sqlite:///{DB_PATH}", echo=False, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(bind=engine)
 
+
+# === PRAGMA profile (lihat ConnectionProfile.py) untuk setiap koneksi baru di pool ===
+@event.listens_for(engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    apply_profile(dbapi_connection)
+
+
+def reload_connection_profile():
+    """Tutup koneksi di pool supaya koneksi berikutnya memakai profile yang baru dipilih.
+
+    journal_mode hanya diganti saat startup (lihat init_db): return True kalau
+    profile baru memakai journal_mode lain, jadi aplikasi perlu di-restart.
+    """
+    engine.dispose()
+    with engine.connect() as conn:
+        current = conn.exec_driver_sql("PRAGMA journal_mode").scalar().upper()
+    return current != PROFILES[get_active_profile()]["journal_mode"]
+
+
 def init_db():
-    # from app import models
+    from app.database import Models  # noqa: F401 — daftarkan semua tabel ke Base.metadata
+
+    # journal_mode butuh akses eksklusif: set sekarang, sebelum koneksi lain dibuka
+    with engine.connect() as conn:
+        apply_journal_mode(conn.connection.dbapi_connection)
+
     # Base.metadata.drop_all(bind=engine) # for reset / delete the database
     Base.metadata.create_all(bind=engine)
+
+    # Update schema database lama (index, FTS, dll) sesuai PRAGMA user_version
+    from app.database.Migrations import run_migrations
+    from app.database.FullTextSearch import load_fts_state
+    run_migrations(engine)
+
+    with engine.connect() as conn:
+        load_fts_state(conn)
+
+    # Statistik query per action (Advanced Setting → Query Diagnostics)
+    from app.database.QueryStats import install_if_enabled
+    install_if_enabled(engine)
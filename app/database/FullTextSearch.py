@@ -0,0 +1,187 @@
+import re
+from contextlib import contextmanager
+
+from sqlalchemy import Float, Integer, or_, text
+
+from app.database.Models import Application
+
+FTS_TABLE = "applications_fts"
+FTS_COLUMNS = ("company_name", "position", "location", "source", "notes")
+
+# Bobot bm25 per kolom (urutan sama dengan FTS_COLUMNS): company & position paling penting
+FTS_WEIGHTS = (10.0, 8.0, 3.0, 2.0, 1.0)
+
+# Diisi oleh load_fts_state(); False kalau SQLite tidak di-build dengan FTS5
+fts_available = False
+
+_columns = ", ".join(FTS_COLUMNS)
+_new_values = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+_old_values = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+# External-content FTS5: index menyimpan token saja, teksnya tetap di tabel applications.
+# Trigger menjaga index tetap sinkron untuk semua jalur tulis (ORM, Core, import).
+# Kunci dokumen = applications.row_key, bukan rowid: PK applications berupa String,
+# jadi rowid-nya implisit dan bisa dinomori ulang oleh VACUUM; index FTS lalu diam-diam
+# menunjuk ke baris yang salah. row_key INTEGER (unique) tidak pernah berubah.
+_FTS_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        {_columns},
+        content='applications', content_rowid='row_key',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    # Saklar untuk import massal: lihat deferred_fts_sync()
+    """
+    CREATE TABLE IF NOT EXISTS fts_sync (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        enabled INTEGER NOT NULL DEFAULT 1
+    )
+    """,
+    "INSERT OR IGNORE INTO fts_sync (id, enabled) VALUES (1, 1)",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON applications
+    WHEN (SELECT enabled FROM fts_sync WHERE id = 1) BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.row_key, {_new_values});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON applications BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns}) VALUES ('delete', old.row_key, {_old_values});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {_columns} ON applications BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns}) VALUES ('delete', old.row_key, {_old_values});
+        INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.row_key, {_new_values});
+    END
+    """,
+]
+
+
+def create_fts(conn):
+    """Buat tabel FTS5 + trigger kalau belum ada, lalu isi index dari data lama.
+
+    Raise OperationalError kalau SQLite tidak di-build dengan FTS5.
+    """
+    create_row_key(conn)
+    exists = _fts_exists(conn)
+
+    for ddl in _FTS_DDL:
+        conn.execute(text(ddl))
+
+    if not exists:
+        conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def create_row_key(conn):
+    """Tambahkan kolom applications.row_key (+ unique index) di database lama dan isi yang masih kosong."""
+    columns = [row[1] for row in conn.execute(text("PRAGMA table_info(applications)"))]
+    if "row_key" not in columns:
+        conn.execute(text("ALTER TABLE applications ADD COLUMN row_key INTEGER"))
+    last = conn.execute(text("SELECT COALESCE(MAX(row_key), 0) FROM applications")).scalar()
+    conn.execute(text("UPDATE applications SET row_key = :last + rowid WHERE row_key IS NULL"), {"last": last})
+    conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ux_applications_row_key ON applications (row_key)"))
+
+
+def rekey_fts(conn):
+    """Bangun ulang index FTS lama yang masih memakai rowid sebagai kunci dokumen."""
+    create_row_key(conn)
+    if not _fts_exists(conn):
+        return
+    definition = conn.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FTS_TABLE}
+    ).scalar()
+    if "content_rowid='row_key'" in definition:
+        return
+    for suffix in ("ai", "ad", "au"):
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}"))
+    conn.execute(text(f"DROP TABLE {FTS_TABLE}"))
+    create_fts(conn)
+
+
+def upgrade_insert_trigger(conn):
+    """Ganti trigger insert lama dengan versi yang bisa dimatikan saat import massal."""
+    if not _fts_exists(conn):
+        return
+    conn.execute(text(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai"))
+    create_fts(conn)
+
+
+@contextmanager
+def deferred_fts_sync(conn):
+    """Index baris baru sekaligus di akhir blok, bukan lewat trigger per baris.
+
+    Harus dipakai di dalam transaksi (engine.begin() atau session.connection()): saklar fts_sync
+    dimatikan dan dinyalakan lagi di transaksi yang sama, jadi writer lain tidak
+    pernah melihatnya mati, dan kalau ada error semuanya ikut di-rollback.
+    Baris yang di-insert mendapat row_key > row_key terbesar sebelum blok.
+    """
+    if not fts_available:
+        yield
+        return
+
+    before = conn.execute(text("SELECT COALESCE(MAX(row_key), 0) FROM applications")).scalar()
+    conn.execute(text("UPDATE fts_sync SET enabled = 0 WHERE id = 1"))
+
+    yield
+
+    conn.execute(
+        text(
+            f"INSERT INTO {FTS_TABLE}(rowid, {_columns}) "
+            f"SELECT row_key, {_columns} FROM applications WHERE row_key > :before"
+        ),
+        {"before": before},
+    )
+    conn.execute(text("UPDATE fts_sync SET enabled = 1 WHERE id = 1"))
+
+
+def load_fts_state(conn):
+    """Cek apakah index FTS tersedia; kalau tidak, search kembali ke LIKE."""
+    global fts_available
+    fts_available = _fts_exists(conn)
+
+
+def _fts_exists(conn):
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).first() is not None
+
+
+def to_match_query(search_text):
+    """Ubah input user jadi query MATCH: setiap kata jadi prefix ("kata"*), semua harus cocok."""
+    tokens = re.findall(r"\w+", search_text, flags=re.UNICODE)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def match_subquery(match_query):
+    """Subquery (rowid = applications.row_key, rank) untuk dokumen yang cocok; rank bm25 (kecil = relevan)."""
+    weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+    return (
+        text(
+            f"SELECT rowid AS rowid, bm25({FTS_TABLE}, {weights}) AS rank "
+            f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match_query"
+        )
+        .bindparams(match_query=match_query)
+        .columns(rowid=Integer, rank=Float)
+        .subquery("fts")
+    )
+
+
+def apply_search(query, search_text):
+    """Filter query / select applications dengan teks pencarian.
+
+    Return (query, rank): rank kolom bm25 untuk ORDER BY, None kalau memakai
+    fallback LIKE (SQLite tanpa FTS5) atau search_text kosong.
+    """
+    match_query = to_match_query(search_text) if search_text else None
+    if match_query and fts_available:
+        fts = match_subquery(match_query)
+        return query.join(fts, fts.c.rowid == Application.row_key), fts.c.rank
+    if search_text:
+        pattern = f"%{search_text}%"
+        query = query.filter(or_(*[getattr(Application, column).ilike(pattern) for column in FTS_COLUMNS]))
+    return query, None
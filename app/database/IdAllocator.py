@@ -0,0 +1,89 @@
+from sqlalchemy import text
+
+# Berapa ID yang dipesan sekaligus saat import massal
+DEFAULT_BLOCK_SIZE = 100
+
+
+def make_prefix(company_name):
+    """Dua huruf pertama nama perusahaan, e.g. 'Tokopedia' → 'TO'."""
+    return (company_name or "").strip()[:2].upper()
+
+
+def format_id(prefix, number):
+    return f"{prefix}{number:03d}"
+
+
+def reserve(executor, prefix, count=1):
+    """Pesan `count` nomor berurutan untuk `prefix`; return nomor terakhir yang dipesan.
+
+    `executor` boleh Session atau Connection. UPSERT mengambil write lock SQLite,
+    jadi SELECT sesudahnya di transaksi yang sama tidak bisa balapan dengan writer
+    lain. Nomor ikut di-rollback kalau transaksi pemanggil gagal.
+    """
+    executor.execute(
+        text(
+            "INSERT INTO id_sequences (prefix, last_value) VALUES (:prefix, :count) "
+            "ON CONFLICT(prefix) DO UPDATE SET last_value = last_value + :count"
+        ),
+        {"prefix": prefix, "count": count},
+    )
+    return executor.execute(
+        text("SELECT last_value FROM id_sequences WHERE prefix = :prefix"),
+        {"prefix": prefix},
+    ).scalar()
+
+
+def allocate_id(executor, company_name):
+    """Satu ID baru untuk satu lamaran (dialog Add, import JSON)."""
+    prefix = make_prefix(company_name)
+    return format_id(prefix, reserve(executor, prefix))
+
+
+class IdBlockAllocator:
+    """Bagi-bagi ID dari blok yang dipesan sekaligus, untuk import massal.
+
+    Satu query per `block_size` ID per prefix. ID yang tidak terpakai di akhir
+    import dibiarkan kosong (ID hanya perlu unik, tidak harus rapat).
+    """
+
+    def __init__(self, block_size=DEFAULT_BLOCK_SIZE):
+        self.block_size = block_size
+        self._blocks = {}  # prefix -> [nomor berikutnya, nomor terakhir di blok]
+
+    def next_id(self, executor, company_name):
+        prefix = make_prefix(company_name)
+        block = self._blocks.get(prefix)
+
+        if block is None or block[0] > block[1]:
+            last = reserve(executor, prefix, self.block_size)
+            block = [last - self.block_size + 1, last]
+            self._blocks[prefix] = block
+
+        number = block[0]
+        block[0] += 1
+        return format_id(prefix, number)
+
+
+def seed_sequences(conn):
+    """Isi id_sequences dari ID yang sudah ada (dipakai oleh migration).
+
+    Prefix bisa 0-2 karakter (nama perusahaan pendek), jadi setiap kemungkinan
+    pemotongan ikut dicatat. Kelebihan nomor hanya membuat celah, tidak bentrok.
+    """
+    last_numbers = {}
+    for (app_id,) in conn.execute(text("SELECT id FROM applications")):
+        app_id = app_id or ""
+        for length in range(0, 3):
+            suffix = app_id[length:]
+            if suffix.isdigit():
+                prefix = app_id[:length]
+                last_numbers[prefix] = max(int(suffix), last_numbers.get(prefix, 0))
+
+    for prefix, number in last_numbers.items():
+        conn.execute(
+            text(
+                "INSERT INTO id_sequences (prefix, last_value) VALUES (:prefix, :number) "
+                "ON CONFLICT(prefix) DO UPDATE SET last_value = MAX(last_value, :number)"
+            ),
+            {"prefix": prefix, "number": number},
+        )
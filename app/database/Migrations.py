@@ -0,0 +1,160 @@
+import sys
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.database.FullTextSearch import create_fts, rekey_fts, upgrade_insert_trigger
+from app.database.IdAllocator import seed_sequences
+from app.database.StatisticsRollup import create_rollups
+from app.database.Models import SALARY_VALUE_SQL
+
+
+# =====================================================================
+# Migration runner
+# ---------------------------------------------------------------------
+# Versi schema disimpan di PRAGMA user_version (header file SQLite), jadi
+# saat startup cukup satu pembacaan untuk tahu apakah ada migration baru.
+# Setiap migration dijalankan sekali, berurutan, lalu versinya dicatat.
+# DDL memakai IF NOT EXISTS supaya aman dijalankan ulang kalau proses
+# sempat berhenti di tengah migration.
+# =====================================================================
+
+def _migration_001_full_text_search(conn):
+    try:
+        create_fts(conn)
+    except OperationalError:
+        pass  # SQLite tanpa FTS5 → search memakai LIKE
+
+
+def _migration_002_performance_indexes(conn):
+    for ddl in [
+        # Filter status + urutan default (status = ? ORDER BY created_at DESC, id DESC).
+        # Kolom pertama = status, jadi index ini juga dipakai untuk filter status saja.
+        "CREATE INDEX IF NOT EXISTS ix_applications_status_created_at "
+        "ON applications (status, created_at, id)",
+        # Urutan default tanpa filter
+        "CREATE INDEX IF NOT EXISTS ix_applications_created_at ON applications (created_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_applications_company_name ON applications (company_name)",
+        # Foreign key (dipakai saat load history / cascade delete)
+        "CREATE INDEX IF NOT EXISTS ix_status_history_application_id ON status_history (application_id)",
+        "CREATE INDEX IF NOT EXISTS ix_contacts_application_id ON contacts (application_id)",
+        "CREATE INDEX IF NOT EXISTS ix_reminders_application_id ON reminders (application_id)",
+        "CREATE INDEX IF NOT EXISTS ix_reminders_remind_at ON reminders (remind_at)",
+    ]:
+        conn.execute(text(ddl))
+    conn.execute(text("ANALYZE"))
+
+
+def _migration_003_id_sequences(conn):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS id_sequences ("
+        "prefix VARCHAR NOT NULL PRIMARY KEY, "
+        "last_value INTEGER NOT NULL DEFAULT 0)"
+    ))
+    seed_sequences(conn)
+
+
+def _migration_004_bulk_insert_fts_switch(conn):
+    upgrade_insert_trigger(conn)
+
+
+def _migration_005_sort_indexes(conn):
+    for ddl in [
+        # (kolom, id) untuk setiap kolom yang bisa di-sort di tabel dashboard
+        "CREATE INDEX IF NOT EXISTS ix_applications_company_name_id ON applications (company_name, id)",
+        "CREATE INDEX IF NOT EXISTS ix_applications_position_id ON applications (position, id)",
+        "CREATE INDEX IF NOT EXISTS ix_applications_location_id ON applications (location, id)",
+        "CREATE INDEX IF NOT EXISTS ix_applications_date_applied_id ON applications (date_applied, id)",
+        "CREATE INDEX IF NOT EXISTS ix_applications_status_id ON applications (status, id)",
+        "CREATE INDEX IF NOT EXISTS ix_applications_source_id ON applications (source, id)",
+        f"CREATE INDEX IF NOT EXISTS ix_applications_salary_value_id ON applications ({SALARY_VALUE_SQL}, id)",
+        # Sudah tercakup oleh ix_applications_company_name_id
+        "DROP INDEX IF EXISTS ix_applications_company_name",
+    ]:
+        conn.execute(text(ddl))
+    conn.execute(text("ANALYZE"))
+
+
+def _migration_006_current_status_index(conn):
+    # Database lama bisa punya beberapa baris aktif per lamaran: sisakan yang terbaru
+    conn.execute(text(
+        "UPDATE status_history SET active_status = 'N' "
+        "WHERE active_status = 'Y' AND id < ("
+        "SELECT MAX(h.id) FROM status_history h "
+        "WHERE h.application_id = status_history.application_id AND h.active_status = 'Y')"
+    ))
+    # History tanpa baris aktif → baris terakhir jadi aktif
+    conn.execute(text(
+        "UPDATE status_history SET active_status = 'Y' "
+        "WHERE id IN (SELECT MAX(id) FROM status_history GROUP BY application_id "
+        "HAVING SUM(active_status = 'Y') = 0)"
+    ))
+    # Lamaran tanpa history (import lama) → satu baris aktif dari status sekarang
+    conn.execute(text(
+        "INSERT INTO status_history (application_id, old_status, new_status, updated_at, active_status) "
+        "SELECT a.id, NULL, a.status, COALESCE(a.updated_at, a.created_at), 'Y' FROM applications a "
+        "WHERE NOT EXISTS (SELECT 1 FROM status_history h WHERE h.application_id = a.id)"
+    ))
+    conn.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_status_history_current "
+        "ON status_history (application_id) WHERE active_status = 'Y'"
+    ))
+    conn.execute(text("ANALYZE"))
+
+
+def _migration_007_statistics_rollups(conn):
+    create_rollups(conn)
+
+
+def _migration_008_status_timeline_index(conn):
+    # Covering index: history per lamaran sudah urut waktu, dibaca tanpa menyentuh tabel (StatusAnalytics)
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_status_history_timeline "
+        "ON status_history (application_id, updated_at, id, new_status, old_status)"
+    ))
+    conn.execute(text("ANALYZE"))
+
+
+def _migration_009_fts_row_key(conn):
+    # Index FTS dikunci ke applications.row_key, bukan rowid implisit yang bisa berubah saat VACUUM
+    rekey_fts(conn)
+
+
+# (versi, deskripsi, fungsi) — tambahkan migration baru di paling bawah, jangan ubah yang lama
+MIGRATIONS = [
+    (1, "Full-text index over applications", _migration_001_full_text_search),
+    (2, "Performance indexes for filter, sort and foreign keys", _migration_002_performance_indexes),
+    (3, "Per-prefix ID sequence table", _migration_003_id_sequences),
+    (4, "Switchable FTS insert trigger for bulk imports", _migration_004_bulk_insert_fts_switch),
+    (5, "Indexes for sorting the dashboard table by column", _migration_005_sort_indexes),
+    (6, "Unique partial index on the current status history row", _migration_006_current_status_index),
+    (7, "Daily per-status and per-source statistics rollups", _migration_007_statistics_rollups),
+    (8, "Covering index for status history timelines", _migration_008_status_timeline_index),
+    (9, "Stable integer key for the full-text index", _migration_009_fts_row_key),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn):
+    return conn.execute(text("PRAGMA user_version")).scalar() or 0
+
+
+def run_migrations(engine):
+    """Jalankan semua migration yang versinya lebih baru dari database."""
+    with engine.connect() as conn:
+        current = get_schema_version(conn)
+    if current >= LATEST_VERSION:
+        return current
+
+    for version, description, migrate in MIGRATIONS:
+        if version <= current:
+            continue
+        with engine.begin() as conn:
+            migrate(conn)
+            conn.execute(text(f"PRAGMA user_version = {int(version)}"))
+        # stderr: stdout milik output data (mis. `ApplyMeCLI.py export -`)
+        print(f"Migration {version:03d} applied: {description}", file=sys.stderr)
+        current = version
+
+    return current
@@ -1,8 +1,12 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, ForeignKey, Text, Index, text
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 from app.database.Database import Base
 
+# Nilai numerik salary_expectation ("12,500,000.00" → 12500000.0) untuk sort.
+# Teks ini harus sama persis dengan yang dipakai query supaya SQLite memakai index-nya.
+SALARY_VALUE_SQL = "CAST(NULLIF(REPLACE(salary_expectation, ',', ''), '') AS REAL)"
+
 class User(Base):
     __tablename__ = "user"
 
@@ -28,25 +32,57 @@ class Application(Base):
     source = Column(String)
     status = Column(String)  # Applied, Interview, Offer, etc.
     salary_expectation = Column(String)
-    notes = Column(Text)
+    notes = deferred(Column(Text))  # baru di-load saat diakses (edit form); list & tabel tidak butuh
     resume_file = Column(String)
     cover_letter_file = Column(String)
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime)
+    # Kunci INTEGER yang stabil untuk index FTS (rowid bisa berubah saat VACUUM, lihat FullTextSearch.py);
+    # nomor berikutnya dihitung di INSERT itu sendiri lewat ux_applications_row_key
+    row_key = Column(Integer, default=text("(SELECT COALESCE(MAX(row_key), 0) + 1 FROM applications)"))
 
     status_history = relationship("StatusHistory", back_populates="application", cascade="all, delete-orphan")
+    # Baris history yang aktif (status sekarang + sejak kapan); lewat ux_status_history_current
+    current_history = relationship(
+        "StatusHistory",
+        primaryjoin="and_(Application.id == foreign(StatusHistory.application_id), "
+                    "StatusHistory.active_status == 'Y')",
+        uselist=False, viewonly=True,
+    )
     contacts = relationship("Contact", back_populates="application", cascade="all, delete-orphan")
     reminders = relationship("Reminder", back_populates="application", cascade="all, delete-orphan")
 
+    # Index juga dibuat untuk database lama lewat Migrations.py (nama harus sama)
+    __table_args__ = (
+        Index("ix_applications_status_created_at", "status", "created_at", "id"),
+        Index("ix_applications_created_at", "created_at", "id"),
+        # Sort per kolom di tabel dashboard (kolom, id) → ORDER BY + keyset tanpa temp B-tree
+        Index("ix_applications_company_name_id", "company_name", "id"),
+        Index("ix_applications_position_id", "position", "id"),
+        Index("ix_applications_location_id", "location", "id"),
+        Index("ix_applications_date_applied_id", "date_applied", "id"),
+        Index("ix_applications_status_id", "status", "id"),
+        Index("ix_applications_source_id", "source", "id"),
+        Index("ix_applications_salary_value_id", text(SALARY_VALUE_SQL), "id"),
+        Index("ux_applications_row_key", "row_key", unique=True),
+    )
+
     @property
     def formatted_date(self):
         return self.date_applied.strftime("%d-%m-%Y") if self.date_applied else ""
 
+class IdSequence(Base):
+    """Nomor terakhir yang sudah dipakai per prefix ID (lihat IdAllocator.py)."""
+    __tablename__ = "id_sequences"
+
+    prefix = Column(String, primary_key=True)
+    last_value = Column(Integer, nullable=False, default=0)
+
 class StatusHistory(Base):
     __tablename__ = "status_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    application_id = Column(String, ForeignKey("applications.id"))
+    application_id = Column(String, ForeignKey("applications.id"), index=True)
     old_status = Column(String)
     new_status = Column(String)
     updated_at = Column(DateTime, default=datetime.now)
@@ -54,11 +90,21 @@ class StatusHistory(Base):
 
     application = relationship("Application", back_populates="status_history")
 
+    # Maksimal satu baris aktif per lamaran; index kecil ini juga jalur cepat ke status sekarang
+    __table_args__ = (
+        Index(
+            "ux_status_history_current", "application_id",
+            unique=True, sqlite_where=text("active_status = 'Y'"),
+        ),
+        # Timeline per lamaran (funnel & waktu per tahap) dibaca dari index saja
+        Index("ix_status_history_timeline", "application_id", "updated_at", "id", "new_status", "old_status"),
+    )
+
 class Contact(Base):
     __tablename__ = "contacts"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    application_id = Column(String, ForeignKey("applications.id"))
+    application_id = Column(String, ForeignKey("applications.id"), index=True)
     name = Column(String)
     role = Column(String)
     email = Column(String)
@@ -71,8 +117,8 @@ class Reminder(Base):
     __tablename__ = "reminders"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    application_id = Column(String, ForeignKey("applications.id"))
-    remind_at = Column(DateTime)
+    application_id = Column(String, ForeignKey("applications.id"), index=True)
+    remind_at = Column(DateTime, index=True)
     message = Column(Text)
     done = Column(Boolean, default=False)
 
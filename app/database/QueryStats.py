@@ -0,0 +1,224 @@
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import event
+
+from app.others.Settings import get_setting, set_setting
+
+# =====================================================================
+# Query diagnostics
+# ---------------------------------------------------------------------
+# Hook before/after_cursor_execute di engine: setiap query dicatat di
+# bawah "action" yang sedang berjalan di thread itu (klik baris, sort,
+# search, write, ...), jadi kelihatan berapa query yang dipicu satu
+# aksi user. Query yang lebih lambat dari SLOW_QUERY_MS disimpan beserta
+# EXPLAIN QUERY PLAN-nya dan ditulis ke LOG_PATH.
+# Aktif lewat Advanced Setting (setting "query_diagnostics"); kalau mati,
+# listener tidak dipasang sama sekali.
+# =====================================================================
+
+SETTING_KEY = "query_diagnostics"
+LOG_PATH = os.path.join("data", "slow_queries.log")
+
+# Query dengan durasi di atas ini (ms) dianggap lambat
+SLOW_QUERY_MS = 50
+
+# Jumlah query lambat yang disimpan di memori
+MAX_SLOW_QUERIES = 100
+
+_lock = threading.Lock()
+_local = threading.local()
+_installed = []  # engine yang sudah dipasangi listener
+
+_actions = OrderedDict()  # label -> ActionStats
+_slow = deque(maxlen=MAX_SLOW_QUERIES)
+
+
+class ActionStats:
+    __slots__ = ("label", "runs", "queries", "total_ms", "max_ms")
+
+    def __init__(self, label):
+        self.label = label
+        self.runs = 0       # berapa kali action ini dijalankan
+        self.queries = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def queries_per_run(self):
+        return self.queries / self.runs if self.runs else float(self.queries)
+
+
+class SlowQuery:
+    __slots__ = ("action", "statement", "parameters", "elapsed_ms", "plan", "at")
+
+    def __init__(self, action, statement, parameters, elapsed_ms, plan):
+        self.action = action
+        self.statement = statement
+        self.parameters = parameters
+        self.elapsed_ms = elapsed_ms
+        self.plan = plan
+        self.at = datetime.now()
+
+
+# === Action tag ===
+def current_action():
+    label = getattr(_local, "action", None)
+    return label or f"({threading.current_thread().name})"
+
+
+@contextmanager
+def action(label):
+    """Tandai query di dalam blok ini sebagai bagian dari `label`.
+
+    Action yang bersarang ikut ke action terluar (query dari fetchMore saat
+    sort tetap dihitung sebagai "Sort"), karena yang ingin dilihat adalah
+    total query per aksi user.
+    """
+    if getattr(_local, "action", None) is not None:
+        yield
+        return
+
+    _local.action = label
+    if _installed:
+        with _lock:
+            _stats_for(label).runs += 1
+    try:
+        yield
+    finally:
+        _local.action = None
+
+
+def tagged(label):
+    """Decorator: jalankan fungsi di dalam action(label)."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with action(label):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _stats_for(label):
+    stats = _actions.get(label)
+    if stats is None:
+        stats = _actions[label] = ActionStats(label)
+    return stats
+
+
+# === Listener ===
+# Waktu mulai disimpan di execution context (satu per statement), bukan di stack
+# per koneksi: after_cursor_execute tidak dipanggil kalau statement gagal, jadi
+# stack akan menyisakan entri basi dan durasi query berikutnya ikut salah.
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_stats_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_stats_start", None)
+    if start is None:
+        return  # listener dipasang di tengah statement
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    label = current_action()
+
+    with _lock:
+        stats = _stats_for(label)
+        stats.queries += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+    if elapsed_ms >= SLOW_QUERY_MS:
+        plan = None if executemany else _explain(conn, statement, parameters)
+        slow = SlowQuery(label, statement, parameters, elapsed_ms, plan)
+        with _lock:
+            _slow.append(slow)
+        _write_log(slow)
+
+
+def _explain(conn, statement, parameters):
+    """EXPLAIN QUERY PLAN lewat koneksi sqlite3 langsung (tidak memicu listener lagi)."""
+    if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return None
+    try:
+        rows = conn.connection.dbapi_connection.execute(
+            "EXPLAIN QUERY PLAN " + statement, parameters or ()
+        ).fetchall()
+    except Exception as e:
+        return f"(EXPLAIN failed: {e})"
+    # (id, parent, notused, detail)
+    return "\n".join(row[-1] for row in rows)
+
+
+def _write_log(slow):
+    try:
+        os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+        with open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(f"[{slow.at:%Y-%m-%d %H:%M:%S}] {slow.elapsed_ms:.1f} ms — {slow.action}\n")
+            f.write(" ".join(slow.statement.split()) + "\n")
+            if slow.parameters:
+                f.write(f"params: {slow.parameters!r}\n"[:500])
+            if slow.plan:
+                f.write("plan:\n  " + slow.plan.replace("\n", "\n  ") + "\n")
+            f.write("\n")
+    except OSError:
+        pass
+
+
+# === On / off ===
+def is_enabled():
+    return bool(get_setting(SETTING_KEY, False))
+
+
+def set_enabled(enabled, engine=None):
+    set_setting(SETTING_KEY, bool(enabled))
+    if engine is not None:
+        install(engine) if enabled else uninstall(engine)
+
+
+def install(engine):
+    if engine in _installed:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    _installed.append(engine)
+
+
+def uninstall(engine):
+    if engine not in _installed:
+        return
+    event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+    event.remove(engine, "after_cursor_execute", _after_cursor_execute)
+    _installed.remove(engine)
+
+
+def install_if_enabled(engine):
+    if is_enabled():
+        install(engine)
+
+
+# === Hasil ===
+def snapshot():
+    """(list ActionStats urut total waktu, list SlowQuery terbaru dulu) — salinan, aman dibaca di UI."""
+    with _lock:
+        actions = [_copy(stats) for stats in _actions.values()]
+        slow = list(reversed(_slow))
+    actions.sort(key=lambda stats: stats.total_ms, reverse=True)
+    return actions, slow
+
+
+def reset():
+    with _lock:
+        _actions.clear()
+        _slow.clear()
+
+
+def _copy(stats):
+    copy = ActionStats(stats.label)
+    copy.runs, copy.queries, copy.total_ms, copy.max_ms = stats.runs, stats.queries, stats.total_ms, stats.max_ms
+    return copy
@@ -0,0 +1,270 @@
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+# =====================================================================
+# Rollup harian untuk halaman Statistics
+# ---------------------------------------------------------------------
+# stats_daily_source: jumlah lamaran per (tanggal apply, source)
+# stats_daily_status: jumlah perpindahan ke status per (tanggal, status),
+#                     plus jumlah & total hari tanggapan pertama
+#                     (perpindahan dari 'Applied') di hari itu
+# Trigger menjaga kedua tabel tetap sinkron untuk semua jalur tulis
+# (ORM, Core, import), jadi statistik cukup membaca beberapa ribu baris
+# rollup, bukan scan applications / status_history. Import massal
+# mematikan trigger insert dan menjumlahkan per chunk (deferred_rollup_sync).
+# Dibaca oleh halaman Statistics (load_summary); ApplyMeCLI.py stats tidak
+# memakainya karena menghitung status sekarang, bukan perpindahan status.
+# Modul ini tidak bergantung ke Qt.
+# =====================================================================
+
+RESPONSE_FROM_STATUS = "Applied"
+
+# Ekspresi hari (TEXT 'YYYY-MM-DD'); NULL jadi '' supaya tetap satu baris per key
+_APP_DAY = "COALESCE({row}.date_applied, date({row}.created_at), '')"
+_APP_SOURCE = "COALESCE({row}.source, '')"
+_HISTORY_DAY = "COALESCE(date({row}.updated_at), '')"
+_HISTORY_STATUS = "COALESCE({row}.new_status, '')"
+# Hari sampai tanggapan pertama; NULL kalau bukan tanggapan atau date_applied kosong
+_RESPONSE_DAYS = "julianday(h.updated_at) - julianday(a.date_applied)"
+
+
+def _source_delta(row, delta):
+    """UPSERT applied += delta untuk baris applications `row` (new / old)."""
+    return f"""
+        INSERT INTO stats_daily_source (day, source, applied)
+        VALUES ({_APP_DAY.format(row=row)}, {_APP_SOURCE.format(row=row)}, {delta})
+        ON CONFLICT (day, source) DO UPDATE SET applied = applied + excluded.applied;
+    """
+
+
+def _history_delta(row, delta):
+    """UPSERT entered / responses / response_days += delta untuk baris status_history `row`."""
+    return f"""
+        INSERT INTO stats_daily_status (day, status, entered, responses, response_days)
+        SELECT {_HISTORY_DAY.format(row=row)}, {_HISTORY_STATUS.format(row=row)}, {delta},
+               {delta} * (r.days IS NOT NULL), {delta} * COALESCE(r.days, 0)
+        FROM (
+            SELECT CASE WHEN {row}.old_status = '{RESPONSE_FROM_STATUS}' THEN (
+                SELECT julianday({row}.updated_at) - julianday(a.date_applied)
+                FROM applications a WHERE a.id = {row}.application_id
+            ) END AS days
+        ) r
+        WHERE true
+        ON CONFLICT (day, status) DO UPDATE SET
+            entered = entered + excluded.entered,
+            responses = responses + excluded.responses,
+            response_days = response_days + excluded.response_days;
+    """
+
+
+def _response_shift(app_date, delta):
+    """Pindahkan kontribusi tanggapan lamaran `old` / `new` (saat date_applied berubah)."""
+    match = (
+        "h.application_id = old.id AND h.old_status = '{status}' "
+        "AND {day} = stats_daily_status.day AND {hstatus} = stats_daily_status.status"
+    ).format(status=RESPONSE_FROM_STATUS, day=_HISTORY_DAY.format(row="h"), hstatus=_HISTORY_STATUS.format(row="h"))
+    return f"""
+        UPDATE stats_daily_status SET
+            responses = responses + {delta} * (SELECT COUNT(*) FROM status_history h WHERE {match}),
+            response_days = response_days + {delta} * (
+                SELECT TOTAL(julianday(h.updated_at) - julianday({app_date})) FROM status_history h WHERE {match}
+            )
+        WHERE {app_date} IS NOT NULL AND (day, status) IN (
+            SELECT {_HISTORY_DAY.format(row="h")}, {_HISTORY_STATUS.format(row="h")} FROM status_history h
+            WHERE h.application_id = old.id AND h.old_status = '{RESPONSE_FROM_STATUS}'
+        );
+    """
+
+
+_ROLLUP_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS stats_daily_source (
+        day TEXT NOT NULL,
+        source TEXT NOT NULL,
+        applied INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, source)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS stats_daily_status (
+        day TEXT NOT NULL,
+        status TEXT NOT NULL,
+        entered INTEGER NOT NULL DEFAULT 0,
+        responses INTEGER NOT NULL DEFAULT 0,
+        response_days REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, status)
+    ) WITHOUT ROWID
+    """,
+    # Saklar untuk import massal: lihat deferred_rollup_sync()
+    """
+    CREATE TABLE IF NOT EXISTS stats_sync (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        enabled INTEGER NOT NULL DEFAULT 1
+    )
+    """,
+    "INSERT OR IGNORE INTO stats_sync (id, enabled) VALUES (1, 1)",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS stats_applications_ai AFTER INSERT ON applications
+    WHEN (SELECT enabled FROM stats_sync WHERE id = 1) BEGIN
+        {_source_delta("new", 1)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS stats_applications_ad AFTER DELETE ON applications BEGIN
+        {_source_delta("old", -1)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS stats_applications_au_source AFTER UPDATE OF date_applied, created_at, source
+    ON applications
+    WHEN {_APP_DAY.format(row="old")} IS NOT {_APP_DAY.format(row="new")}
+      OR {_APP_SOURCE.format(row="old")} IS NOT {_APP_SOURCE.format(row="new")}
+    BEGIN
+        {_source_delta("old", -1)}
+        {_source_delta("new", 1)}
+    END
+    """,
+    # Waktu tanggapan dihitung dari date_applied → ikut digeser kalau tanggal apply diedit
+    f"""
+    CREATE TRIGGER IF NOT EXISTS stats_applications_au_response AFTER UPDATE OF date_applied ON applications
+    WHEN old.date_applied IS NOT new.date_applied
+    BEGIN
+        {_response_shift("old.date_applied", -1)}
+        {_response_shift("new.date_applied", 1)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS stats_status_history_ai AFTER INSERT ON status_history
+    WHEN (SELECT enabled FROM stats_sync WHERE id = 1) BEGIN
+        {_history_delta("new", 1)}
+    END
+    """,
+    # Dipanggil sebelum lamarannya dihapus (ORM menghapus history dulu), jadi date_applied masih ada
+    f"""
+    CREATE TRIGGER IF NOT EXISTS stats_status_history_ad AFTER DELETE ON status_history BEGIN
+        {_history_delta("old", -1)}
+    END
+    """,
+]
+
+
+def create_rollups(conn):
+    """Buat tabel + trigger rollup lalu isi dari data yang sudah ada."""
+    for ddl in _ROLLUP_DDL:
+        conn.execute(text(ddl))
+    rebuild_rollups(conn)
+
+
+def rebuild_rollups(conn):
+    """Hitung ulang rollup dari nol (full scan); dipakai migration / perbaikan manual."""
+    conn.execute(text("DELETE FROM stats_daily_source"))
+    conn.execute(text("DELETE FROM stats_daily_status"))
+    _add_applications(conn, "true")
+    _add_history(conn, "true")
+
+
+def _add_applications(conn, where, params=None):
+    """Tambahkan baris applications `a` yang cocok dengan `where` ke rollup (satu GROUP BY)."""
+    conn.execute(text(f"""
+        INSERT INTO stats_daily_source (day, source, applied)
+        SELECT {_APP_DAY.format(row="a")}, {_APP_SOURCE.format(row="a")}, COUNT(*)
+        FROM applications a WHERE {where} GROUP BY 1, 2
+        ON CONFLICT (day, source) DO UPDATE SET applied = applied + excluded.applied
+    """), params or {})
+
+
+def _add_history(conn, where, params=None):
+    """Tambahkan baris status_history `h` yang cocok dengan `where` ke rollup (satu GROUP BY)."""
+    conn.execute(text(f"""
+        INSERT INTO stats_daily_status (day, status, entered, responses, response_days)
+        SELECT {_HISTORY_DAY.format(row="h")}, {_HISTORY_STATUS.format(row="h")}, COUNT(*),
+               COUNT({_RESPONSE_DAYS}), TOTAL({_RESPONSE_DAYS})
+        FROM status_history h
+        LEFT JOIN applications a ON a.id = h.application_id AND h.old_status = '{RESPONSE_FROM_STATUS}'
+        WHERE {where} GROUP BY 1, 2
+        ON CONFLICT (day, status) DO UPDATE SET
+            entered = entered + excluded.entered,
+            responses = responses + excluded.responses,
+            response_days = response_days + excluded.response_days
+    """), params or {})
+
+
+@contextmanager
+def deferred_rollup_sync(conn):
+    """Jumlahkan baris baru ke rollup sekaligus di akhir blok, bukan lewat trigger per baris.
+
+    Sama seperti FullTextSearch.deferred_fts_sync: harus di dalam transaksi, saklar
+    stats_sync dimatikan dan dinyalakan lagi di transaksi yang sama. Hanya INSERT
+    di dalam blok yang ditunda; baris baru dikenali dari rowid / id > nilai terbesar sebelum blok.
+    """
+    before_app = conn.execute(text("SELECT COALESCE(MAX(rowid), 0) FROM applications")).scalar()
+    before_history = conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM status_history")).scalar()
+    conn.execute(text("UPDATE stats_sync SET enabled = 0 WHERE id = 1"))
+
+    yield
+
+    _add_applications(conn, "a.rowid > :before", {"before": before_app})
+    _add_history(conn, "h.id > :before", {"before": before_history})
+    conn.execute(text("UPDATE stats_sync SET enabled = 1 WHERE id = 1"))
+
+
+# === Query untuk halaman Statistics ===
+StatisticsSummary = namedtuple(
+    "StatisticsSummary", "total_applied entered responses response_days weekly by_source"
+)
+
+
+def week_start(day):
+    return day - timedelta(days=day.weekday())  # Senin
+
+
+def load_summary(conn, weeks=12, today=None):
+    """Semua angka halaman Statistics dari tabel rollup.
+
+    weekly: [(Senin awal minggu, jumlah apply)] untuk `weeks` minggu terakhir, termasuk minggu kosong.
+    """
+    today = today or date.today()
+    first_week = week_start(today) - timedelta(weeks=weeks - 1)
+
+    by_source = {
+        source: applied for source, applied in conn.execute(text(
+            "SELECT source, SUM(applied) FROM stats_daily_source GROUP BY source "
+            "HAVING SUM(applied) > 0 ORDER BY 2 DESC, 1"
+        ))
+    }
+
+    entered = {}
+    responses = 0
+    response_days = 0.0
+    for status, count, status_responses, days in conn.execute(text(
+        "SELECT status, SUM(entered), SUM(responses), TOTAL(response_days) "
+        "FROM stats_daily_status GROUP BY status"
+    )):
+        if count:
+            entered[status] = count
+        responses += status_responses
+        response_days += days
+
+    counts = dict(conn.execute(
+        text(
+            "SELECT date(day, '-6 days', 'weekday 1'), SUM(applied) FROM stats_daily_source "
+            "WHERE day >= :first AND day <= :last GROUP BY 1"
+        ),
+        {"first": first_week.isoformat(), "last": today.isoformat()},
+    ).all())
+    weekly = []
+    for i in range(weeks):
+        start = first_week + timedelta(weeks=i)
+        weekly.append((start, counts.get(start.isoformat(), 0)))
+
+    return StatisticsSummary(
+        total_applied=sum(by_source.values()),
+        entered=entered,
+        responses=responses,
+        response_days=response_days,
+        weekly=weekly,
+        by_source=by_source,
+    )
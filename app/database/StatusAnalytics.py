@@ -0,0 +1,450 @@
+import csv
+import itertools
+import json
+import threading
+from collections import namedtuple
+from datetime import datetime
+
+from sqlalchemy import func
+
+from app.database import ChangeFeed
+from app.database.Models import Application, StatusHistory
+
+# =====================================================================
+# Query analitik status lamaran
+# ---------------------------------------------------------------------
+# Status sekarang = baris StatusHistory dengan active_status 'Y'. Unique
+# partial index ux_status_history_current menjamin maksimal satu baris per
+# lamaran, jadi "status sekarang + sejak kapan" untuk semua lamaran cukup
+# satu join lewat index itu (tanpa scan seluruh history).
+# Funnel, waktu tanggapan dan lama di tiap tahap: seluruh status_history
+# dibaca sekali (urut per lamaran lewat ix_status_history_timeline) ke
+# array NumPy, lalu dihitung dengan operasi vektor (bincount / reduceat)
+# untuk pengelompokan apa pun, bukan loop Python lewat relationship ORM.
+# timeline_cache() menyimpan array itu di memori dan sesudahnya hanya
+# membaca ulang lamaran yang berubah (ChangeFeed).
+# Modul ini tidak bergantung ke Qt (dipakai juga oleh CLI).
+# =====================================================================
+
+# Status yang dikenal, sesuai pilihan di form; status lain (mis. dari import) masuk OTHER_STAGE
+STAGES = ["Applied", "Phone Screen", "Interview", "Offer", "Rejected", "Withdrawn"]
+OTHER_STAGE = "Other"
+# Tahap funnel berurutan; lamaran yang sampai di tahap lebih jauh dihitung lolos tahap sebelumnya
+FUNNEL_STAGES = ["Phone Screen", "Interview", "Offer"]
+# Tanggapan pertama = perpindahan pertama dari status ini
+RESPONSE_FROM_STATUS = "Applied"
+
+# Pengelompokan laporan → label di UI
+GROUPS = {"all": "All applications", "source": "Source", "month": "Month applied"}
+EMPTY_SOURCE = "(empty)"
+NO_DATE = "(no date)"
+
+FunnelRow = namedtuple(
+    "FunnelRow",
+    "group applications phone_screen interview offer rejected withdrawn responses avg_response_days",
+)
+StageTimeRow = namedtuple("StageTimeRow", "group stage completed avg_days current")
+
+# Laporan → judul, dan (header, field) per laporan untuk tabel & export
+REPORTS = {"funnel": "Conversion funnel", "stages": "Time in stage"}
+REPORT_COLUMNS = {
+    "funnel": [
+        ("Group", "group"), ("Applied", "applications"), ("Phone Screen", "phone_screen"),
+        ("Interview", "interview"), ("Offer", "offer"), ("Rejected", "rejected"), ("Withdrawn", "withdrawn"),
+        ("Responses", "responses"), ("Avg response days", "avg_response_days"),
+    ],
+    "stages": [
+        ("Group", "group"), ("Stage", "stage"), ("Completed", "completed"),
+        ("Avg days in stage", "avg_days"), ("Currently in stage", "current"),
+    ],
+}
+
+_STAGE_NAMES = STAGES + [OTHER_STAGE]
+# Kode per baris history: indeks di _STAGE_NAMES, + _FROM_RESPONSE kalau pindah dari RESPONSE_FROM_STATUS
+_FROM_RESPONSE = 16
+_STAGE_CODE = "(CASE h.new_status {} ELSE {} END) + {} * (h.old_status IS '{}')".format(
+    " ".join(f"WHEN '{stage}' THEN {code}" for code, stage in enumerate(STAGES)),
+    len(STAGES), _FROM_RESPONSE, RESPONSE_FROM_STATUS,
+)
+# CROSS JOIN memaksa scan applications lewat index id lalu history per lamaran lewat
+# ix_status_history_timeline: hasilnya sudah urut (lamaran, waktu) tanpa sort
+_TIMELINE_SQL = f"""
+    SELECT a.rowid, julianday(h.updated_at), {_STAGE_CODE}
+    FROM applications a CROSS JOIN status_history h ON h.application_id = a.id
+    ORDER BY a.id, h.updated_at, h.id
+"""
+_APPLICATIONS_SQL = "SELECT rowid, id, source, julianday(date_applied) FROM applications"
+# Versi untuk sebagian lamaran saja (StatusTimeline.with_changes); ? = JSON array id lamaran
+_CHANGED_TIMELINE_SQL = f"""
+    SELECT a.id, julianday(h.updated_at), {_STAGE_CODE}
+    FROM applications a CROSS JOIN status_history h ON h.application_id = a.id
+    WHERE a.id IN (SELECT value FROM json_each(?))
+    ORDER BY a.id, h.updated_at, h.id
+"""
+_CHANGED_APPLICATIONS_SQL = (
+    "SELECT id, source, julianday(date_applied) FROM applications WHERE id IN (SELECT value FROM json_each(?))"
+)
+_COUNTS_SQL = "SELECT (SELECT COUNT(*) FROM applications), (SELECT COUNT(*) FROM status_history)"
+# julianday 1970-01-01 00:00 (untuk konversi ke datetime64)
+_UNIX_EPOCH_JULIANDAY = 2440587.5
+
+
+def current_stage_query(session):
+    """Query (id, company_name, status, since) untuk setiap lamaran yang punya history."""
+    return (
+        session.query(
+            Application.id, Application.company_name, StatusHistory.new_status, StatusHistory.updated_at
+        )
+        .join(StatusHistory, (StatusHistory.application_id == Application.id) & (StatusHistory.active_status == "Y"))
+    )
+
+
+def days_in_stage(session, now=None):
+    """{status: (jumlah lamaran, rata-rata hari di status itu)} untuk status sekarang."""
+    now = now or datetime.now()
+    days = func.julianday(now) - func.julianday(StatusHistory.updated_at)
+    rows = (
+        session.query(StatusHistory.new_status, func.count(), func.avg(days))
+        .filter(StatusHistory.active_status == "Y")
+        .group_by(StatusHistory.new_status)
+    )
+    return {status: (count, average or 0.0) for status, count, average in rows}
+
+
+# === Funnel & waktu per tahap ===
+def _history_array(rows):
+    """[(key, julianday, kode)] → array float (baris, 3) tanpa membuat list per kolom."""
+    import numpy as np
+
+    return np.fromiter(itertools.chain.from_iterable(rows), float, count=len(rows) * 3).reshape(-1, 3)
+
+
+def load_timeline(conn):
+    """Baca applications + status_history sekali; return StatusTimeline.
+
+    Lewat cursor sqlite3 langsung: untuk jutaan baris, Row SQLAlchemy
+    hampir menggandakan waktu fetch. Waktunya hampir seluruhnya pembuatan
+    tuple Python per baris; untuk halaman Statistics pakai timeline_cache(),
+    yang setelah load pertama hanya membaca ulang lamaran yang berubah.
+    """
+    import numpy as np
+
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        applications = cursor.execute(_APPLICATIONS_SQL).fetchall()
+        history = cursor.execute(_TIMELINE_SQL).fetchall()
+    finally:
+        cursor.close()
+
+    rowids = np.fromiter((row[0] for row in applications), np.int64, count=len(applications))
+    history = _history_array(history)
+    history_rowids = history[:, 0].astype(np.int64)
+    # rowid → posisi di array lamaran; -1 = lamaran yang dibuat / dihapus di antara dua query
+    size = max(int(rowids.max()) if len(rowids) else 0, int(history_rowids.max()) if len(history) else 0) + 1
+    position = np.full(size, -1, np.int64)
+    position[rowids] = np.arange(len(rowids))
+    history_app = position[history_rowids]
+    known = history_app >= 0
+    codes = history[known, 2].astype(np.int64)
+
+    return StatusTimeline(
+        ids=[row[1] for row in applications],
+        sources=[row[2] for row in applications],
+        applied_at=np.array([row[3] for row in applications], dtype=float),  # None → nan
+        alive=np.ones(len(applications), bool),
+        history_app=history_app[known],
+        changed_at=history[known, 1],
+        stages=codes % _FROM_RESPONSE,
+        from_response=codes >= _FROM_RESPONSE,
+    )
+
+
+class StatusTimeline:
+    """Seluruh status_history sebagai array NumPy, urut per lamaran lalu waktu.
+
+    Per lamaran: ids, sources, applied_at (julianday, nan kalau kosong),
+    alive (False = sudah diganti / dihapus lewat with_changes).
+    Per baris history: history_app (posisi lamaran), changed_at (julianday),
+    stages (indeks _STAGE_NAMES), from_response. Baris satu lamaran selalu
+    bersebelahan dan urut waktu; urutan antar lamaran tidak penting.
+    Pengelompokan lain cukup dihitung ulang dari array ini, tanpa query lagi.
+    """
+
+    def __init__(self, ids, sources, applied_at, alive, history_app, changed_at, stages, from_response,
+                 positions=None):
+        import numpy as np
+
+        self.ids = ids
+        self.sources = sources
+        self.applied_at = applied_at
+        self.alive = alive
+        self.history_app = history_app
+        self.changed_at = changed_at
+        self.stages = stages
+        self.from_response = from_response
+        self._positions = positions  # {id: posisi}, dibuat saat with_changes pertama
+
+        # Baris yang masih diikuti perpindahan lain di lamaran yang sama
+        self.has_next = np.zeros(len(history_app), bool)
+        self.has_next[:-1] = history_app[1:] == history_app[:-1]
+        # Baris pertama history tiap lamaran (untuk reduceat)
+        self.starts = np.flatnonzero(~np.concatenate(([False], self.has_next))[:-1])
+        self._groups = {}
+
+    @property
+    def application_count(self):
+        return int(self.alive.sum())
+
+    @property
+    def history_count(self):
+        return len(self.history_app)
+
+    def with_changes(self, conn, application_ids):
+        """Timeline baru dengan data terkini untuk lamaran `application_ids` saja.
+
+        Baris lama lamaran itu dibuang (alive False), lalu lamaran + history-nya
+        dibaca ulang dan ditambahkan di belakang; lamaran yang sudah dihapus
+        tidak muncul lagi. Timeline ini sendiri tidak diubah.
+        """
+        import numpy as np
+
+        application_ids = sorted(set(application_ids))
+        positions = dict(self._positions) if self._positions is not None else {
+            app_id: i for i, app_id in enumerate(self.ids) if self.alive[i]
+        }
+        stale = [positions.pop(app_id) for app_id in application_ids if app_id in positions]
+
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            changed = json.dumps(application_ids)
+            applications = cursor.execute(_CHANGED_APPLICATIONS_SQL, (changed,)).fetchall()
+            history = cursor.execute(_CHANGED_TIMELINE_SQL, (changed,)).fetchall()
+        finally:
+            cursor.close()
+
+        first = len(self.ids)
+        for offset, row in enumerate(applications):
+            positions[row[0]] = first + offset
+        alive = np.concatenate((self.alive, np.ones(len(applications), bool)))
+        alive[stale] = False
+
+        # id → posisi; history lamaran yang dibuat di antara dua query dilewati (jumlah baris tidak cocok di get())
+        new_history = _history_array([(positions[row[0]],) + row[1:] for row in history if row[0] in positions])
+        new_app = new_history[:, 0].astype(np.int64)
+        codes = new_history[:, 2].astype(np.int64)
+        kept = ~np.isin(self.history_app, stale)
+
+        return StatusTimeline(
+            ids=self.ids + [row[0] for row in applications],
+            sources=self.sources + [row[1] for row in applications],
+            applied_at=np.concatenate((self.applied_at, np.array([row[2] for row in applications], dtype=float))),
+            alive=alive,
+            history_app=np.concatenate((self.history_app[kept], new_app)),
+            changed_at=np.concatenate((self.changed_at[kept], new_history[:, 1])),
+            stages=np.concatenate((self.stages[kept], codes % _FROM_RESPONSE)),
+            from_response=np.concatenate((self.from_response[kept], codes >= _FROM_RESPONSE)),
+            positions=positions,
+        )
+
+    def groups(self, group_by):
+        """(label kelompok urut, kode kelompok per lamaran); hanya kelompok yang punya lamaran."""
+        import numpy as np
+
+        if group_by not in GROUPS:
+            raise ValueError(f"Unknown group {group_by!r}; choose from {', '.join(GROUPS)}")
+        if group_by not in self._groups:
+            labels, codes = getattr(self, f"_group_by_{group_by}")()
+            # Kelompok yang hanya berisi lamaran lama (alive False) tidak ditampilkan
+            used = np.bincount(codes[self.alive], minlength=len(labels)) > 0
+            if group_by != "all" and not used.all():
+                labels = [label for label, keep in zip(labels, used) if keep]
+                codes = np.where(used[codes], (np.cumsum(used) - 1)[codes], 0)
+            self._groups[group_by] = labels, codes
+        return self._groups[group_by]
+
+    def _group_by_all(self):
+        import numpy as np
+
+        return ["All"], np.zeros(len(self.ids), np.int64)
+
+    def _group_by_source(self):
+        import numpy as np
+
+        index = {}
+        codes = np.fromiter(
+            (index.setdefault(source or EMPTY_SOURCE, len(index)) for source in self.sources),
+            np.int64, count=len(self.sources),
+        )
+        labels = sorted(index)
+        rank = np.zeros(len(labels), np.int64)
+        rank[[index[label] for label in labels]] = np.arange(len(labels))
+        return labels, rank[codes]
+
+    def _group_by_month(self):
+        import numpy as np
+
+        dated = ~np.isnan(self.applied_at)
+        days = np.floor(self.applied_at[dated] - _UNIX_EPOCH_JULIANDAY).astype(np.int64)
+        months, month_codes = np.unique(days.astype("datetime64[D]").astype("datetime64[M]"), return_inverse=True)
+        codes = np.full(len(self.applied_at), len(months), np.int64)
+        codes[dated] = month_codes
+        labels = [str(month) for month in months]
+        if not dated.all():
+            labels.append(NO_DATE)
+        return labels, codes
+
+    def funnel(self, group_by="source"):
+        """Funnel + waktu tanggapan pertama per kelompok; list FunnelRow."""
+        import numpy as np
+
+        labels, app_groups = self.groups(group_by)
+        size = len(labels)
+        applications = np.bincount(app_groups[self.alive], minlength=size)
+        zeros = np.zeros(size)
+        reached = [zeros] * len(FUNNEL_STAGES)
+        rejected = withdrawn = responses = response_days = zeros
+
+        if self.history_count:
+            starts = self.starts
+            start_apps = self.history_app[starts]
+            groups = app_groups[start_apps]
+
+            # Tahap funnel terjauh per lamaran (0 = belum lolos tahap apa pun)
+            funnel_rank = np.zeros(len(_STAGE_NAMES), np.int64)
+            for rank, stage in enumerate(FUNNEL_STAGES, start=1):
+                funnel_rank[_STAGE_NAMES.index(stage)] = rank
+            furthest = np.maximum.reduceat(funnel_rank[self.stages], starts)
+            reached = [
+                np.bincount(groups, weights=furthest >= rank, minlength=size)
+                for rank in range(1, len(FUNNEL_STAGES) + 1)
+            ]
+
+            def ever(stage):
+                hit = np.maximum.reduceat(self.stages == _STAGE_NAMES.index(stage), starts)
+                return np.bincount(groups, weights=hit, minlength=size)
+
+            rejected = ever("Rejected")
+            withdrawn = ever("Withdrawn")
+
+            # Hari dari date_applied sampai perpindahan pertama dari RESPONSE_FROM_STATUS
+            first_response = np.minimum.reduceat(np.where(self.from_response, self.changed_at, np.inf), starts)
+            days = first_response - self.applied_at[start_apps]
+            answered = np.isfinite(days)
+            responses = np.bincount(groups[answered], minlength=size)
+            response_days = np.bincount(groups[answered], weights=days[answered], minlength=size)
+
+        return [
+            FunnelRow(
+                labels[i], int(applications[i]), *(int(counts[i]) for counts in reached),
+                int(rejected[i]), int(withdrawn[i]), int(responses[i]),
+                float(response_days[i] / responses[i]) if responses[i] else None,
+            )
+            for i in range(size)
+        ]
+
+    def time_in_stage(self, group_by="all"):
+        """Rata-rata hari di setiap tahap sebelum pindah ke tahap berikutnya; list StageTimeRow.
+
+        Tahap yang masih aktif (belum pindah) hanya dihitung di kolom current.
+        """
+        import numpy as np
+
+        labels, app_groups = self.groups(group_by)
+        stage_count = len(_STAGE_NAMES)
+        size = len(labels) * stage_count
+        keys = app_groups[self.history_app] * stage_count + self.stages
+        durations = self.changed_at[1:] - self.changed_at[:-1]
+
+        done = self.has_next
+        completed = np.bincount(keys[done], minlength=size)
+        total_days = np.bincount(keys[done], weights=durations[done[:-1]], minlength=size)
+        current = np.bincount(keys[~done], minlength=size)
+
+        rows = []
+        for key in np.flatnonzero(completed + current):
+            group, stage = divmod(int(key), stage_count)
+            rows.append(StageTimeRow(
+                labels[group], _STAGE_NAMES[stage], int(completed[key]),
+                float(total_days[key] / completed[key]) if completed[key] else None, int(current[key]),
+            ))
+        return rows
+
+
+class TimelineCache:
+    """StatusTimeline terakhir, diperbarui lewat ChangeFeed.
+
+    Load pertama membaca semua baris (load_timeline). Setelah itu get() hanya
+    membaca ulang lamaran yang dilaporkan berubah (StatusTimeline.with_changes);
+    RESET (import massal) memicu load penuh lagi. Jumlah baris applications /
+    status_history dicocokkan setiap get(), supaya tulisan yang tidak lewat
+    ChangeFeed (mis. CLI di proses lain) tetap memicu load penuh.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timeline = None
+        self._changed = set()
+        self._reset = False
+        ChangeFeed.subscribe(self._on_change)
+
+    def _on_change(self, kind, ids):
+        with self._lock:
+            if kind == ChangeFeed.RESET:
+                self._reset = True
+            else:
+                self._changed.update(ids)
+
+    def get(self, conn):
+        with self._lock:
+            reset, changed = self._reset, self._changed
+            self._reset, self._changed = False, set()
+
+        try:
+            timeline = self._timeline
+            if timeline is not None and not reset and changed:
+                timeline = timeline.with_changes(conn, changed)
+            if timeline is None or reset or not self._matches(conn, timeline):
+                timeline = load_timeline(conn)
+        except Exception:
+            with self._lock:
+                self._reset = True  # perubahan yang sudah diambil tidak boleh hilang
+            raise
+
+        self._timeline = timeline
+        return timeline
+
+    def _matches(self, conn, timeline):
+        applications, history = conn.connection.dbapi_connection.execute(_COUNTS_SQL).fetchone()
+        return applications == timeline.application_count and history == timeline.history_count
+
+
+_timeline_cache = None
+_cache_lock = threading.Lock()
+
+
+def timeline_cache():
+    """TimelineCache bersama untuk seluruh proses (dibuat saat pertama dipakai)."""
+    global _timeline_cache
+    with _cache_lock:
+        if _timeline_cache is None:
+            _timeline_cache = TimelineCache()
+    return _timeline_cache
+
+
+def report_rows(report, timeline, group_by):
+    """Baris laporan 'funnel' / 'stages' sebagai list of list, urut sesuai REPORT_COLUMNS."""
+    if report not in REPORTS:
+        raise ValueError(f"Unknown report {report!r}; choose from {', '.join(REPORTS)}")
+    rows = timeline.funnel(group_by) if report == "funnel" else timeline.time_in_stage(group_by)
+    fields = [field for _, field in REPORT_COLUMNS[report]]
+    return [[getattr(row, field) for field in fields] for row in rows]
+
+
+def export_report_csv(file_path, report, timeline, group_by):
+    """Tulis laporan ke CSV (hari dibulatkan 2 desimal); return jumlah baris."""
+    rows = report_rows(report, timeline, group_by)
+    with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow([header for header, _ in REPORT_COLUMNS[report]])
+        writer.writerows([round(v, 2) if isinstance(v, float) else v for v in row] for row in rows)
+    return len(rows)
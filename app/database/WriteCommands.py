@@ -0,0 +1,93 @@
+from datetime import datetime
+
+from app.database.IdAllocator import allocate_id
+from app.database.Models import Application, StatusHistory, User
+from app.database.WriteQueue import CommandError
+
+# =====================================================================
+# Command untuk WriteQueue: fungsi (session, ...) yang hanya mengubah
+# data lewat session tersebut. Commit dilakukan oleh WriteQueue, jadi
+# command tidak boleh memanggil session.commit() sendiri.
+# Pakai functools.partial untuk mengisi argumen selain session.
+# =====================================================================
+
+# Field Application yang boleh diisi dari form / import
+APPLICATION_FIELDS = (
+    "company_name", "position", "location", "date_applied", "source",
+    "status", "salary_expectation", "notes", "resume_file", "cover_letter_file",
+)
+
+
+class ApplicationNotFound(CommandError, LookupError):
+    pass
+
+
+def save_application(session, values, app_id=None):
+    """Tambah (app_id None) atau update satu lamaran, dan catat perubahan status.
+
+    Lamaran baru dan perubahan status ditulis ke StatusHistory di transaksi
+    yang sama. Return ID lamaran.
+    """
+    now = datetime.now()
+
+    if app_id is None:
+        app = Application(id=allocate_id(session, values["company_name"]), created_at=now, updated_at=None)
+        session.add(app)
+        old_status = None
+    else:
+        app = session.get(Application, app_id)
+        if app is None:
+            raise ApplicationNotFound(f"Application {app_id} not found in database.")
+        app.updated_at = now
+        old_status = app.status
+
+    for field in APPLICATION_FIELDS:
+        if field in values:
+            setattr(app, field, values[field])
+
+    new_status = app.status
+    if app_id is None or old_status != new_status:
+        if app_id is not None:
+            # Matikan history yang aktif saja (satu baris, lewat ux_status_history_current)
+            session.query(StatusHistory).filter(
+                StatusHistory.application_id == app.id, StatusHistory.active_status == "Y"
+            ).update({StatusHistory.active_status: "N"})
+
+        session.add(StatusHistory(
+            application_id=app.id,
+            old_status=old_status,
+            new_status=new_status,
+            updated_at=now,
+            active_status="Y",
+        ))
+
+    return app.id
+
+
+def delete_application(session, app_id):
+    """Hapus satu lamaran (beserta history, contact & reminder-nya)."""
+    app = session.get(Application, app_id)
+    if app is None:
+        raise ApplicationNotFound(f"Application {app_id} not found in database.")
+    session.delete(app)
+    return app_id
+
+
+class UserExists(CommandError, ValueError):
+    pass
+
+
+def create_user(session, name, user_name, email, password):
+    """Daftarkan user baru; username / email yang sudah dipakai → UserExists."""
+    existing = (
+        session.query(User.id)
+        .filter((User.user_name == user_name) | (User.email == email))
+        .first()
+    )
+    if existing:
+        raise UserExists("Username or Email already exists!")
+
+    user = User(name=name, user_name=user_name, email=email, password=password, created_at=datetime.now())
+    session.add(user)
+    session.flush()
+    return user.id
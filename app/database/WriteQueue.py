@@ -0,0 +1,171 @@
+import atexit
+import queue
+import threading
+import time
+import traceback
+
+from app.database import QueryStats
+from app.database.Database import SessionLocal
+
+# =====================================================================
+# Single writer
+# ---------------------------------------------------------------------
+# Semua write ke database lewat satu thread. Command adalah fungsi
+# command(session) → hasil; beberapa command yang datang berdekatan
+# dijalankan di satu transaksi (group commit), jadi satu fsync dipakai
+# bersama dan UI tidak pernah menunggu lock SQLite.
+# Modul ini tidak bergantung ke Qt (dipakai juga oleh CLI); jembatan ke
+# UI thread ada di app/others/DbWriter.py.
+# =====================================================================
+
+# Maksimal command per transaksi
+MAX_BATCH = 64
+
+# Waktu tunggu command berikutnya sebelum commit (detik)
+GROUP_COMMIT_WINDOW = 0.005
+
+_STOP = object()
+
+
+class CommandError(Exception):
+    """Penolakan yang memang diharapkan dari command (data tidak ada, duplikat, ...).
+
+    Dikembalikan ke pemanggil lewat request.error tanpa traceback; exception lain
+    dianggap bug dan traceback-nya di-print.
+    """
+
+
+class WriteRequest:
+    """Satu command di antrian; `done` di-set setelah commit / gagal."""
+
+    __slots__ = ("command", "callback", "exclusive", "result", "error", "done")
+
+    def __init__(self, command, callback=None, exclusive=False):
+        self.command = command
+        self.callback = callback
+        self.exclusive = exclusive
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+    def finish(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.done.set()
+        if self.callback:
+            try:
+                self.callback(self)
+            except Exception:
+                traceback.print_exc()
+
+
+class WriteQueue:
+    """Antrian write dengan satu thread writer.
+
+    Kalau satu command di dalam batch gagal, transaksi di-rollback lalu setiap
+    command dijalankan ulang di transaksinya sendiri, supaya command lain tetap
+    tersimpan. Karena itu command harus aman dijalankan ulang setelah rollback
+    (semua perubahannya lewat session yang diberikan).
+    Command `exclusive` (chunk import) selalu punya transaksi sendiri.
+    """
+
+    def __init__(self, session_factory=SessionLocal, max_batch=MAX_BATCH, window=GROUP_COMMIT_WINDOW):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.window = window
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, command, callback=None, exclusive=False):
+        """Masukkan command ke antrian; callback(request) dipanggil di thread writer."""
+        request = WriteRequest(command, callback, exclusive)
+        self._queue.put(request)
+        return request
+
+    def call(self, command, exclusive=False):
+        """Jalankan command dan tunggu hasilnya (untuk worker thread / CLI, bukan UI thread)."""
+        request = self.submit(command, exclusive=exclusive)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def stop(self):
+        """Selesaikan semua command yang sudah masuk, lalu hentikan thread writer."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    # === Thread writer ===
+    def _run(self):
+        held = None
+        while True:
+            request = held if held is not None else self._queue.get()
+            held = None
+            if request is _STOP:
+                return
+
+            batch = [request]
+            if not request.exclusive:
+                deadline = time.monotonic() + self.window
+                while len(batch) < self.max_batch:
+                    try:
+                        following = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if following is _STOP or following.exclusive:
+                        held = following  # diproses sesudah batch ini
+                        break
+                    batch.append(following)
+
+            self._execute(batch)
+
+    def _execute(self, batch):
+        error = None
+        session = self.session_factory()
+        try:
+            with QueryStats.action(_batch_label(batch)):
+                results = [request.command(session) for request in batch]
+                session.commit()
+        except Exception as e:
+            session.rollback()
+            error = e
+            if len(batch) == 1 and not isinstance(e, CommandError):
+                traceback.print_exc()
+        finally:
+            session.close()
+
+        if error is None:
+            for request, result in zip(batch, results):
+                request.finish(result=result)
+        elif len(batch) == 1:
+            batch[0].finish(error=error)
+        else:
+            # Cari command yang gagal: jalankan ulang satu per satu
+            for request in batch:
+                self._execute([request])
+
+
+def _batch_label(batch):
+    names = sorted({_command_name(request.command) for request in batch})
+    return "Write: " + ", ".join(names)
+
+
+def _command_name(command):
+    command = getattr(command, "func", command)  # functools.partial
+    return getattr(command, "__name__", type(command).__name__).lstrip("_")
+
+
+_write_queue = None
+_lock = threading.Lock()
+
+
+def write_queue():
+    """WriteQueue bersama untuk seluruh proses (dibuat saat write pertama)."""
+    global _write_queue
+    with _lock:
+        if _write_queue is None:
+            _write_queue = WriteQueue()
+            atexit.register(_write_queue.stop)  # write yang masih di antrian tetap ditulis
+    return _write_queue
@@ -0,0 +1,146 @@
+import csv
+import os
+import time
+
+from sqlalchemy import func, select
+
+from app.database.Database import engine
+from app.database.Models import Application
+
+# (Header, kolom) — sama dengan format export sebelumnya
+EXPORT_COLUMNS = [
+    ("ID", Application.id),
+    ("Company", Application.company_name),
+    ("Position", Application.position),
+    ("Location", Application.location),
+    ("Date Applied", Application.date_applied),
+    ("Source", Application.source),
+    ("Status", Application.status),
+    ("Salary", Application.salary_expectation),
+    ("Notes", Application.notes),
+]
+
+# Jumlah baris yang diambil dari cursor per batch
+BATCH_SIZE = 1000
+
+PROGRESS_INTERVAL = 0.1
+
+
+class ExportResult:
+    def __init__(self):
+        self.written = 0
+        self.cancelled = False
+
+
+def export_headers():
+    return [header for header, _ in EXPORT_COLUMNS]
+
+
+def format_row(row):
+    """Tuple hasil query → list nilai siap tulis (tanggal dd-mm-yyyy, None → "")."""
+    values = []
+    for (header, column), value in zip(EXPORT_COLUMNS, row):
+        if value is None:
+            values.append("")
+        elif column is Application.date_applied:
+            values.append(value.strftime("%d-%m-%Y"))
+        else:
+            values.append(value)
+    return values
+
+
+def count_rows():
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(Application)).scalar()
+
+
+def export_statement():
+    return select(*[column for _, column in EXPORT_COLUMNS])
+
+
+def iter_row_batches(batch_size=BATCH_SIZE, statement=None):
+    """Stream tuple kolom (bukan objek ORM) per batch lewat yield_per / stream_results.
+
+    statement: select kolom EXPORT_COLUMNS (boleh difilter); default semua lamaran
+    """
+    if statement is None:
+        statement = export_statement()
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(statement)
+        for batch in result.partitions():
+            yield batch
+
+
+def export_csv(file_path, progress=None, is_cancelled=None, batch_size=BATCH_SIZE):
+    """Tulis semua lamaran ke CSV per batch; return ExportResult.
+
+    Memori hanya sebesar satu batch, dan file di-flush setiap batch sehingga
+    data langsung masuk ke disk sejak batch pertama. Kalau dibatalkan, file
+    setengah jadi dihapus.
+    """
+    total = count_rows()
+    result = ExportResult()
+    last_report = 0.0
+
+    with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(export_headers())
+        f.flush()
+
+        for batch in iter_row_batches(batch_size):
+            if is_cancelled and is_cancelled():
+                result.cancelled = True
+                break
+
+            writer.writerows(format_row(row) for row in batch)
+            f.flush()
+            result.written += len(batch)
+
+            now = time.monotonic()
+            if progress and now - last_report >= PROGRESS_INTERVAL:
+                progress(result.written, total)
+                last_report = now
+
+    if result.cancelled:
+        os.remove(file_path)
+    elif progress:
+        progress(total, total)
+    return result
+
+
+def export_excel(file_path, progress=None, is_cancelled=None, batch_size=BATCH_SIZE):
+    """Tulis semua lamaran ke .xlsx dengan workbook write-only (memori konstan).
+
+    openpyxl menulis setiap baris ke file sementara, bukan menyimpannya di
+    memori. Kalau dibatalkan, file tidak disimpan sama sekali.
+    """
+    from openpyxl import Workbook  # import berat (~250 ms), hanya saat export Excel dijalankan
+
+    total = count_rows()
+    result = ExportResult()
+    last_report = 0.0
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Applications")
+    sheet.append(export_headers())
+
+    for batch in iter_row_batches(batch_size):
+        if is_cancelled and is_cancelled():
+            result.cancelled = True
+            break
+
+        for row in batch:
+            sheet.append(format_row(row))
+        result.written += len(batch)
+
+        now = time.monotonic()
+        if progress and now - last_report >= PROGRESS_INTERVAL:
+            progress(result.written, total)
+            last_report = now
+
+    if result.cancelled:
+        return result
+    workbook.save(file_path)
+    if progress:
+        progress(total, total)
+    return result
@@ -1,66 +1,66 @@
-import pandas as pd
-from PySide6.QtWidgets import QFileDialog, QMessageBox
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog
 
 from app.database.Models import Application
+from app.export_feature.ExportEngine import export_csv, export_excel
+from app.others.TaskWorker import TaskWorker, attach_progress_dialog
 
 
 class DataExporter:
     def __init__(self, session, model):
         self.session = session
         self.model = Application
+        self.worker = None
 
     def export_to_csv(self, parent=None):
-        try:
-            file_path, _ = QFileDialog.getSaveFileName(
-                parent,
-                "Save as CSV",
-                "",
-                "CSV Files (*.csv)"
-            )
-            if not file_path:
-                return
+        file_path, _ = QFileDialog.getSaveFileName(
+            parent,
+            "Save as CSV",
+            "",
+            "CSV Files (*.csv)"
+        )
+        if not file_path:
+            return
 
-            data = self._get_data()
-            df = pd.DataFrame(data)
-            df.to_csv(file_path, index=False, encoding='utf-8-sig')
-
-            QMessageBox.information(parent, "Success", f"Data successfully exported to:\n{file_path}")
-        except Exception as e:
-            QMessageBox.critical(parent, "Error", f"Failed to export CSV:\n{e}")
+        self._run_export(parent, "CSV", export_csv, file_path)
 
     def export_to_excel(self, parent=None):
-        try:
-            file_path, _ = QFileDialog.getSaveFileName(
-                parent,
-                "Save as Excel",
-                "",
-                "Excel Files (*.xlsx)"
-            )
-            if not file_path:
-                return
+        file_path, _ = QFileDialog.getSaveFileName(
+            parent,
+            "Save as Excel",
+            "",
+            "Excel Files (*.xlsx)"
+        )
+        if not file_path:
+            return
+
+        self._run_export(parent, "Excel", export_excel, file_path)
+
+    # === Export streaming di worker thread ===
+    def _run_export(self, parent, label, export_function, file_path):
+        progress = QProgressDialog(f"Exporting to {label}...", "Cancel", 0, 1000, parent)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(500)
 
-            data = self._get_data()
-            df = pd.DataFrame(data)
-            df.to_excel(file_path, index=False, engine="openpyxl")
+        self.worker = TaskWorker(
+            lambda report, is_cancelled: export_function(file_path, report, is_cancelled),
+            parent,
+            name=f"{label} export",
+        )
+        attach_progress_dialog(self.worker, progress)
+        self.worker.succeeded.connect(lambda result: self._export_finished(parent, progress, file_path, result))
+        self.worker.failed.connect(
+            lambda message: self._export_failed(parent, progress, f"Failed to export {label}:\n{message}")
+        )
+        self.worker.start()
 
-            QMessageBox.information(parent, "Success", f"Data successfully exported to:\n{file_path}")
-        except Exception as e:
-            QMessageBox.critical(parent, "Error", f"Failed to export Excel:\n{e}")
+    def _export_finished(self, parent, progress, file_path, result):
+        progress.close()
+        if result.cancelled:
+            QMessageBox.information(parent, "Cancelled", "Export cancelled.")
+            return
+        QMessageBox.information(parent, "Success", f"Data successfully exported to:\n{file_path}")
 
-    def _get_data(self):
-        """Ambil semua data dari tabel terkait"""
-        results = self.session.query(self.model).all()
-        data = []
-        for app in results:
-            data.append({
-                "ID": app.id,
-                "Company": app.company_name,
-                "Position": app.position,
-                "Location": app.location,
-                "Date Applied": app.date_applied.strftime("%d-%m-%Y") if app.date_applied else "",
-                "Source": app.source,
-                "Status": app.status,
-                "Salary": app.salary_expectation,
-                "Notes": app.notes,
-            })
-        return data
\ No newline at end of file
+    def _export_failed(self, parent, progress, message):
+        progress.close()
+        QMessageBox.critical(parent, "Error", message)
@@ -1,11 +1,10 @@
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QComboBox, QHBoxLayout, QPushButton, \
     QMessageBox, QDialog, QProgressDialog
-from datetime import datetime
 
-from app.database.Database import SessionLocal
-from app.database.Models import Application
+from app.import_feature.CSVImportEngine import import_csv, read_header
+from app.others.TaskWorker import TaskWorker, attach_progress_dialog
+from app.others.Icons import icon
 
 
 class CSVFieldMappingWindow(QDialog):
@@ -14,7 +13,7 @@ class CSVFieldMappingWindow(QDialog):
 
         self.csv_path = csv_path
         self.setWindowTitle("Map fields")
-        self.setWindowIcon(QIcon("assets/others_icon/column-mapping.png"))
+        self.setWindowIcon(icon("column_mapping"))
         self.setMinimumWidth(600)
 
         layout = QVBoxLayout()
@@ -30,11 +29,7 @@ class CSVFieldMappingWindow(QDialog):
         layout.addWidget(desc)
 
         # ---- READ CSV HEADER ONLY ----
-        import csv
-        with open(csv_path, newline='', encoding="utf-8") as f:
-            reader = csv.reader(f)
-            headers = next(reader)
-            headers = [h.replace("\ufeff", "").strip() for h in headers]  # remove BOM
+        headers = read_header(csv_path)  # remove BOM
 
         self.headers = headers
 
@@ -67,7 +62,7 @@ class CSVFieldMappingWindow(QDialog):
 
         btn_back.clicked.connect(self.go_back)
         btn_begin.clicked.connect(self.begin_import)
-        btn_begin.setStyleSheet("background-color: #1976d2; color: white;")
+        btn_begin.setProperty("variant", "primary")
 
         btn_layout.addWidget(btn_back)
         btn_layout.addWidget(btn_begin)
@@ -85,151 +80,60 @@ class CSVFieldMappingWindow(QDialog):
             parent.show()
 
     # ==========================================================
-    # PARSE CSV WITH MAPPING (IMPORTANT!)
+    # FIELD MAPPING (CSV FIELD → DB FIELD)
     # ==========================================================
-    def parse_csv_using_mapping(self):
-        import csv
-
-        # ambil mapping CSV FIELD → DB FIELD
+    def get_mapping(self):
         mapping = {}
         for r in range(self.table.rowCount()):
             csv_field = self.table.item(r, 0).text().strip()
             db_field = self.table.cellWidget(r, 1).currentText().strip()
             mapping[csv_field] = db_field
-
-        parsed = []
-
-        # gunakan DictReader agar per kolom akurat
-        with open(self.csv_path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                new_row = {}
-                for csv_key, val in row.items():
-                    clean_key = csv_key.replace("\ufeff", "").strip()
-                    db_field = mapping.get(clean_key)
-
-                    if db_field:
-                        # FIX di sini ↓↓↓
-                        value = (val or "").strip()
-                        new_row[db_field] = value
-
-                parsed.append(new_row)
-
-        return parsed
+        return mapping
 
     # ==========================================================
     # BEGIN IMPORT — MAIN PROCESS
     # ==========================================================
     def begin_import(self):
-        MANDATORY_FIELDS = [
-            "company_name", "position", "location", "date_applied",
-            "source", "status", "salary_expectation", "notes"
-        ]
+        mapping = self.get_mapping()
 
-        imported_data = self.parse_csv_using_mapping()
+        # ---- PROGRESS DIALOG ----
+        progress = QProgressDialog("Importing data...", "Cancel", 0, 1000, self)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
 
-        if not imported_data:
-            QMessageBox.warning(self, "Error", "CSV contains no data.")
-            return
+        # ---- WORKER THREAD: baca CSV secara streaming + insert per chunk ----
+        self.worker = TaskWorker(
+            lambda report, is_cancelled: import_csv(self.csv_path, mapping, report, is_cancelled),
+            self,
+            name="CSV import",
+        )
+        attach_progress_dialog(self.worker, progress)
+        self.worker.succeeded.connect(lambda result: self.import_finished(progress, result))
+        self.worker.failed.connect(lambda message: self.import_failed(progress, message))
+        self.worker.start()
 
-        # ---- VALIDATION (per-row, tidak stop import) ----
-        errors = []
+    def import_finished(self, progress, result):
+        progress.close()
 
-        for idx, row in enumerate(imported_data, start=1):
-            for f in MANDATORY_FIELDS:
-                if f not in row or (row[f] or "").strip() == "":
-                    errors.append(f"Row {idx}: Missing mandatory field '{f}'")
+        if result.imported == 0 and not result.errors and not result.cancelled:
+            QMessageBox.warning(self, "Error", "CSV contains no data.")
+            return
 
         # Tampilkan daftar error, tapi tidak stop import
-        if errors:
+        if result.errors:
+            more = result.skipped - len(result.errors)
+            details = "\n".join(result.errors) + (f"\n... and {more} more" if more > 0 else "")
             QMessageBox.warning(
                 self,
                 "Some rows contain missing fields",
-                "The following issues were found:\n\n" + "\n".join(errors)
+                f"{result.skipped} row(s) were skipped:\n\n" + details
             )
 
-        # ---- PROGRESS DIALOG ----
-        progress = QProgressDialog("Importing data...", "Cancel", 0, len(imported_data), self)
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setValue(0)
-
-        self.import_data = imported_data
-        self.import_index = 0
-
-        def process_next():
-            if progress.wasCanceled():
-                return
-
-            if self.import_index < len(imported_data):
-                row = imported_data[self.import_index]
-
-                # Skip row yang tidak valid
-                missing = [f for f in MANDATORY_FIELDS if (row.get(f) or "").strip() == ""]
-                if missing:
-                    print(f"Skipping row {self.import_index + 1}, missing: {missing}")
-                else:
-                    generated_id = self.generate_id(row["company_name"])
-                    self.insert_row_to_db(generated_id, row)
-
-                self.import_index += 1
-                progress.setValue(self.import_index)
-
-                QTimer.singleShot(30, process_next)
-            else:
-                progress.close()
-                QMessageBox.information(self, "Completed", "Import finished successfully!")
-
-        QTimer.singleShot(100, process_next)
-
-    # ==========================================================
-    # GENERATE ID
-    # ==========================================================
-    def generate_id(self, company_name):
-        prefix = company_name[:2].upper()
-
-        session = SessionLocal()
-        last_id = (
-            session.query(Application.id)
-            .filter(Application.id.like(f"{prefix}%"))
-            .order_by(Application.id.desc())
-            .first()
-        )
-
-        if last_id:
-            last_seq = int(last_id[0][2:])
-            new_seq = last_seq + 1
+        if result.cancelled:
+            QMessageBox.information(self, "Cancelled", f"Import cancelled. {result.imported} row(s) were imported.")
         else:
-            new_seq = 1
-
-        session.close()
-        return f"{prefix}{new_seq:03d}"
-
-    # ==========================================================
-    # INSERT INTO DB
-    # ==========================================================
-    def insert_row_to_db(self, generated_id, row):
-        session = SessionLocal()
-
-        # PARSE DATE
-        try:
-            parsed_date = datetime.strptime(row["date_applied"], "%Y-%m-%d").date()
-        except:
-            parsed_date = None
-
-        new_app = Application(
-            id=generated_id,
-            company_name=row["company_name"],
-            position=row["position"],
-            location=row["location"],
-            date_applied=parsed_date,
-            source=row["source"],
-            status=row["status"],
-            salary_expectation=row["salary_expectation"],
-            notes=row["notes"],
-            created_at=datetime.now()
-        )
+            QMessageBox.information(self, "Completed", f"Import finished successfully! {result.imported} row(s) imported.")
 
-        session.add(new_app)
-        session.commit()
-        session.close()
\ No newline at end of file
+    def import_failed(self, progress, message):
+        progress.close()
+        QMessageBox.critical(self, "Import Error", f"Failed to import CSV:\n{message}")
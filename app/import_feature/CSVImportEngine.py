@@ -0,0 +1,175 @@
+import csv
+import os
+import time
+from datetime import datetime
+from functools import partial
+
+from sqlalchemy import insert
+
+from app.database import ChangeFeed
+from app.database.FullTextSearch import deferred_fts_sync
+from app.database.IdAllocator import IdBlockAllocator
+from app.database.StatisticsRollup import deferred_rollup_sync
+from app.database.Models import Application, StatusHistory
+from app.database.WriteQueue import write_queue
+
+# Kolom yang wajib terisi; baris yang kosong di salah satu kolom ini di-skip
+MANDATORY_FIELDS = [
+    "company_name", "position", "location", "date_applied",
+    "source", "status", "salary_expectation", "notes"
+]
+
+# Jumlah baris per transaksi (satu executemany per chunk)
+CHUNK_SIZE = 2000
+
+# Jarak minimal antar laporan progress, supaya UI tidak kebanjiran signal
+PROGRESS_INTERVAL = 0.1
+
+# Batas jumlah pesan error yang disimpan (sisanya hanya dihitung)
+MAX_ERRORS = 50
+
+
+class ImportResult:
+    def __init__(self):
+        self.imported = 0
+        self.skipped = 0
+        self.errors = []
+        self.cancelled = False
+
+    def add_error(self, message):
+        self.skipped += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(message)
+
+
+def read_header(csv_path):
+    """Baca baris header saja (tanpa BOM)."""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        headers = next(csv.reader(f), [])
+    return [h.replace("\ufeff", "").strip() for h in headers]
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def build_record(row, created_at):
+    """Dict untuk INSERT dari satu baris yang sudah di-mapping ke field database."""
+    return {
+        "company_name": row.get("company_name", ""),
+        "position": row.get("position", ""),
+        "location": row.get("location", ""),
+        "date_applied": parse_date(row.get("date_applied")),
+        "source": row.get("source", ""),
+        "status": row.get("status", ""),
+        "salary_expectation": row.get("salary_expectation", ""),
+        "notes": row.get("notes", ""),
+        "created_at": created_at,
+    }
+
+
+class BulkInserter:
+    """Kumpulkan record lalu tulis per chunk dalam satu transaksi (Core executemany).
+
+    ID diambil dari IdBlockAllocator di transaksi yang sama dengan INSERT-nya,
+    jadi chunk yang gagal tidak meninggalkan nomor terpakai. Chunk ditulis oleh
+    thread writer (WriteQueue) di transaksinya sendiri; flush() menunggu sampai
+    chunk itu ter-commit.
+    """
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.id_allocator = IdBlockAllocator(block_size=min(chunk_size, 1000))
+        self.pending = []
+        self.written = 0
+        self._statement = insert(Application.__table__)
+        self._history_statement = insert(StatusHistory.__table__)
+
+    def add(self, record):
+        self.pending.append(record)
+        if len(self.pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        records = self.pending
+        write_queue().call(partial(self._write_chunk, records=records), exclusive=True)
+        self.written += len(records)
+        self.pending = []
+
+    def _write_chunk(self, session, records):
+        conn = session.connection()
+        for record in records:
+            record["id"] = self.id_allocator.next_id(conn, record["company_name"])
+
+        # Index FTS & rollup statistik diisi sekali per chunk, jauh lebih cepat dari trigger per baris
+        with deferred_rollup_sync(conn):
+            with deferred_fts_sync(conn):
+                conn.execute(self._statement, records)
+
+            # Status awal setiap lamaran (baris aktif StatusHistory), sama seperti lamaran dari form
+            conn.execute(self._history_statement, [
+                {
+                    "application_id": record["id"],
+                    "old_status": None,
+                    "new_status": record["status"],
+                    "updated_at": record["created_at"],
+                    "active_status": "Y",
+                }
+                for record in records
+            ])
+
+
+def import_csv(csv_path, mapping, progress=None, is_cancelled=None, chunk_size=CHUNK_SIZE):
+    """Import CSV secara streaming.
+
+    mapping: {nama kolom CSV: field database}
+    progress(done, total): dipanggil maksimal tiap PROGRESS_INTERVAL detik, dalam byte file
+    is_cancelled(): kalau True, import berhenti setelah chunk terakhir yang sudah ditulis
+    """
+    result = ImportResult()
+    inserter = BulkInserter(chunk_size)
+    total_bytes = os.path.getsize(csv_path) or 1
+    last_report = 0.0
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        headers = [h.replace("\ufeff", "").strip() for h in next(reader, [])]
+
+        # (posisi kolom CSV, field database) — dihitung sekali, bukan per baris
+        columns = [(i, mapping[h]) for i, h in enumerate(headers) if mapping.get(h)]
+
+        for line_no, values in enumerate(reader, start=1):
+            if is_cancelled and is_cancelled():
+                result.cancelled = True
+                break
+
+            row = {}
+            for i, field in columns:
+                if i < len(values):
+                    row[field] = (values[i] or "").strip()
+
+            missing = [field for field in MANDATORY_FIELDS if not row.get(field)]
+            if missing:
+                result.add_error(f"Row {line_no}: Missing mandatory field(s) {', '.join(missing)}")
+            else:
+                inserter.add(build_record(row, datetime.now()))
+
+            now = time.monotonic()
+            if progress and now - last_report >= PROGRESS_INTERVAL:
+                progress(f.buffer.tell(), total_bytes)
+                last_report = now
+
+    if not result.cancelled:
+        inserter.flush()
+        if progress:
+            progress(total_bytes, total_bytes)
+
+    result.imported = inserter.written
+    if inserter.written:
+        ChangeFeed.publish(ChangeFeed.RESET)  # tabel di UI dimuat ulang sekali
+    return result
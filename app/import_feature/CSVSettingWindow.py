@@ -1,8 +1,8 @@
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QComboBox, QLineEdit, QFormLayout, \
     QFileDialog, QMessageBox
 
 from app.import_feature.CSVFieldMappingWindow import CSVFieldMappingWindow
+from app.others.Icons import icon
 
 
 class CSVSettingsWindow(QDialog):
@@ -10,7 +10,7 @@ class CSVSettingsWindow(QDialog):
         super().__init__(parent)
 
         self.setWindowTitle("File import")
-        self.setWindowIcon(QIcon("assets/others_icon/import-document.png"))
+        self.setWindowIcon(icon("import_document"))
         self.setMinimumWidth(500)
 
         layout = QVBoxLayout()
@@ -54,7 +54,7 @@ class CSVSettingsWindow(QDialog):
 
         btn_back = QPushButton("Back")
         btn_next = QPushButton("Next")
-        btn_next.setStyleSheet("background-color: #1976d2; color: white;")
+        btn_next.setProperty("variant", "primary")
 
         btn_back.clicked.connect(self.go_back)
         btn_next.clicked.connect(self.go_next)
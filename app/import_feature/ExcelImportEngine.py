@@ -0,0 +1,99 @@
+import time
+from datetime import date, datetime
+
+from app.database import ChangeFeed
+from app.import_feature.CSVImportEngine import (
+    BulkInserter, ImportResult, CHUNK_SIZE, PROGRESS_INTERVAL, build_record
+)
+
+# Kolom yang harus ada di baris header sheet
+REQUIRED_COLUMNS = [
+    "company_name", "position", "location", "date_applied",
+    "source", "status", "salary_expectation", "notes"
+]
+
+
+class InvalidExcelFormat(ValueError):
+    pass
+
+
+def _to_text(value):
+    return "" if value is None else str(value).strip()
+
+
+def _to_date_text(value):
+    """Sel tanggal bisa berupa datetime (format Excel) atau teks 'YYYY-MM-DD'."""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return _to_text(value)
+
+
+def import_excel(file_path, progress=None, is_cancelled=None, chunk_size=CHUNK_SIZE):
+    """Import sheet aktif secara streaming (openpyxl read_only + iter_rows).
+
+    Memori tetap kecil berapa pun ukuran file: hanya satu baris dan satu chunk
+    INSERT yang dipegang sekaligus. Raise InvalidExcelFormat kalau sheet kosong
+    atau kolom wajib tidak lengkap.
+    """
+    from openpyxl import load_workbook  # import berat (~250 ms), hanya saat import Excel dijalankan
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        rows = sheet.iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if not header:
+            raise InvalidExcelFormat("The selected Excel file is empty.")
+
+        header = [_to_text(h) for h in header]
+        missing_columns = [c for c in REQUIRED_COLUMNS if c not in header]
+        if missing_columns:
+            raise InvalidExcelFormat(
+                f"Excel file must contain these columns:\n{', '.join(REQUIRED_COLUMNS)}"
+            )
+
+        positions = {c: header.index(c) for c in REQUIRED_COLUMNS}
+        total_rows = max((sheet.max_row or 1) - 1, 0)  # dari tag dimension, bisa tidak ada
+
+        result = ImportResult()
+        inserter = BulkInserter(chunk_size)
+        last_report = 0.0
+
+        for row_no, values in enumerate(rows, start=1):
+            if is_cancelled and is_cancelled():
+                result.cancelled = True
+                break
+
+            row = {}
+            for column, i in positions.items():
+                value = values[i] if i < len(values) else None
+                row[column] = _to_date_text(value) if column == "date_applied" else _to_text(value)
+
+            if not any(row.values()):
+                continue  # baris kosong di akhir sheet
+
+            row["status"] = row["status"] or "Applied"
+            if not row["company_name"] or not row["position"]:
+                result.add_error(f"Row {row_no}: company_name and position are required")
+            else:
+                inserter.add(build_record(row, datetime.now()))
+
+            now = time.monotonic()
+            if progress and now - last_report >= PROGRESS_INTERVAL:
+                progress(row_no, total_rows)
+                last_report = now
+
+        if not result.cancelled:
+            inserter.flush()
+            if progress:
+                progress(total_rows, total_rows)
+
+        result.imported = inserter.written
+        if inserter.written:
+            ChangeFeed.publish(ChangeFeed.RESET)  # tabel di UI dimuat ulang sekali
+        return result
+    finally:
+        workbook.close()
@@ -1,76 +1,69 @@
-import pandas as pd
-from PySide6.QtWidgets import QFileDialog, QMessageBox
-from app.database.Database import SessionLocal
-from app.database.Models import Application
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog
+
+from app.import_feature.ExcelImportEngine import import_excel
+from app.others.TaskWorker import TaskWorker, attach_progress_dialog
 
 
 class ExcelImporter:
     def __init__(self, parent=None):
         self.parent = parent
-        self.session = SessionLocal()
+        self.worker = None
 
     def import_from_excel(self):
-        try:
-            # === Pilih file Excel ===
-            file_path, _ = QFileDialog.getOpenFileName(
-                self.parent,
-                "Import Excel File",
-                "",
-                "Excel Files (*.xlsx)"
-            )
+        # === Pilih file Excel ===
+        file_path, _ = QFileDialog.getOpenFileName(
+            self.parent,
+            "Import Excel File",
+            "",
+            "Excel Files (*.xlsx)"
+        )
 
-            if not file_path:
-                return
+        if not file_path:
+            return
 
-            # === Baca file Excel ===
-            try:
-                df = pd.read_excel(file_path, engine="openpyxl")
-            except Exception as e:
-                QMessageBox.critical(self.parent, "Read Error", f"Failed to read Excel file:\n{e}")
-                return
+        # === Import jalan di worker thread, UI tetap responsif ===
+        progress = QProgressDialog("Importing Excel data...", "Cancel", 0, 1000, self.parent)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
 
-            # === Cek jika kosong ===
-            if df.empty:
-                QMessageBox.warning(self.parent, "Empty File", "The selected Excel file is empty.")
-                return
+        self.worker = TaskWorker(
+            lambda report, is_cancelled: import_excel(file_path, report, is_cancelled),
+            self.parent,
+            name="Excel import",
+        )
+        attach_progress_dialog(self.worker, progress)
+        self.worker.succeeded.connect(lambda result: self.import_finished(progress, result))
+        self.worker.failed.connect(lambda message: self.import_failed(progress, message))
+        self.worker.start()
 
-            # === Validasi kolom wajib ===
-            required_columns = {"company_name", "position", "location", "date_applied", "source", "status", "salary_expectation", "notes"}
-            if not required_columns.issubset(df.columns):
-                QMessageBox.critical(
-                    self.parent,
-                    "Invalid Format",
-                    f"Excel file must contain these columns:\n{', '.join(required_columns)}"
-                )
-                return
+    def import_finished(self, progress, result):
+        progress.close()
 
-            # === Import data ===
-            count = 0
-            for _, row in df.iterrows():
-                app = Application(
-                    company_name=str(row.get("company_name", "")).strip(),
-                    position=str(row.get("position", "")).strip(),
-                    location=str(row.get("location", "")).strip(),
-                    date_applied=row.get("date_applied"),
-                    source=str(row.get("source", "")).strip(),
-                    status=str(row.get("status", "Applied")).strip(),
-                    salary_expectation=str(row.get("salary_expectation", "")).strip(),
-                    notes=str(row.get("notes", "")).strip(),
-                )
-                self.session.add(app)
-                count += 1
-
-            self.session.commit()
+        if result.errors:
+            QMessageBox.warning(
+                self.parent,
+                "Some rows were skipped",
+                f"{result.skipped} row(s) were skipped:\n\n" + "\n".join(result.errors)
+            )
 
+        if result.cancelled:
+            QMessageBox.information(
+                self.parent,
+                "Import Cancelled",
+                f"Import cancelled. {result.imported} records were imported."
+            )
+        else:
             QMessageBox.information(
                 self.parent,
                 "Import Success",
-                f"Successfully imported {count} records from Excel file."
+                f"Successfully imported {result.imported} records from Excel file."
             )
 
-        except Exception as e:
-            QMessageBox.critical(
-                self.parent,
-                "Import Error",
-                f"Failed to import Excel:\n{e}"
-            )
\ No newline at end of file
+    def import_failed(self, progress, message):
+        progress.close()
+        QMessageBox.critical(
+            self.parent,
+            "Import Error",
+            f"Failed to import Excel:\n{message}"
+        )
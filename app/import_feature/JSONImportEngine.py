@@ -0,0 +1,63 @@
+import json
+import os
+import time
+from datetime import datetime
+
+from app.database import ChangeFeed
+from app.import_feature.CSVImportEngine import (
+    BulkInserter, ImportResult, CHUNK_SIZE, MANDATORY_FIELDS, PROGRESS_INTERVAL, build_record
+)
+
+
+def import_json_lines(file_path, progress=None, is_cancelled=None, chunk_size=CHUNK_SIZE):
+    """Import JSON Lines (satu object lamaran per baris) secara streaming.
+
+    Format object sama dengan dialog JSON: field database sebagai key,
+    date_applied 'YYYY-MM-DD'. Baris kosong dilewati; baris yang bukan object
+    JSON atau field wajibnya kosong dicatat sebagai error.
+    progress(done, total): dalam byte file
+    """
+    result = ImportResult()
+    inserter = BulkInserter(chunk_size)
+    total_bytes = os.path.getsize(file_path) or 1
+    last_report = 0.0
+
+    with open(file_path, "rb") as f:
+        for line_no, line in enumerate(f, start=1):
+            if is_cancelled and is_cancelled():
+                result.cancelled = True
+                break
+
+            if not line.strip():
+                continue
+
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                result.add_error(f"Line {line_no}: Invalid JSON ({e})")
+                continue
+            if not isinstance(data, dict):
+                result.add_error(f"Line {line_no}: JSON must be an object")
+                continue
+
+            row = {field: str(data.get(field) or "").strip() for field in MANDATORY_FIELDS}
+            missing = [field for field in MANDATORY_FIELDS if not row[field]]
+            if missing:
+                result.add_error(f"Line {line_no}: Missing mandatory field(s) {', '.join(missing)}")
+            else:
+                inserter.add(build_record(row, datetime.now()))
+
+            now = time.monotonic()
+            if progress and now - last_report >= PROGRESS_INTERVAL:
+                progress(f.tell(), total_bytes)
+                last_report = now
+
+    if not result.cancelled:
+        inserter.flush()
+        if progress:
+            progress(total_bytes, total_bytes)
+
+    result.imported = inserter.written
+    if inserter.written:
+        ChangeFeed.publish(ChangeFeed.RESET)  # tabel di UI dimuat ulang sekali
+    return result
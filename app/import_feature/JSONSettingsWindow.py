@@ -1,20 +1,22 @@
-from PySide6.QtGui import QColor, QIcon
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QTextEdit, QPushButton,
     QHBoxLayout, QTableWidget, QTableWidgetItem, QMessageBox
 )
 
 from datetime import datetime
-from app.database.Models import Application
+from functools import partial
+from app.database.WriteCommands import save_application
+from app.others.DbWriter import db_writer
+from app.others.Icons import icon
 import json
 
 
 class JSONSettingsWindow(QDialog):
-    def __init__(self, parent=None, session=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.session = session
         self.setWindowTitle("JSON Import Settings")
-        self.setWindowIcon(QIcon("assets/others_icon/json.png"))
+        self.setWindowIcon(icon("json"))
         self.setMinimumWidth(600)
 
         layout = QVBoxLayout()
@@ -56,7 +58,7 @@ class JSONSettingsWindow(QDialog):
         btn_row = QHBoxLayout()
         self.back_btn = QPushButton("Back")
         self.begin_btn = QPushButton("Begin Import")
-        self.begin_btn.setStyleSheet("background-color: #1976d2; color: white;")
+        self.begin_btn.setProperty("variant", "primary")
 
         btn_row.addWidget(self.back_btn)
         btn_row.addWidget(self.begin_btn)
@@ -137,41 +139,19 @@ class JSONSettingsWindow(QDialog):
                                 f"Missing mandatory fields: {', '.join(missing)}")
             return
 
-        # --- ID generator ---
-        company = data["company_name"].strip()
-        prefix = company[:2].upper()
-
-        last_app = (
-            self.session.query(Application)
-            .filter(Application.id.like(f"{prefix}%"))
-            .order_by(Application.id.desc())
-            .first()
-        )
-
-        if last_app:
-            last_num = int(last_app.id[-3:])
-            new_num = last_num + 1
-        else:
-            new_num = 1
-
-        new_id = f"{prefix}{new_num:03d}"
-
-        # --- Create application ---
-        app = Application(
-            id=new_id,
-            company_name=data["company_name"],
-            position=data["position"],
-            location=data["location"],
-            date_applied=datetime.strptime(data["date_applied"], "%Y-%m-%d").date(),
-            source=data["source"],
-            status=data["status"],
-            salary_expectation=data["salary_expectation"],
-            notes=data["notes"],
-            created_at=datetime.now(),
-        )
-
-        self.session.add(app)
-        self.session.commit()
+        values = {field: data[field] for field in mandatory}
+        values["date_applied"] = datetime.strptime(data["date_applied"], "%Y-%m-%d").date()
 
+        # --- Create application (ID dibuat di thread writer) ---
+        self.begin_btn.setEnabled(False)
+        job = db_writer().submit(partial(save_application, values=values))
+        job.succeeded.connect(lambda _: self.import_finished())
+        job.failed.connect(self.import_failed)
+
+    def import_finished(self):
         QMessageBox.information(self, "Imported", "JSON data imported successfully!")
-        self.accept()
\ No newline at end of file
+        self.accept()
+
+    def import_failed(self, message):
+        self.begin_btn.setEnabled(True)
+        QMessageBox.critical(self, "Import Error", f"Failed to import JSON:\n{message}")
\ No newline at end of file
@@ -1,15 +1,16 @@
 from PySide6.QtWidgets import QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QSpacerItem, QSizePolicy
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QCursor, QIcon
+from PySide6.QtGui import QFont, QCursor
 
 from app.login_feature.ClickableLabel import ClickableLabel
+from app.others.Icons import icon
 
 
 class ForgotYourPasswordWindow(QWidget):
     def __init__(self, login_window=None):
         super().__init__()
         self.login_window = login_window
-        self.setWindowIcon(QIcon("assets/others_icon/apply_me_job_tracker_logo.png"))
+        self.setWindowIcon(icon("app_logo"))
         self.setWindowTitle("Forgot Password")
         self.setFixedSize(400, 200)
         self.setup_ui()
@@ -48,17 +49,7 @@ class ForgotYourPasswordWindow(QWidget):
 
         # Reset password button
         self.reset_button = QPushButton("Reset Password")
-        self.reset_button.setStyleSheet("""
-            QPushButton {
-                background-color: #007BFF;
-                color: black;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            QPushButton:pressed {
-                background-color: #0056b3;
-            }
-        """)
+        self.reset_button.setProperty("variant", "accent")
         self.reset_button.setFixedWidth(200)
         self.reset_button.setCursor(QCursor(Qt.PointingHandCursor))
         layout.addWidget(self.reset_button, alignment=Qt.AlignCenter)
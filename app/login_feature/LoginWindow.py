@@ -3,12 +3,13 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QCheckBox, QSpacerItem, QSizePolicy
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QIcon
+from PySide6.QtGui import QFont
 
 from app.login_feature.ForgotYourPasswordWindow import ForgotYourPasswordWindow
 from app.login_feature.SignUpWindow import SignUpWindow
 from app.login_feature.ClickableLabel import ClickableLabel
 from app.database.Database import SessionLocal
+from app.others.Icons import icon
 
 
 class LoginWindow(QWidget):
@@ -17,7 +18,7 @@ class LoginWindow(QWidget):
         self.session = SessionLocal()
 
         self.setWindowTitle("Login Page")
-        self.setWindowIcon(QIcon("assets/others_icon/apply_me_job_tracker_logo.png"))
+        self.setWindowIcon(icon("app_logo"))
         self.setFixedSize(400, 380)
         self.setup_ui()
 
@@ -74,17 +75,7 @@ class LoginWindow(QWidget):
         # Login button
         layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Fixed))
         self.login_button = QPushButton("Log in")
-        self.login_button.setStyleSheet("""
-            QPushButton {
-                background-color: #007BFF; 
-                color: white; 
-                border-radius: 5px; 
-                padding: 8px;
-            }
-            QPushButton:pressed {
-                background-color: #0056b3;
-            }
-        """)
+        self.login_button.setProperty("variant", "accent")
         layout.addWidget(self.login_button)
 
         # Sign up label
@@ -96,7 +87,7 @@ class LoginWindow(QWidget):
         self.setLayout(layout)
 
     def open_signup_window(self):
-        self.signup_window = SignUpWindow(login_window=self, session=self.session)
+        self.signup_window = SignUpWindow(login_window=self)
         self.signup_window.show()
         self.hide()
 
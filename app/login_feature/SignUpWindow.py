@@ -1,17 +1,19 @@
 from PySide6.QtWidgets import QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QSpacerItem, QSizePolicy
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QCursor, QIcon
+from PySide6.QtGui import QFont, QCursor
 from app.login_feature.ClickableLabel import ClickableLabel
 import re
-from app.database.Models import User
-from datetime import datetime
+from functools import partial
+from app.database.WriteCommands import create_user
+from app.others.DbWriter import db_writer
+from app.others.Icons import icon
+from app.others.Theme import set_state
 
 class SignUpWindow(QWidget):
-    def __init__(self, login_window=None, session=None):
+    def __init__(self, login_window=None):
         super().__init__()
         self.login_window = login_window
-        self.session = session
-        self.setWindowIcon(QIcon("assets/others_icon/apply_me_job_tracker_logo.png"))
+        self.setWindowIcon(icon("app_logo"))
         self.setWindowTitle("Sign Up")
         self.setFixedSize(400, 350)
         self.setup_ui()
@@ -61,23 +63,13 @@ class SignUpWindow(QWidget):
 
         # Error / info label
         self.info_label = QLabel("")
-        self.info_label.setStyleSheet("color: red;")
+        self.info_label.setProperty("state", "error")
         layout.addWidget(self.info_label)
 
         # Create Account Button
         self.create_button = QPushButton("Create Account")
         self.create_button.clicked.connect(self.validate_form)
-        self.create_button.setStyleSheet("""
-            QPushButton {
-                background-color: #007BFF; 
-                color: white; 
-                border-radius: 5px; 
-                padding: 8px;
-            }
-            QPushButton:pressed {
-                background-color: #0056b3;
-            }
-        """)
+        self.create_button.setProperty("variant", "accent")
         self.create_button.setFixedWidth(200)
         self.create_button.setCursor(QCursor(Qt.PointingHandCursor))
         layout.addWidget(self.create_button, alignment=Qt.AlignCenter)
@@ -92,6 +84,12 @@ class SignUpWindow(QWidget):
 
         self.setLayout(layout)
 
+    def fields(self):
+        return [
+            self.name_input, self.username_input, self.email_input,
+            self.password_input, self.confirm_password_input,
+        ]
+
     def go_to_login(self):
         self.close()
         if self.login_window:
@@ -105,11 +103,8 @@ class SignUpWindow(QWidget):
         confirm = self.confirm_password_input.text()
 
         # Reset semua border ke default
-        self.name_input.setStyleSheet("")
-        self.username_input.setStyleSheet("")
-        self.email_input.setStyleSheet("")
-        self.password_input.setStyleSheet("")
-        self.confirm_password_input.setStyleSheet("")
+        for field in self.fields():
+            set_state(field, "validation", None)
 
         empty_fields = []
 
@@ -126,59 +121,43 @@ class SignUpWindow(QWidget):
 
         if empty_fields:
             for field in empty_fields:
-                field.setStyleSheet("border: 2px solid red;")
+                set_state(field, "validation", "error")
             self.info_label.setText("Please fill out all fields!")
-            self.info_label.setStyleSheet("color: red;")
+            set_state(self.info_label, "state", "error")
             return
 
         # Validate email
         if "@" not in email or "." not in email:
             self.info_label.setText("Invalid email address!")
-            self.info_label.setStyleSheet("color: red;")
+            set_state(self.info_label, "state", "error")
             return
 
         # Validate password: starts with uppercase, contains lowercase, contains number
         if not re.match(r'^[A-Z]', password):
             self.info_label.setText("Password must start with an uppercase letter!")
-            self.info_label.setStyleSheet("color: red;")
+            set_state(self.info_label, "state", "error")
             return
         if not re.search(r'[a-z]', password):
             self.info_label.setText("Password must contain at least one lowercase letter!")
-            self.info_label.setStyleSheet("color: red;")
+            set_state(self.info_label, "state", "error")
             return
         if not re.search(r'\d', password):
             self.info_label.setText("Password must contain at least one number!")
-            self.info_label.setStyleSheet("color: red;")
+            set_state(self.info_label, "state", "error")
             return
 
         # Password and confirm password must match
         if password != confirm:
             self.info_label.setText("Password and Confirm Password do not match!")
-            self.info_label.setStyleSheet("color: red;")
+            set_state(self.info_label, "state", "error")
             return
 
         # If all validations pass
-        self.confirm_password_input.setStyleSheet("border: 2px solid green;")
+        set_state(self.confirm_password_input, "validation", "ok")
         self.info_label.setText("Validation successful! Account is ready to be created.")
-        self.info_label.setStyleSheet("color: green;")
-
-        # SIGN UP PROCESS
-        if self.session is None:
-            print("SESSION IS NONE!")
-            return
-
-        # Cek apakah username/email sudah terdaftar
-        existing_user = (
-            self.session.query(User)
-            .filter((User.user_name == username) | (User.email == email))
-            .first()
-        )
-
-        if existing_user:
-            self.info_label.setText("Username or Email already exists!")
-            self.info_label.setStyleSheet("color: red;")
-            return
+        set_state(self.info_label, "state", "success")
 
+        # SIGN UP PROCESS (cek duplikat + insert di thread writer)
         name = self.name_input.text().strip()
         username = self.username_input.text().strip()
         email = self.email_input.text().strip()
@@ -188,30 +167,31 @@ class SignUpWindow(QWidget):
             print("ALL FIELDS REQUIRED")
             return
 
-        # INSERT USER
-        new_user = User(
-            name=name,
-            user_name=username,
-            email=email,
-            password=password,
-            created_at=datetime.now()
-        )
-
-        self.session.add(new_user)
-        self.session.commit()
+        self.create_button.setEnabled(False)
+        job = db_writer().submit(partial(
+            create_user, name=name, user_name=username, email=email, password=password
+        ))
+        job.succeeded.connect(lambda _: self.account_created())
+        job.failed.connect(self.account_failed)
 
+    def account_created(self):
         self.info_label.setText("Account created successfully!")
-        self.info_label.setStyleSheet("color: green;")
+        set_state(self.info_label, "state", "success")
 
         # Kembali ke login window
         self.close()
         if self.login_window:
             self.login_window.show()
 
+    def account_failed(self, message):
+        self.create_button.setEnabled(True)
+        self.info_label.setText(message)
+        set_state(self.info_label, "state", "error")
+
     def check_password_match(self):
         password = self.password_input.text()
         confirm = self.confirm_password_input.text()
         if password == confirm and confirm != "":
-            self.confirm_password_input.setStyleSheet("border: 2px solid green;")
+            set_state(self.confirm_password_input, "validation", "ok")
         else:
-            self.confirm_password_input.setStyleSheet("")
\ No newline at end of file
+            set_state(self.confirm_password_input, "validation", None)
\ No newline at end of file
@@ -0,0 +1,58 @@
+from PySide6.QtCore import QObject, Signal
+
+from app.database.WriteQueue import write_queue
+
+
+class WriteJob(QObject):
+    """Satu write yang sedang antri di thread writer.
+
+    succeeded(result) / failed(message) di-emit di UI thread setelah commit,
+    jadi slot yang di-connect langsung sesudah submit() tidak akan terlewat.
+    """
+
+    succeeded = Signal(object)
+    failed = Signal(str)
+
+    _finished = Signal(object)  # WriteRequest, dari thread writer → queued ke UI thread
+
+    def __init__(self, writer):
+        super().__init__()
+        self.writer = writer
+        self._finished.connect(self._deliver)
+
+    def _deliver(self, request):
+        self.writer._jobs.discard(self)
+        if request.error is not None:
+            self.failed.emit(str(request.error))
+        else:
+            self.succeeded.emit(request.result)
+
+
+class DbWriter(QObject):
+    """Kirim command ke WriteQueue dari UI; hasilnya kembali sebagai signal WriteJob.
+
+        job = db_writer().submit(partial(save_application, values=values))
+        job.succeeded.connect(...)
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.queue = write_queue()
+        self._jobs = set()  # simpan referensi sampai hasilnya sampai di UI thread
+
+    def submit(self, command):
+        job = WriteJob(self)
+        self._jobs.add(job)
+        self.queue.submit(command, callback=job._finished.emit)
+        return job
+
+
+_writer = None
+
+
+def db_writer():
+    """DbWriter bersama untuk semua window (dibuat di UI thread saat pertama dipakai)."""
+    global _writer
+    if _writer is None:
+        _writer = DbWriter()
+    return _writer
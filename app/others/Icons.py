@@ -0,0 +1,126 @@
+import os
+import re
+import sys
+
+from PySide6.QtCore import QFile
+from PySide6.QtGui import QIcon
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ASSETS_DIR = os.path.join(PROJECT_ROOT, "assets")
+QRC_PATH = os.path.join(ASSETS_DIR, "resources.qrc")
+
+# Nama icon → file di dalam assets/ (juga path di resource bundle)
+ICONS = {
+    # Logo aplikasi
+    "app_logo": "others_icon/apply_me_job_tracker_logo.png",
+
+    # Toolbar / menu
+    "csv_file": "head_menu/csv-file.png",
+    "xlsx_file": "head_menu/xlsx-file.png",
+    "json_file": "head_menu/json-file.png",
+    "database_management": "head_menu/database_management.png",
+    "data_management": "head_menu/data_management.png",
+    "notification": "head_menu/notification.png",
+    "advanced_setting": "head_menu/advanced-setting.png",
+
+    # Side menu
+    "home": "side_menu/home.png",
+    "statistics": "side_menu/statistics.png",
+    "reminders": "side_menu/reminders.png",
+    "contacts": "side_menu/contacts.png",
+
+    # Dialog
+    "add_form": "others_icon/add_new_form.png",
+    "edit_form": "others_icon/edit_form.png",
+    "import": "others_icon/import.png",
+    "import_document": "others_icon/import-document.png",
+    "column_mapping": "others_icon/column-mapping.png",
+    "json": "others_icon/json.png",
+}
+
+RESOURCE_ROOT = ":/"
+
+_cache = {}
+_resources_loaded = None
+
+
+def resources_loaded():
+    """Daftarkan resource bundle ke Qt (sekali, saat icon pertama dibutuhkan).
+
+    Bundle dibuat dengan `pyside6-rcc assets/resources.qrc -o app/others/resources_rc.py`.
+    Kalau belum di-compile, icon dibaca langsung dari folder assets/ (path absolut).
+    """
+    global _resources_loaded
+    if _resources_loaded is None:
+        try:
+            from app.others import resources_rc  # noqa: F401 — import = registrasi resource
+            _resources_loaded = True
+        except ImportError:
+            _resources_loaded = False
+    return _resources_loaded
+
+
+def icon_path(name):
+    relative = ICONS[name]
+    if resources_loaded():
+        return RESOURCE_ROOT + relative
+    return os.path.join(ASSETS_DIR, relative)
+
+
+def icon(name):
+    """QIcon untuk nama di ICONS; di-decode sekali lalu dipakai bersama oleh semua window."""
+    cached = _cache.get(name)
+    if cached is None:
+        cached = _cache[name] = QIcon(icon_path(name))
+    return cached
+
+
+# === Asset check: python -m app.others.Icons ===
+def missing_assets():
+    """List masalah: file icon yang tidak ada, belum masuk bundle, atau nama icon yang tidak terdaftar."""
+    problems = []
+
+    with open(QRC_PATH, encoding="utf-8") as f:
+        bundled = set(re.findall(r"<file>(.+?)</file>", f.read()))
+
+    for name, relative in ICONS.items():
+        if not os.path.exists(os.path.join(ASSETS_DIR, relative)):
+            problems.append(f"{name}: assets/{relative} does not exist")
+        if relative not in bundled:
+            problems.append(f"{name}: assets/{relative} is not listed in resources.qrc")
+        elif resources_loaded() and not QFile.exists(RESOURCE_ROOT + relative):
+            problems.append(f"{name}: {relative} is missing from resources_rc.py (recompile the .qrc)")
+
+    for relative in sorted(bundled):
+        if not os.path.exists(os.path.join(ASSETS_DIR, relative)):
+            problems.append(f"resources.qrc: assets/{relative} does not exist")
+
+    # Nama icon("...") dan path "assets/..." langsung di source code
+    for path in _source_files():
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        relative_path = os.path.relpath(path, PROJECT_ROOT)
+        for name in re.findall(r"\bicon\(\"([\w-]+)\"\)", source):
+            if name not in ICONS:
+                problems.append(f"{relative_path}: unknown icon name '{name}'")
+        for asset in re.findall(r"[\"']assets/([^\"']+)[\"']", source):
+            problems.append(f"{relative_path}: loads assets/{asset} by relative path, use icon() instead")
+
+    return problems
+
+
+def _source_files():
+    for root, dirs, files in os.walk(PROJECT_ROOT):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d not in ("__pycache__", "data", "assets")]
+        for file in files:
+            path = os.path.join(root, file)
+            if file.endswith(".py") and file != "resources_rc.py" and path != os.path.abspath(__file__):
+                yield path
+
+
+if __name__ == "__main__":
+    issues = missing_assets()
+    for issue in issues:
+        print(issue)
+    print(f"{len(ICONS)} icons checked, {len(issues)} problem(s)")
+    sys.exit(1 if issues else 0)
@@ -0,0 +1,75 @@
+from PySide6.QtWidgets import QWidget
+
+from app.database import QueryStats
+
+
+class Page(QWidget):
+    """Base class halaman di QStackedWidget utama.
+
+    load() dipanggil saat halaman pertama kali dibuka dan setiap kali dibuka
+    lagi setelah mark_dirty() (misalnya karena data lamaran berubah). Selama
+    tidak dirty, halaman memakai data yang sudah ditampilkan sebelumnya.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._dirty = True
+
+    def mark_dirty(self):
+        self._dirty = True
+        if self.isVisible():
+            self.refresh_if_needed()  # sedang dilihat → langsung update
+
+    def refresh_if_needed(self):
+        if self._dirty:
+            self._dirty = False
+            self.load()
+
+    def load(self):
+        pass
+
+
+class PageRegistry:
+    """Daftar halaman yang dibuat saat pertama kali dibuka.
+
+    register(key, factory) hanya menyimpan factory; widget-nya dibuat di open(),
+    jadi membuka MainWindow tidak bergantung pada jumlah / berat halaman lain.
+    """
+
+    def __init__(self, stack):
+        self.stack = stack
+        self._factories = {}
+        self._pages = {}
+
+    def register(self, key, factory):
+        self._factories[key] = factory
+
+    def add(self, key, widget):
+        """Daftarkan halaman yang sudah dibuat (mis. Dashboard, yang selalu tampil pertama)."""
+        self._pages[key] = widget
+        self.stack.addWidget(widget)
+
+    def page(self, key):
+        """Halaman yang sudah dibuat, atau None kalau belum pernah dibuka."""
+        return self._pages.get(key)
+
+    def open(self, key):
+        with QueryStats.action(f"Open page: {key}"):
+            return self._open(key)
+
+    def _open(self, key):
+        widget = self._pages.get(key)
+        if widget is None:
+            widget = self._factories[key]()
+            self.add(key, widget)
+
+        self.stack.setCurrentWidget(widget)
+        if isinstance(widget, Page):
+            widget.refresh_if_needed()
+        return widget
+
+    def mark_dirty(self):
+        """Tandai semua halaman yang sudah dibuat supaya dimuat ulang saat dibuka lagi."""
+        for widget in self._pages.values():
+            if isinstance(widget, Page):
+                widget.mark_dirty()
@@ -0,0 +1,28 @@
+import json
+import os
+
+# Preferensi aplikasi disimpan di samping database lokal
+SETTINGS_PATH = os.path.join("data", "settings.json")
+
+
+def load_settings():
+    """Baca semua setting; file tidak ada / rusak → dict kosong."""
+    try:
+        with open(SETTINGS_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def get_setting(key, default=None):
+    return load_settings().get(key, default)
+
+
+def set_setting(key, value):
+    settings = load_settings()
+    settings[key] = value
+
+    os.makedirs(os.path.dirname(SETTINGS_PATH), exist_ok=True)
+    with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
+        json.dump(settings, f, indent=4)
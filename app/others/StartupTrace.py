@@ -0,0 +1,70 @@
+import os
+import sys
+import time
+
+# =====================================================================
+# Startup trace
+# ---------------------------------------------------------------------
+# Aktif dengan `python WelcomeToApplyMe.py --trace-startup` atau env
+# APPLYME_TRACE_STARTUP=1. Modul ini di-import paling awal, jadi waktu
+# import modul ini = titik nol. Laporan dicetak setelah window pertama
+# selesai di-paint, termasuk modul berat yang ternyata sudah ter-load.
+# =====================================================================
+
+TRACE_FLAG = "--trace-startup"
+TRACE_ENV = "APPLYME_TRACE_STARTUP"
+
+# Target cold start sampai login window ter-paint (ms)
+STARTUP_BUDGET_MS = 1000
+
+# Modul yang seharusnya belum di-import sebelum user membuka fiturnya
+DEFERRED_MODULES = ("openpyxl", "pandas", "app.MainWindow")
+
+_started = time.perf_counter()
+_marks = []
+
+
+def enabled():
+    return TRACE_FLAG in sys.argv or os.environ.get(TRACE_ENV) == "1"
+
+
+def mark(label):
+    """Catat waktu (ms sejak start) untuk satu tahap startup."""
+    if enabled():
+        _marks.append((label, (time.perf_counter() - _started) * 1000))
+
+
+def report_first_paint(widget):
+    """Cetak laporan setelah paint pertama `widget` selesai."""
+    if not enabled():
+        return
+
+    from PySide6.QtCore import QEvent, QObject, QTimer
+
+    class _FirstPaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                widget.removeEventFilter(self)
+                # singleShot(0): dijalankan setelah event paint ini selesai diproses
+                QTimer.singleShot(0, lambda: _print_report(type(widget).__name__))
+            return False
+
+    widget._first_paint_filter = _FirstPaintFilter(widget)
+    widget.installEventFilter(widget._first_paint_filter)
+
+
+def _print_report(window_name):
+    mark(f"{window_name} first paint")
+    total = _marks[-1][1]
+
+    print("=== Startup trace ===")
+    previous = 0.0
+    for label, at in _marks:
+        print(f"{at:8.1f} ms  (+{at - previous:7.1f})  {label}")
+        previous = at
+
+    loaded = [name for name in DEFERRED_MODULES if name in sys.modules]
+    print(f"Deferred modules already loaded: {', '.join(loaded) if loaded else 'none'}")
+
+    status = "OK" if total <= STARTUP_BUDGET_MS else "OVER BUDGET"
+    print(f"Time to first paint: {total:.1f} ms (budget {STARTUP_BUDGET_MS} ms) — {status}")
@@ -0,0 +1,61 @@
+import traceback
+
+from PySide6.QtCore import QThread, Signal
+
+from app.database import QueryStats
+from app.database.WriteQueue import CommandError
+from app.import_feature.ExcelImportEngine import InvalidExcelFormat
+
+# Penolakan yang diharapkan (file tidak valid, data duplikat, ...): cukup pesan ke user, tanpa traceback
+EXPECTED_ERRORS = (CommandError, InvalidExcelFormat)
+
+
+class TaskWorker(QThread):
+    """Jalankan pekerjaan berat (import / export) di luar UI thread.
+
+    `task(progress, is_cancelled)` dipanggil di thread ini:
+        progress(done, total) → diteruskan sebagai signal `progress`
+        is_cancelled()        → True setelah cancel() dipanggil dari UI
+    Nilai return task dikirim lewat `succeeded`, exception lewat `failed`.
+    `name` dipakai sebagai label action di Query Diagnostics.
+    """
+
+    progress = Signal("qint64", "qint64")  # qint64: ukuran file bisa > 2 GB
+    succeeded = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, task, parent=None, name="Background task"):
+        super().__init__(parent)
+        self.task = task
+        self.name = name
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        try:
+            with QueryStats.action(self.name):
+                result = self.task(self._report_progress, self.is_cancelled)
+        except Exception as e:
+            if not isinstance(e, EXPECTED_ERRORS):
+                traceback.print_exc()
+            self.failed.emit(str(e))
+            return
+        self.succeeded.emit(result)
+
+    def _report_progress(self, done, total):
+        self.progress.emit(int(done), int(total))
+
+
+def attach_progress_dialog(worker, progress_dialog):
+    """Hubungkan worker ke QProgressDialog (skala 0-1000 supaya aman untuk ukuran file besar)."""
+    progress_dialog.setRange(0, 1000)
+    progress_dialog.setValue(0)
+    progress_dialog.canceled.connect(worker.cancel)
+    worker.progress.connect(
+        lambda done, total: progress_dialog.setValue(int(done * 1000 / total) if total else 0)
+    )
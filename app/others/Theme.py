@@ -0,0 +1,226 @@
+# =====================================================================
+# Theme aplikasi
+# ---------------------------------------------------------------------
+# Satu stylesheet untuk seluruh aplikasi, dipasang sekali lewat
+# apply_theme(app). Widget tidak memanggil setStyleSheet sendiri:
+#   - bagian layout tertentu dipilih lewat objectName  (#applicationTable)
+#   - variasi tampilan lewat dynamic property           ([variant="primary"])
+# Perubahan tampilan saat runtime (validasi form, status) cukup ganti
+# property dengan set_state(), yang hanya re-polish widget itu sendiri.
+# Bandingkan biayanya dengan: python -m benchmarks.ThemeBenchmark
+# =====================================================================
+
+STYLESHEET = """
+/* === Umum === */
+QMenu {
+    margin: 8px;
+}
+QMenu[variant="context"] {
+    margin: 5px;
+}
+QMenu::item {
+    padding-left: 12px;
+    padding-right: 10px;
+}
+
+QToolButton[variant="toolbar-menu"] {
+    padding-left: 15px;
+    qproperty-iconSize: 18px;
+}
+
+/* Tombol utama di dialog (Save, Next, Begin Import) */
+QPushButton[variant="primary"] {
+    background-color: #1976d2;
+    color: white;
+}
+
+/* Tombol besar di login, sign up dan forgot password */
+QPushButton[variant="accent"] {
+    background-color: #007BFF;
+    color: white;
+    border-radius: 5px;
+    padding: 8px;
+}
+QPushButton[variant="accent"]:pressed {
+    background-color: #0056b3;
+}
+
+QLabel[role="placeholder"] {
+    font-size: 14px;
+    color: #555;
+}
+QLabel[role="muted"] {
+    color: #bbbbbb;
+}
+
+/* Pesan validasi form: set_state(label, "state", "error" / "success") */
+QLabel[state="error"] {
+    color: red;
+}
+QLabel[state="success"] {
+    color: green;
+}
+QLineEdit[validation="error"] {
+    border: 2px solid red;
+}
+QLineEdit[validation="ok"] {
+    border: 2px solid green;
+}
+
+/* === Main window: side menu === */
+#sideMenuContainer {
+    background-color: #212121;
+    border-right: 1px solid #FFFFFF;
+}
+#sideMenu QPushButton {
+    text-align: left;
+    padding: 10px 16px;
+    font-size: 13px;
+    color: #dddddd;
+    border: none;
+    background-color: transparent;
+}
+#sideMenu QPushButton:hover {
+    background-color: #1f1f1f;
+    color: #ffffff;
+}
+#sideMenu QPushButton:checked {
+    background-color: #2563eb;
+    color: white;
+    font-weight: bold;
+    border-right: none;
+}
+
+/* === Main window: dashboard === */
+#dashboardHeader {
+    color: #EDEDED;
+    margin-bottom: 10px;
+}
+QTableView#applicationTable {
+    background-color: #1e1e1e;
+    color: #ddd;
+    gridline-color: #333;
+    border: none;
+    selection-background-color: #1565c0;
+    selection-color: white;
+}
+#applicationTable QHeaderView::section {
+    background-color: #2b2b2b;
+    color: #ddd;
+    padding: 4px;
+    border: none;
+}
+#runningTimeLabel {
+    font-size: 13px;
+    color: #e0e0e0;
+    background-color: #212121;
+    padding: 6px 10px;
+    border-bottom: 1px solid #333;
+    border-top-left-radius: 6px;
+    border-top-right-radius: 6px;
+}
+QGroupBox#detailsBox {
+    background-color: #212121;
+    border: 1px solid #2e2e2e;
+    border-radius: 8px;
+    margin-top: 6px;
+    color: #e0e0e0;
+    font-weight: 600;
+    font-size: 12.5px;
+    padding-top: 12px;
+}
+QGroupBox#detailsBox::title {
+    subcontrol-origin: margin;
+    subcontrol-position: top left;
+    padding: 0 8px;
+    color: #FFFFFF;
+    font-weight: bold;
+    background-color: #212121;
+}
+QPushButton[variant="detail"] {
+    background-color: #2a2a2a;
+    color: #999;
+    border: 1px solid #444;
+    border-radius: 4px;
+    padding: 5px;
+}
+QPushButton[variant="detail"]:enabled {
+    background-color: #1e88e5;
+    color: white;
+}
+QPushButton[variant="detail"]:hover:enabled {
+    background-color: #1565c0;
+}
+
+/* === Statistics page === */
+QFrame#statCard {
+    background-color: #212121;
+    border: 1px solid #2e2e2e;
+    border-radius: 8px;
+}
+QLabel[role="stat-caption"] {
+    color: #bbbbbb;
+    font-size: 12px;
+}
+QLabel[role="stat-value"] {
+    color: #ffffff;
+    font-size: 24px;
+    font-weight: bold;
+}
+QTableWidget#statisticsTable {
+    background-color: #1e1e1e;
+    color: #ddd;
+    gridline-color: #333;
+    border: none;
+}
+#statisticsTable QHeaderView::section {
+    background-color: #2b2b2b;
+    color: #ddd;
+    padding: 4px;
+    border: none;
+}
+
+/* === Import format dialog === */
+QDialog#importFormatWindow {
+    background-color: #1e1e1e;
+}
+#importFormatWindow QLabel {
+    color: #ffffff;
+    font-size: 14px;
+}
+#importFormatWindow QLabel[role="title"] {
+    font-size: 18px;
+    font-weight: bold;
+}
+#importFormatWindow QLabel[role="subtitle"] {
+    font-size: 12px;
+    color: #bbbbbb;
+    margin-top: 6px;
+}
+#importFormatWindow QPushButton {
+    background-color: #2d2d2d;
+    border: 1px solid #444;
+    border-radius: 6px;
+    padding: 10px;
+    font-size: 13px;
+    color: #fff;
+}
+#importFormatWindow QPushButton:hover {
+    background-color: #3a3a3a;
+}
+"""
+
+
+def apply_theme(app):
+    """Pasang stylesheet aplikasi. Dipanggil sekali setelah QApplication dibuat."""
+    app.setStyleSheet(STYLESHEET)
+
+
+def set_state(widget, name, value):
+    """Ganti dynamic property lalu re-polish widget ini saja (tanpa parse stylesheet baru)."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
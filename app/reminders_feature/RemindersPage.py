@@ -0,0 +1,16 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QVBoxLayout, QLabel
+
+from app.others.PageRegistry import Page
+
+
+class RemindersPage(Page):
+    def __init__(self, session, parent=None):
+        super().__init__(parent)
+        self.session = session
+
+        layout = QVBoxLayout(self)
+        label = QLabel("Reminders Page — coming soon...")
+        label.setAlignment(Qt.AlignCenter)
+        label.setProperty("role", "placeholder")
+        layout.addWidget(label)
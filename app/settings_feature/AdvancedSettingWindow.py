@@ -0,0 +1,96 @@
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QLabel, QComboBox, QFormLayout, QHBoxLayout, QPushButton, QMessageBox, QCheckBox
+)
+
+from app.database import QueryStats
+from app.database.ConnectionProfile import (
+    PROFILES, PROFILE_DESCRIPTIONS, get_active_profile, set_active_profile
+)
+from app.database.Database import engine, reload_connection_profile
+from app.others.Icons import icon
+
+
+class AdvancedSettingWindow(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.setWindowTitle("Advanced Setting")
+        self.setWindowIcon(icon("advanced_setting"))
+        self.setMinimumWidth(460)
+
+        layout = QVBoxLayout()
+
+        header = QLabel("<h2>Advanced Setting</h2>")
+        layout.addWidget(header)
+
+        # ---- Database connection profile ----
+        self.profile_input = QComboBox()
+        self.profile_input.addItems(list(PROFILES))
+        self.profile_input.setCurrentText(get_active_profile())
+
+        self.profile_desc = QLabel()
+        self.profile_desc.setWordWrap(True)
+        self.profile_desc.setProperty("role", "muted")
+        self.profile_input.currentTextChanged.connect(self.update_description)
+        self.update_description(self.profile_input.currentText())
+
+        # ---- Query diagnostics ----
+        self.diagnostics_input = QCheckBox("Record query count and time per action")
+        self.diagnostics_input.setChecked(QueryStats.is_enabled())
+
+        btn_diagnostics = QPushButton("Open Query Diagnostics...")
+        btn_diagnostics.clicked.connect(self.open_diagnostics)
+
+        form = QFormLayout()
+        form.addRow("Database Profile", self.profile_input)
+        form.addRow("", self.profile_desc)
+        form.addRow("Query diagnostics", self.diagnostics_input)
+        form.addRow("", btn_diagnostics)
+        layout.addLayout(form)
+
+        # ---- Buttons ----
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+
+        btn_cancel = QPushButton("Cancel")
+        btn_save = QPushButton("Save")
+        btn_save.setProperty("variant", "primary")
+
+        btn_cancel.clicked.connect(self.reject)
+        btn_save.clicked.connect(self.save)
+
+        btn_layout.addWidget(btn_cancel)
+        btn_layout.addWidget(btn_save)
+
+        layout.addSpacing(10)
+        layout.addLayout(btn_layout)
+        self.setLayout(layout)
+
+    def update_description(self, name):
+        self.profile_desc.setText(PROFILE_DESCRIPTIONS.get(name, ""))
+
+    def open_diagnostics(self):
+        from app.settings_feature.QueryDiagnosticsWindow import QueryDiagnosticsWindow
+        QueryDiagnosticsWindow(self).exec()
+
+    def save(self):
+        if self.diagnostics_input.isChecked() != QueryStats.is_enabled():
+            QueryStats.set_enabled(self.diagnostics_input.isChecked(), engine)
+
+        name = self.profile_input.currentText()
+        if name != get_active_profile():
+            set_active_profile(name)
+            # koneksi berikutnya memakai PRAGMA baru; journal_mode baru setelah restart
+            if reload_connection_profile():
+                QMessageBox.information(
+                    self, "Saved",
+                    f"Database profile changed to '{name}'.\n"
+                    f"Restart the app to switch the journal mode to {PROFILES[name]['journal_mode']}.",
+                )
+            else:
+                QMessageBox.information(self, "Saved", f"Database profile changed to '{name}'.")
+        self.accept()
+
+    # === Dibuka dari menu Preferences → Advanced Setting ===
+    def open_advanced_setting_window(self):
+        AdvancedSettingWindow(self).exec()
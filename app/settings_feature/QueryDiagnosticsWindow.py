@@ -0,0 +1,123 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+    QTextEdit, QHeaderView, QAbstractItemView, QSplitter
+)
+
+from app.database import QueryStats
+from app.others.Icons import icon
+
+
+class QueryDiagnosticsWindow(QDialog):
+    """Jumlah & durasi query per action, dan query lambat beserta query plan-nya."""
+
+    ACTION_HEADERS = ["Action", "Runs", "Queries", "Queries / run", "Total ms", "Max ms"]
+    SLOW_HEADERS = ["Time", "ms", "Action", "Statement"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.setWindowTitle("Query Diagnostics")
+        self.setWindowIcon(icon("advanced_setting"))
+        self.resize(820, 560)
+
+        layout = QVBoxLayout()
+
+        self.status_label = QLabel()
+        self.status_label.setWordWrap(True)
+        self.status_label.setProperty("role", "muted")
+        layout.addWidget(self.status_label)
+
+        # ---- Query per action ----
+        self.action_table = self._make_table(self.ACTION_HEADERS)
+
+        # ---- Query lambat ----
+        self.slow_table = self._make_table(self.SLOW_HEADERS)
+        self.slow_table.currentCellChanged.connect(lambda row, *_: self.show_slow_query(row))
+
+        self.slow_detail = QTextEdit()
+        self.slow_detail.setReadOnly(True)
+        self.slow_detail.setLineWrapMode(QTextEdit.NoWrap)
+
+        splitter = QSplitter(Qt.Vertical)
+        splitter.addWidget(self.action_table)
+        splitter.addWidget(self.slow_table)
+        splitter.addWidget(self.slow_detail)
+        layout.addWidget(splitter)
+
+        # ---- Buttons ----
+        btn_layout = QHBoxLayout()
+        btn_reset = QPushButton("Reset")
+        btn_refresh = QPushButton("Refresh")
+        btn_close = QPushButton("Close")
+        btn_close.setProperty("variant", "primary")
+
+        btn_reset.clicked.connect(self.reset)
+        btn_refresh.clicked.connect(self.refresh)
+        btn_close.clicked.connect(self.accept)
+
+        btn_layout.addWidget(btn_reset)
+        btn_layout.addStretch()
+        btn_layout.addWidget(btn_refresh)
+        btn_layout.addWidget(btn_close)
+        layout.addLayout(btn_layout)
+
+        self.setLayout(layout)
+        self.slow_queries = []
+        self.refresh()
+
+    def _make_table(self, headers):
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        table.horizontalHeader().setStretchLastSection(True)
+        return table
+
+    def refresh(self):
+        if QueryStats.is_enabled():
+            self.status_label.setText(
+                f"Recording. Queries slower than {QueryStats.SLOW_QUERY_MS} ms are also written to "
+                f"{QueryStats.LOG_PATH}."
+            )
+        else:
+            self.status_label.setText("Recording is off. Turn on \"Query diagnostics\" in Advanced Setting.")
+
+        actions, self.slow_queries = QueryStats.snapshot()
+
+        self.action_table.setRowCount(len(actions))
+        for row, stats in enumerate(actions):
+            values = [
+                stats.label, stats.runs, stats.queries, f"{stats.queries_per_run:.1f}",
+                f"{stats.total_ms:.1f}", f"{stats.max_ms:.1f}",
+            ]
+            for column, value in enumerate(values):
+                self.action_table.setItem(row, column, QTableWidgetItem(str(value)))
+
+        self.slow_table.setRowCount(len(self.slow_queries))
+        for row, slow in enumerate(self.slow_queries):
+            values = [
+                slow.at.strftime("%H:%M:%S"), f"{slow.elapsed_ms:.1f}", slow.action,
+                " ".join(slow.statement.split())[:200],
+            ]
+            for column, value in enumerate(values):
+                self.slow_table.setItem(row, column, QTableWidgetItem(value))
+        self.slow_detail.clear()
+
+    def show_slow_query(self, row):
+        if row < 0 or row >= len(self.slow_queries):
+            self.slow_detail.clear()
+            return
+
+        slow = self.slow_queries[row]
+        text = slow.statement.strip()
+        if slow.parameters:
+            text += f"\n\n-- params: {slow.parameters!r}"
+        text += "\n\n-- EXPLAIN QUERY PLAN\n" + (slow.plan or "(not available)")
+        self.slow_detail.setPlainText(text)
+
+    def reset(self):
+        QueryStats.reset()
+        self.refresh()
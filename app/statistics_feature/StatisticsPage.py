@@ -0,0 +1,324 @@
+import time
+
+from PySide6.QtCharts import QBarCategoryAxis, QBarSeries, QBarSet, QChart, QChartView, QValueAxis
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QPainter
+from PySide6.QtWidgets import (
+    QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QFrame, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView, QToolButton, QMenu, QFileDialog, QMessageBox
+)
+
+from app.database.Database import engine
+from app.database.StatisticsRollup import load_summary
+from app.database.StatusAnalytics import GROUPS, REPORTS, REPORT_COLUMNS, export_report_csv, report_rows, timeline_cache
+from app.others.PageRegistry import Page
+from app.others.TaskWorker import TaskWorker
+
+# (label, jumlah minggu) untuk grafik lamaran per minggu
+PERIODS = [("Last 12 weeks", 12), ("Last 26 weeks", 26), ("Last 52 weeks", 52)]
+
+# Urutan tahap untuk tabel status; status lain ditampilkan setelahnya
+STATUS_ORDER = ["Applied", "Phone Screen", "Interview", "Offer", "Rejected", "Withdrawn"]
+
+
+def _percent(part, whole):
+    return f"{part / whole * 100:.1f}%" if whole else "-"
+
+
+def _format_cell(value):
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return value
+
+
+class StatCard(QFrame):
+    """Satu KPI: angka besar + keterangan di bawahnya."""
+
+    def __init__(self, caption, parent=None):
+        super().__init__(parent)
+        self.setObjectName("statCard")
+
+        layout = QVBoxLayout(self)
+        self.value_label = QLabel("-")
+        self.value_label.setProperty("role", "stat-value")
+        self.detail_label = QLabel("")
+        self.detail_label.setProperty("role", "muted")
+        caption_label = QLabel(caption)
+        caption_label.setProperty("role", "stat-caption")
+
+        layout.addWidget(caption_label)
+        layout.addWidget(self.value_label)
+        layout.addWidget(self.detail_label)
+
+    def set_value(self, value, detail=""):
+        self.value_label.setText(value)
+        self.detail_label.setText(detail)
+
+
+class StatisticsPage(Page):
+    """Statistik lamaran.
+
+    Kartu, grafik dan tabel atas dibaca dari tabel rollup harian (StatisticsRollup.py);
+    funnel dan waktu per tahap dihitung dari timeline status_history (StatusAnalytics.py)
+    di worker thread; timeline dibaca penuh sekali, sesudahnya hanya lamaran yang berubah.
+    Ganti grup cukup mengelompokkan ulang timeline yang sama.
+    """
+
+    def __init__(self, session, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self.timeline = None
+        self.worker = None
+        self._reload_timeline = False
+        self.summary_ms = 0.0
+        self.analytics_ms = None
+
+        layout = QVBoxLayout(self)
+
+        # ---- Header ----
+        header_layout = QHBoxLayout()
+        header_label = QLabel("STATISTICS")
+        header_label.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        header_label.setObjectName("dashboardHeader")
+
+        self.period_dropdown = QComboBox()
+        for label, weeks in PERIODS:
+            self.period_dropdown.addItem(label, weeks)
+        self.period_dropdown.currentIndexChanged.connect(lambda _: self._load_summary())
+
+        header_layout.addWidget(header_label)
+        header_layout.addStretch()
+        header_layout.addWidget(self.period_dropdown)
+        layout.addLayout(header_layout)
+
+        # ---- KPI cards ----
+        cards_layout = QHBoxLayout()
+        self.total_card = StatCard("Total applied")
+        self.interview_card = StatCard("Interviews")
+        self.offer_card = StatCard("Offers")
+        self.response_card = StatCard("Response rate")
+        self.response_time_card = StatCard("Avg. response time")
+        for card in (self.total_card, self.interview_card, self.offer_card, self.response_card,
+                     self.response_time_card):
+            cards_layout.addWidget(card)
+        layout.addLayout(cards_layout)
+
+        # ---- Lamaran per minggu ----
+        self.chart = QChart()
+        self.chart.setTheme(QChart.ChartThemeDark)
+        self.chart.setTitle("Applications per week")
+        self.chart.legend().hide()
+
+        # Series & axis dibuat sekali; load() hanya mengganti isinya
+        self.bar_set = QBarSet("Applied")
+        series = QBarSeries()
+        series.append(self.bar_set)
+        self.chart.addSeries(series)
+        self.x_axis = QBarCategoryAxis()
+        self.y_axis = QValueAxis()
+        self.y_axis.setLabelFormat("%d")
+        self.chart.addAxis(self.x_axis, Qt.AlignBottom)
+        self.chart.addAxis(self.y_axis, Qt.AlignLeft)
+        series.attachAxis(self.x_axis)
+        series.attachAxis(self.y_axis)
+
+        self.chart_view = QChartView(self.chart)
+        self.chart_view.setRenderHint(QPainter.Antialiasing)
+        self.chart_view.setMinimumHeight(260)
+        layout.addWidget(self.chart_view, 1)
+
+        # ---- Per status & per source ----
+        tables_layout = QHBoxLayout()
+        self.status_table = self._make_table(["Stage reached", "Count", "% of applied"])
+        self.source_table = self._make_table(["Source", "Applied", "Share"])
+        tables_layout.addWidget(self.status_table)
+        tables_layout.addWidget(self.source_table)
+        layout.addLayout(tables_layout)
+
+        # ---- Funnel & waktu per tahap (dari status_history) ----
+        analytics_header = QHBoxLayout()
+        analytics_label = QLabel("Funnel and time in stage")
+        analytics_label.setProperty("role", "stat-caption")
+
+        self.group_dropdown = QComboBox()
+        for key, label in GROUPS.items():
+            self.group_dropdown.addItem(f"By {label.lower()}" if key != "all" else label, key)
+        self.group_dropdown.setCurrentIndex(self.group_dropdown.findData("source"))
+        self.group_dropdown.currentIndexChanged.connect(lambda _: self._fill_analytics())
+
+        self.export_button = QToolButton()
+        self.export_button.setText("Export")
+        self.export_button.setPopupMode(QToolButton.InstantPopup)
+        self.export_button.setProperty("variant", "toolbar-menu")
+        export_menu = QMenu(self.export_button)
+        for report, title in REPORTS.items():
+            action = export_menu.addAction(f"{title} to CSV")
+            action.triggered.connect(lambda _=False, report=report: self._export_report(report))
+        self.export_button.setMenu(export_menu)
+        self.export_button.setEnabled(False)
+
+        analytics_header.addWidget(analytics_label)
+        analytics_header.addStretch()
+        analytics_header.addWidget(self.group_dropdown)
+        analytics_header.addWidget(self.export_button)
+        layout.addLayout(analytics_header)
+
+        analytics_layout = QHBoxLayout()
+        self.funnel_table = self._make_table([header for header, _ in REPORT_COLUMNS["funnel"]])
+        self.stage_table = self._make_table([header for header, _ in REPORT_COLUMNS["stages"]])
+        for table in (self.funnel_table, self.stage_table):
+            # Banyak kolom angka: lebar sesuai isi supaya header tidak terpotong
+            table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+            table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        analytics_layout.addWidget(self.funnel_table, 3)
+        analytics_layout.addWidget(self.stage_table, 2)
+        layout.addLayout(analytics_layout)
+
+        self.footer_label = QLabel()
+        self.footer_label.setProperty("role", "muted")
+        layout.addWidget(self.footer_label)
+
+    def _make_table(self, headers):
+        table = QTableWidget(0, len(headers))
+        table.setObjectName("statisticsTable")
+        table.setHorizontalHeaderLabels(headers)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionMode(QAbstractItemView.NoSelection)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        return table
+
+    def load(self):
+        self._load_summary()
+        self._start_timeline()
+
+    def _load_summary(self):
+        start = time.perf_counter()
+        weeks = self.period_dropdown.currentData()
+        summary = load_summary(self.session.connection(), weeks=weeks)
+
+        total = summary.total_applied
+        interviews = summary.entered.get("Interview", 0)
+        offers = summary.entered.get("Offer", 0)
+
+        self.total_card.set_value(f"{total:,}", f"{sum(c for _, c in summary.weekly):,} in the selected period")
+        self.interview_card.set_value(f"{interviews:,}", f"{_percent(interviews, total)} of applied")
+        self.offer_card.set_value(f"{offers:,}", f"{_percent(offers, interviews)} of interviews")
+        self.response_card.set_value(_percent(summary.responses, total), f"{summary.responses:,} responded")
+        if summary.responses:
+            self.response_time_card.set_value(f"{summary.response_days / summary.responses:.1f} days", "first reply")
+        else:
+            self.response_time_card.set_value("-", "no replies yet")
+
+        self._load_chart(summary.weekly)
+
+        statuses = [s for s in STATUS_ORDER if s in summary.entered]
+        statuses += sorted(s for s in summary.entered if s not in STATUS_ORDER)
+        self._fill_table(self.status_table, [
+            (status or "(empty)", f"{summary.entered[status]:,}", _percent(summary.entered[status], total))
+            for status in statuses
+        ])
+        self._fill_table(self.source_table, [
+            (source or "(empty)", f"{count:,}", _percent(count, total))
+            for source, count in summary.by_source.items()
+        ])
+
+        self.summary_ms = (time.perf_counter() - start) * 1000
+        self._update_footer()
+
+    # === Funnel & waktu per tahap ===
+    def _start_timeline(self):
+        if self.worker is not None and self.worker.isRunning():
+            self._reload_timeline = True  # data berubah lagi selama dihitung → ulangi setelah selesai
+            return
+        self._reload_timeline = False
+        self.analytics_ms = None
+        self._update_footer()
+
+        def task(progress, is_cancelled):
+            start = time.perf_counter()
+            with engine.connect() as conn:
+                timeline = timeline_cache().get(conn)
+            return timeline, (time.perf_counter() - start) * 1000
+
+        self.worker = TaskWorker(task, self, name="Statistics analytics")
+        self.worker.succeeded.connect(self._timeline_loaded)
+        self.worker.failed.connect(
+            lambda message: QMessageBox.critical(self, "Error", f"Failed to compute the funnel:\n{message}")
+        )
+        self.worker.start()
+
+    def _timeline_loaded(self, result):
+        if self._reload_timeline:
+            self._start_timeline()
+            return
+        self.timeline, load_ms = result
+        start = time.perf_counter()
+        self._fill_analytics()
+        self.analytics_ms = load_ms + (time.perf_counter() - start) * 1000
+        self.export_button.setEnabled(True)
+        self._update_footer()
+
+    def _fill_analytics(self):
+        if self.timeline is None:
+            return
+        group_by = self.group_dropdown.currentData()
+        for table, report in ((self.funnel_table, "funnel"), (self.stage_table, "stages")):
+            self._fill_table(table, [
+                [_format_cell(value) for value in row] for row in report_rows(report, self.timeline, group_by)
+            ])
+
+    def _export_report(self, report):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            f"Save {REPORTS[report].lower()} as CSV",
+            "",
+            "CSV Files (*.csv)"
+        )
+        if not file_path:
+            return
+        try:
+            export_report_csv(file_path, report, self.timeline, self.group_dropdown.currentData())
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Failed to export:\n{e}")
+            return
+        QMessageBox.information(self, "Success", f"Data successfully exported to:\n{file_path}")
+
+    def _update_footer(self):
+        text = f"Loaded from daily rollups in {self.summary_ms:.0f} ms"
+        if self.analytics_ms is None:
+            text += " · computing funnel from status history..."
+        else:
+            text += (
+                f" · funnel from {self.timeline.history_count:,} status changes in {self.analytics_ms:.0f} ms"
+            )
+        self.footer_label.setText(text)
+
+    def _load_chart(self, weekly):
+        counts = [count for _, count in weekly]
+        self.bar_set.remove(0, self.bar_set.count())
+        self.bar_set.append(counts)
+
+        self.x_axis.clear()
+        self.x_axis.append([start.strftime("%d %b") for start, _ in weekly])
+        # Periode panjang: label per minggu terpotong ("..."), cukup tampilkan rentangnya
+        long_period = len(weekly) > 12
+        self.x_axis.setLabelsVisible(not long_period)
+        self.x_axis.setTitleText(
+            f"Weeks from {weekly[0][0]:%d %b %Y} to {weekly[-1][0]:%d %b %Y}" if long_period else ""
+        )
+        self.y_axis.setRange(0, max(counts + [1]))
+        self.y_axis.applyNiceNumbers()
+
+    def _fill_table(self, table, rows):
+        table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, column, item)
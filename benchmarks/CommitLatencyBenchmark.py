@@ -0,0 +1,67 @@
+"""Bandingkan latency commit SQLite untuk setiap connection profile.
+
+Jalankan dari root project:
+    python -m benchmarks.CommitLatencyBenchmark --commits 500
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.database.ConnectionProfile import PROFILES, apply_journal_mode, apply_profile
+from app.database.Database import Base
+from app.database.Models import Application
+
+
+def bench_profile(name, commits):
+    with tempfile.TemporaryDirectory(prefix="apply_me_bench_") as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        event.listen(engine, "connect", lambda dbapi_connection, record: apply_profile(dbapi_connection, name))
+        with engine.connect() as conn:
+            apply_journal_mode(conn.connection.dbapi_connection, name)
+        Base.metadata.create_all(bind=engine)
+
+        session = sessionmaker(bind=engine)()
+        timings = []
+        try:
+            for i in range(commits):
+                session.add(Application(
+                    id=f"BE{i:06d}", company_name=f"Bench {i}", position="Engineer",
+                    status="Applied", created_at=datetime.now(),
+                ))
+                start = time.perf_counter()
+                session.commit()  # satu lamaran = satu transaksi, seperti dialog Add
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            session.close()
+            engine.dispose()
+
+    timings.sort()
+    return {
+        "profile": name,
+        "commits": commits,
+        "mean_ms": statistics.mean(timings),
+        "p50_ms": timings[len(timings) // 2],
+        "p95_ms": timings[max(int(len(timings) * 0.95) - 1, 0)],
+        "total_s": sum(timings) / 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commits", type=int, default=500, help="jumlah commit per profile")
+    args = parser.parse_args()
+
+    print(f"{'Profile':<12} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'total s':>9}")
+    for name in PROFILES:
+        r = bench_profile(name, args.commits)
+        print(f"{r['profile']:<12} {r['mean_ms']:>9.3f} {r['p50_ms']:>9.3f} {r['p95_ms']:>9.3f} {r['total_s']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
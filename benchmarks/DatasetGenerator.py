@@ -0,0 +1,214 @@
+"""Buat database SQLite sintetis dengan data lamaran yang realistis.
+
+Isi: applications (+ index FTS), status_history sesuai alur status tiap lamaran,
+contacts dan reminders. Hasil sama untuk seed yang sama.
+
+Jalankan dari root project:
+    python -m benchmarks.DatasetGenerator --rows 100000 --out /tmp/apply_me_100k.db
+"""
+import argparse
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, event, insert
+
+from app.database.ConnectionProfile import apply_journal_mode, apply_profile
+from app.database.Database import Base
+from app.database.FullTextSearch import deferred_fts_sync, load_fts_state
+from app.database.IdAllocator import format_id, make_prefix, seed_sequences
+from app.database.Migrations import run_migrations
+from app.database.Models import Application, Contact, Reminder, StatusHistory
+from app.database.StatisticsRollup import deferred_rollup_sync
+
+CHUNK_SIZE = 10000
+
+COMPANY_WORDS = [
+    "Tokopedia", "Gojek", "Traveloka", "Bukalapak", "Shopee", "Grab", "Telkom", "Mandiri",
+    "Astra", "Indosat", "Blibli", "Xendit", "Ruangguru", "Halodoc", "Kredivo", "Akulaku",
+    "Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Hooli", "Vandelay",
+]
+COMPANY_SUFFIXES = ["", " Indonesia", " Group", " Tbk", " Labs", " Digital", " Asia"]
+POSITIONS = [
+    "Software Engineer", "Backend Engineer", "Frontend Engineer", "Data Analyst", "Data Engineer",
+    "QA Engineer", "Product Manager", "DevOps Engineer", "Mobile Developer", "UI/UX Designer",
+]
+LOCATIONS = ["Jakarta", "Bandung", "Surabaya", "Yogyakarta", "Bali", "Singapore", "Remote"]
+SOURCES = ["LinkedIn", "JobStreet", "Glints", "Kalibrr", "Referral", "Company Website", "Indeed"]
+NOTE_WORDS = (
+    "follow up recruiter interview technical test offer salary benefit remote hybrid team "
+    "culture stack python django react kubernetes deadline portfolio reference call email"
+).split()
+CONTACT_ROLES = ["Recruiter", "Hiring Manager", "Engineer", "HR"]
+
+# Alur status: setiap lamaran berhenti di salah satu tahap
+PIPELINE = ["Applied", "Phone Screen", "Interview", "Offer"]
+# Peluang lanjut ke tahap berikutnya; kalau tidak lanjut → berhenti / Rejected / Withdrawn
+ADVANCE_CHANCE = {"Applied": 0.45, "Phone Screen": 0.55, "Interview": 0.35}
+
+START_DATE = date(2023, 1, 1)
+DAYS = 1000
+
+
+def _application_row(rng, counters):
+    company = rng.choice(COMPANY_WORDS) + rng.choice(COMPANY_SUFFIXES)
+    prefix = make_prefix(company)
+    counters[prefix] = counters.get(prefix, 0) + 1
+
+    applied = START_DATE + timedelta(days=rng.randrange(DAYS))
+    created_at = datetime.combine(applied, datetime.min.time()) + timedelta(seconds=rng.randrange(86400))
+    salary = "" if rng.random() < 0.3 else f"{rng.randrange(50, 400) * 100000:,}.00"
+    notes = " ".join(rng.choices(NOTE_WORDS, k=rng.randrange(0, 60)))
+
+    return {
+        "id": format_id(prefix, counters[prefix]),
+        "company_name": company,
+        "position": rng.choice(POSITIONS),
+        "location": rng.choice(LOCATIONS),
+        "date_applied": applied,
+        "source": rng.choice(SOURCES),
+        "status": "Applied",  # diisi sesuai history di _history_rows
+        "salary_expectation": salary,
+        "notes": notes,
+        "created_at": created_at,
+    }
+
+
+def _history_rows(rng, app):
+    """Riwayat status satu lamaran; app["status"] ikut diisi dengan status terakhir."""
+    statuses = ["Applied"]
+    while statuses[-1] in ADVANCE_CHANCE:
+        if rng.random() < ADVANCE_CHANCE[statuses[-1]]:
+            statuses.append(PIPELINE[PIPELINE.index(statuses[-1]) + 1])
+        else:
+            if rng.random() < 0.6:
+                statuses.append(rng.choice(["Rejected", "Rejected", "Rejected", "Withdrawn"]))
+            break
+
+    rows = []
+    at = app["created_at"]
+    old = None
+    for i, status in enumerate(statuses):
+        if i:
+            at += timedelta(days=rng.randrange(2, 21), seconds=rng.randrange(86400))
+        rows.append({
+            "application_id": app["id"],
+            "old_status": old,
+            "new_status": status,
+            "updated_at": at,
+            "active_status": "Y" if i == len(statuses) - 1 else "N",
+        })
+        old = status
+
+    app["status"] = statuses[-1]
+    if len(statuses) > 1:
+        app["updated_at"] = at
+    return rows
+
+
+def _contact_rows(rng, app):
+    rows = []
+    for _ in range(rng.choice([0, 0, 1, 1, 2])):
+        first = rng.choice(["Andi", "Budi", "Citra", "Dewi", "Eka", "Fajar", "Gita", "Hana"])
+        rows.append({
+            "application_id": app["id"],
+            "name": f"{first} {rng.choice(['Pratama', 'Saputra', 'Wijaya', 'Lestari'])}",
+            "role": rng.choice(CONTACT_ROLES),
+            "email": f"{first.lower()}@{app['company_name'].split()[0].lower()}.example",
+            "phone": f"08{rng.randrange(10**9, 10**10)}",
+            "notes": "",
+        })
+    return rows
+
+
+def _reminder_rows(rng, app):
+    if rng.random() < 0.5:
+        return []
+    return [{
+        "application_id": app["id"],
+        "remind_at": app["created_at"] + timedelta(days=rng.randrange(3, 30)),
+        "message": f"Follow up {app['company_name']}",
+        "done": rng.random() < 0.7,
+    }]
+
+
+def generate(engine, rows, seed=42, chunk_size=CHUNK_SIZE, progress=None):
+    """Isi database `engine` (schema dibuat kalau belum ada) dengan `rows` lamaran.
+
+    Return dict jumlah baris per tabel.
+    """
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    with engine.connect() as conn:
+        load_fts_state(conn)
+
+    rng = random.Random(seed)
+    counters = {}
+    counts = {"applications": 0, "status_history": 0, "contacts": 0, "reminders": 0}
+
+    while counts["applications"] < rows:
+        size = min(chunk_size, rows - counts["applications"])
+        apps, histories, contacts, reminders = [], [], [], []
+        for _ in range(size):
+            app = _application_row(rng, counters)
+            app["updated_at"] = None
+            histories.extend(_history_rows(rng, app))
+            contacts.extend(_contact_rows(rng, app))
+            reminders.extend(_reminder_rows(rng, app))
+            apps.append(app)
+
+        with engine.begin() as conn:
+            with deferred_rollup_sync(conn):
+                with deferred_fts_sync(conn):
+                    conn.execute(insert(Application.__table__), apps)
+                conn.execute(insert(StatusHistory.__table__), histories)
+            if contacts:
+                conn.execute(insert(Contact.__table__), contacts)
+            if reminders:
+                conn.execute(insert(Reminder.__table__), reminders)
+
+        counts["applications"] += len(apps)
+        counts["status_history"] += len(histories)
+        counts["contacts"] += len(contacts)
+        counts["reminders"] += len(reminders)
+        if progress:
+            progress(counts["applications"], rows)
+
+    with engine.begin() as conn:
+        seed_sequences(conn)  # ID dari app (dialog Add, import) lanjut setelah ID sintetis
+        conn.exec_driver_sql("ANALYZE")
+    return counts
+
+
+def create_database(path, rows, seed=42):
+    """Buat file database baru di `path` (file lama ditimpa)."""
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    engine = create_engine(f"sqlite:///{path}")
+    event.listen(engine, "connect", lambda dbapi_connection, record: apply_profile(dbapi_connection))
+    with engine.connect() as conn:
+        apply_journal_mode(conn.connection.dbapi_connection)
+    try:
+        return generate(engine, rows, seed)
+    finally:
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000, help="jumlah lamaran (1000 - 1000000)")
+    parser.add_argument("--out", required=True, help="path file SQLite yang dibuat")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    counts = create_database(args.out, args.rows, args.seed)
+    elapsed = time.perf_counter() - start
+    print(", ".join(f"{table}: {count}" for table, count in counts.items()) + f" ({elapsed:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""Benchmark suite: tabel dashboard, search, import dan export pada dataset sintetis.
+
+Setiap ukuran dataset dibuat ulang di folder sementara (lihat DatasetGenerator.py),
+lalu jalur yang sama dengan aplikasi diukur tanpa window terlihat
+(QT_QPA_PLATFORM=offscreen). Hasil disimpan sebagai JSON supaya bisa dibandingkan
+antar commit.
+
+Jalankan dari root project:
+    python -m benchmarks.SuiteBenchmark --rows 1000 10000 100000 --repeat 5
+    python -m benchmarks.SuiteBenchmark --rows 10000 --compare benchmarks/results/<hasil lama>.json
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import partial
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "benchmarks", "results")
+
+SEARCH_TERMS = ["tokopedia", "engineer jakarta", "kubernetes", "zzzz"]
+
+# Selisih median yang dianggap regresi / lebih cepat saat --compare
+DEFAULT_THRESHOLD = 0.10
+
+# Batas waktu menunggu hasil search di worker thread (detik)
+SEARCH_TIMEOUT = 30
+
+
+def _git_commit():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=PROJECT_ROOT, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, bool(dirty)
+
+
+def _environment():
+    import PySide6
+    import sqlalchemy
+
+    commit, dirty = _git_commit()
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "sqlalchemy": sqlalchemy.__version__,
+        "pyside6": PySide6.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def measure(function, repeat, setup=None):
+    """Jalankan function() `repeat` kali; return ringkasan durasi (ms)."""
+    runs = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        function()
+        runs.append((time.perf_counter() - start) * 1000)
+    return {
+        "runs_ms": [round(ms, 3) for ms in runs],
+        "median_ms": round(statistics.median(runs), 3),
+        "min_ms": round(min(runs), 3),
+    }
+
+
+# === Dataset ===
+def prepare_database(rows, seed):
+    """Buat ulang data/apply_me.db (relatif ke folder kerja sementara) berisi `rows` lamaran."""
+    from app.database.Database import engine, init_db
+    from benchmarks.DatasetGenerator import generate
+
+    engine.dispose()
+    for suffix in ("", "-wal", "-shm"):
+        path = os.path.join("data", "apply_me.db") + suffix
+        if os.path.exists(path):
+            os.remove(path)
+    os.makedirs("data", exist_ok=True)
+
+    counts = generate(engine, rows, seed)
+    init_db()
+    return counts
+
+
+def write_import_files(count, seed, with_excel):
+    """File CSV & Excel dengan `count` baris untuk benchmark import; return (csv_path, xlsx_path)."""
+    from benchmarks.DatasetGenerator import _application_row, _history_rows
+    from app.import_feature.ExcelImportEngine import REQUIRED_COLUMNS
+
+    rng = random.Random(seed + 1)
+    counters = {}
+    records = []
+    for _ in range(count):
+        app = _application_row(rng, counters)
+        _history_rows(rng, app)
+        record = {column: app[column] for column in REQUIRED_COLUMNS}
+        record["date_applied"] = app["date_applied"].isoformat()
+        # Kolom wajib import CSV tidak boleh kosong
+        record["salary_expectation"] = record["salary_expectation"] or "10,000,000.00"
+        record["notes"] = record["notes"] or "imported"
+        records.append(record)
+
+    csv_path = os.path.abspath("import.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=REQUIRED_COLUMNS)
+        writer.writeheader()
+        writer.writerows(records)
+
+    xlsx_path = None
+    if with_excel:
+        from openpyxl import Workbook
+
+        xlsx_path = os.path.abspath("import.xlsx")
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(REQUIRED_COLUMNS)
+        for record in records:
+            sheet.append([record[column] for column in REQUIRED_COLUMNS])
+        workbook.save(xlsx_path)
+
+    return csv_path, xlsx_path, records
+
+
+# === Benchmarks ===
+def bench_dashboard(app, repeat):
+    from app.MainWindow import MainWindow
+    from PySide6.QtCore import QModelIndex
+
+    results = {}
+    windows = []
+
+    def open_window():
+        window = MainWindow()
+        window.show()
+        app.processEvents()
+        windows.append(window)
+
+    results["main_window_open"] = measure(open_window, repeat)
+    window = windows[-1]
+    for other in windows[:-1]:
+        other.close()
+        other.deleteLater()
+    app.processEvents()
+
+    def load_data():
+        window.load_data()
+        app.processEvents()
+
+    results["load_data"] = measure(load_data, repeat)
+
+    model = window.table_model
+
+    def fetch_ten_pages():
+        for _ in range(10):
+            if not model.canFetchMore(QModelIndex()):
+                break
+            model.fetchMore(QModelIndex())
+
+    results["fetch_more_x10"] = measure(fetch_ten_pages, repeat, setup=model.refresh)
+
+    for term in SEARCH_TERMS:
+        results[f"search_applications[{term}]"] = measure(
+            partial(_search, app, window, term), repeat, setup=partial(_search, app, window, "")
+        )
+
+    return window, results
+
+
+def _search(app, window, term):
+    """search_applications() sampai hasil halaman pertama terpasang di model."""
+    done = []
+    window.table_model.modelReset.connect(lambda: done.append(True))
+    window.search_bar.blockSignals(True)
+    window.search_bar.setText(term)
+    window.search_bar.blockSignals(False)
+    window.search_applications(delay=0)
+
+    deadline = time.monotonic() + SEARCH_TIMEOUT
+    while not done and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.0005)
+    window.table_model.modelReset.disconnect()
+    if not done:
+        raise TimeoutError(f"search '{term}' did not finish")
+
+
+def bench_export(repeat, with_excel):
+    from app.export_feature.ExportEngine import export_csv, export_excel
+
+    results = {"export_csv": measure(lambda: export_csv(os.path.abspath("export.csv")), repeat)}
+    if with_excel:
+        results["export_excel"] = measure(lambda: export_excel(os.path.abspath("export.xlsx")), repeat)
+    return results
+
+
+def bench_import(repeat, csv_path, xlsx_path, records, json_records):
+    """Import menambah data; dijalankan paling akhir supaya benchmark baca tidak terpengaruh."""
+    from app.database.WriteCommands import save_application
+    from app.database.WriteQueue import write_queue
+    from app.import_feature.CSVImportEngine import import_csv
+    from app.import_feature.ExcelImportEngine import import_excel
+
+    results = {}
+    mapping = {column: column for column in records[0]}
+    results["import_csv"] = measure(lambda: import_csv(csv_path, mapping), repeat)
+    if xlsx_path:
+        results["import_excel"] = measure(lambda: import_excel(xlsx_path), repeat)
+
+    # Import JSON = satu save_application per record lewat thread writer (seperti dialog JSON)
+    values = []
+    for record in records[:json_records]:
+        value = dict(record)
+        value["date_applied"] = datetime.strptime(record["date_applied"], "%Y-%m-%d").date()
+        values.append(value)
+
+    queue = write_queue()
+
+    def json_sequential():
+        for value in values:
+            queue.call(partial(save_application, values=value))
+
+    def json_batched():
+        requests = [queue.submit(partial(save_application, values=value)) for value in values]
+        for request in requests:
+            request.done.wait()
+
+    results[f"import_json_x{len(values)}_sequential"] = measure(json_sequential, repeat)
+    results[f"import_json_x{len(values)}_batched"] = measure(json_batched, repeat)
+    return results
+
+
+def run_size(app, rows, args, with_excel):
+    print(f"--- {rows} rows ---", flush=True)
+    start = time.perf_counter()
+    counts = prepare_database(rows, args.seed)
+    print(f"dataset: {counts} ({time.perf_counter() - start:.1f} s)", flush=True)
+
+    import_rows = min(rows, args.import_rows)
+    csv_path, xlsx_path, records = write_import_files(import_rows, args.seed, with_excel)
+
+    results = {}
+    window, dashboard = bench_dashboard(app, args.repeat)
+    results.update(dashboard)
+    results.update(bench_export(args.repeat, with_excel))
+    results.update(bench_import(args.repeat, csv_path, xlsx_path, records, args.json_records))
+
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+    for name, result in results.items():
+        print(f"{name:<40} median {result['median_ms']:>10.2f} ms   min {result['min_ms']:>10.2f} ms", flush=True)
+    return {"dataset": counts, "import_rows": import_rows, "benchmarks": results}
+
+
+# === Perbandingan ===
+def compare(current, baseline_path, threshold):
+    """Cetak perbandingan median dengan hasil lama; return jumlah regresi."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    print(f"\nCompared with {baseline_path} (commit {baseline['environment'].get('commit')})")
+    regressions = 0
+    for rows, result in current["sizes"].items():
+        old_result = baseline["sizes"].get(rows)
+        if not old_result:
+            continue
+        print(f"--- {rows} rows ---")
+        for name, bench in result["benchmarks"].items():
+            old = old_result["benchmarks"].get(name)
+            if not old or not old["median_ms"]:
+                continue
+            ratio = bench["median_ms"] / old["median_ms"]
+            verdict = ""
+            if ratio > 1 + threshold:
+                verdict = "REGRESSION"
+                regressions += 1
+            elif ratio < 1 - threshold:
+                verdict = "faster"
+            print(f"{name:<40} {old['median_ms']:>10.2f} → {bench['median_ms']:>10.2f} ms  x{ratio:5.2f}  {verdict}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000], help="ukuran dataset (1000 - 1000000)")
+    parser.add_argument("--repeat", type=int, default=3, help="jumlah pengulangan per benchmark")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--import-rows", type=int, default=10000, help="baris per file import CSV / Excel")
+    parser.add_argument("--json-records", type=int, default=100, help="record per benchmark import JSON")
+    parser.add_argument("--out", help="file JSON hasil (default: benchmarks/results/<tanggal>_<commit>.json)")
+    parser.add_argument("--compare", help="file JSON hasil lama untuk dibandingkan")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="batas regresi (0.10 = 10%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit code 1 kalau ada regresi")
+    parser.add_argument("--keep", action="store_true", help="jangan hapus folder kerja sementara")
+    args = parser.parse_args()
+
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+
+    try:
+        import openpyxl  # noqa: F401
+        with_excel = True
+    except ImportError:
+        print("openpyxl is not installed: Excel import/export benchmarks are skipped")
+        with_excel = False
+
+    environment = _environment()
+    baseline_path = os.path.abspath(args.compare) if args.compare else None
+    out_path = os.path.abspath(args.out) if args.out else os.path.join(
+        RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}_{environment['commit'] or 'unknown'}.json"
+    )
+
+    # Aplikasi memakai path relatif (data/apply_me.db, data/settings.json):
+    # pindah ke folder sementara supaya database asli tidak tersentuh
+    work_dir = tempfile.mkdtemp(prefix="apply_me_suite_")
+    original_dir = os.getcwd()
+    os.chdir(work_dir)
+
+    from PySide6.QtWidgets import QApplication
+    from app.others.Theme import apply_theme
+
+    app = QApplication.instance() or QApplication([])
+    apply_theme(app)
+
+    report = {
+        "environment": environment,
+        "settings": {"repeat": args.repeat, "seed": args.seed, "json_records": args.json_records},
+        "sizes": {},
+    }
+    try:
+        for rows in args.rows:
+            report["sizes"][str(rows)] = run_size(app, rows, args, with_excel)
+    finally:
+        from app.database.Database import engine
+        from app.database.WriteQueue import write_queue
+
+        write_queue().stop()
+        engine.dispose()
+        os.chdir(original_dir)
+        if args.keep:
+            print(f"work dir kept: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nresults: {out_path}")
+
+    if baseline_path:
+        regressions = compare(report, baseline_path, args.threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
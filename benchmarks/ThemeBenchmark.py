@@ -0,0 +1,153 @@
+"""Bandingkan biaya styling: setStyleSheet per widget vs satu stylesheet aplikasi (Theme.py).
+
+Window uji meniru dashboard: side menu, tabel, panel detail dan tombol-tombolnya.
+Diukur: membuat + menampilkan window sampai ter-polish, repaint penuh (grab),
+dan ganti state validasi form berulang kali.
+
+Jalankan dari root project:
+    python -m benchmarks.ThemeBenchmark --windows 20 --toggles 2000
+"""
+import argparse
+import statistics
+import time
+
+from PySide6.QtWidgets import (
+    QApplication, QGroupBox, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTableWidget, QVBoxLayout, QWidget
+)
+
+from app.others.Theme import STYLESHEET, set_state
+
+# Potongan QSS lama yang dulu dipasang langsung di widget
+INLINE_SIDE_MENU = """
+    QPushButton { text-align: left; padding: 10px 16px; font-size: 13px; color: #dddddd;
+                  border: none; background-color: transparent; }
+    QPushButton:hover { background-color: #1f1f1f; color: #ffffff; }
+    QPushButton:checked { background-color: #2563eb; color: white; font-weight: bold; }
+"""
+INLINE_TABLE = """
+    QTableView { background-color: #1e1e1e; color: #ddd; gridline-color: #333; border: none;
+                 selection-background-color: #1565c0; selection-color: white; }
+    QHeaderView::section { background-color: #2b2b2b; color: #ddd; padding: 4px; border: none; }
+"""
+INLINE_DETAILS = """
+    QGroupBox { background-color: #212121; border: 1px solid #2e2e2e; border-radius: 8px;
+                margin-top: 6px; color: #e0e0e0; font-weight: 600; padding-top: 12px; }
+"""
+INLINE_DETAIL_BUTTON = """
+    QPushButton { background-color: #2a2a2a; color: #999; border: 1px solid #444;
+                  border-radius: 4px; padding: 5px; }
+    QPushButton:enabled { background-color: #1e88e5; color: white; }
+    QPushButton:hover:enabled { background-color: #1565c0; }
+"""
+
+
+def build_window(inline, detail_buttons=8):
+    window = QWidget()
+    layout = QHBoxLayout(window)
+
+    side_menu = QWidget()
+    side_menu.setObjectName("sideMenu")
+    side_layout = QVBoxLayout(side_menu)
+    for text in ["Dashboard", "Statistics", "Reminders", "Contacts"]:
+        button = QPushButton(text)
+        button.setCheckable(True)
+        side_layout.addWidget(button)
+
+    table = QTableWidget(50, 7)
+    table.setObjectName("applicationTable")
+
+    details = QGroupBox("Application Details")
+    details.setObjectName("detailsBox")
+    details_layout = QVBoxLayout(details)
+    for i in range(detail_buttons):
+        details_layout.addWidget(QLabel(f"Field {i}: -"))
+        button = QPushButton(f"Open {i}")
+        if inline:
+            button.setStyleSheet(INLINE_DETAIL_BUTTON)  # seperti loop tombol detail yang lama
+        else:
+            button.setProperty("variant", "detail")
+        details_layout.addWidget(button)
+
+    if inline:
+        side_menu.setStyleSheet(INLINE_SIDE_MENU)
+        table.setStyleSheet(INLINE_TABLE)
+        details.setStyleSheet(INLINE_DETAILS)
+
+    layout.addWidget(side_menu)
+    layout.addWidget(table)
+    layout.addWidget(details)
+    window.resize(1200, 700)
+    return window
+
+
+def bench_windows(app, inline, count):
+    build_ms, paint_ms = [], []
+    for _ in range(count):
+        start = time.perf_counter()
+        window = build_window(inline)
+        window.show()
+        app.processEvents()  # polish + layout + paint pertama
+        build_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        window.grab()  # repaint penuh ke pixmap
+        paint_ms.append((time.perf_counter() - start) * 1000)
+
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return statistics.median(build_ms), statistics.median(paint_ms)
+
+
+def bench_toggles(app, inline, count):
+    label = QLabel("Please fill out all fields!")
+    field = QLineEdit()
+    container = QWidget()
+    layout = QVBoxLayout(container)
+    layout.addWidget(label)
+    layout.addWidget(field)
+    container.show()
+    app.processEvents()
+
+    start = time.perf_counter()
+    for i in range(count):
+        error = i % 2 == 0
+        if inline:
+            label.setStyleSheet("color: red;" if error else "color: green;")
+            field.setStyleSheet("border: 2px solid red;" if error else "")
+        else:
+            set_state(label, "state", "error" if error else "success")
+            set_state(field, "validation", "error" if error else None)
+    app.processEvents()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    container.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--windows", type=int, default=20, help="jumlah window yang dibuat per mode")
+    parser.add_argument("--toggles", type=int, default=2000, help="jumlah perubahan state validasi per mode")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+
+    results = {}
+    for mode, inline in [("inline", True), ("theme", False)]:
+        app.setStyleSheet("" if inline else STYLESHEET)
+        build, paint = bench_windows(app, inline, args.windows)
+        toggles = bench_toggles(app, inline, args.toggles)
+        results[mode] = (build, paint, toggles)
+
+    print(f"{'Mode':<8} {'build+show ms':>14} {'repaint ms':>11} {f'{args.toggles} toggles ms':>18}")
+    for mode, (build, paint, toggles) in results.items():
+        print(f"{mode:<8} {build:>14.2f} {paint:>11.2f} {toggles:>18.2f}")
+
+    (build_a, paint_a, toggle_a), (build_b, paint_b, toggle_b) = results["inline"], results["theme"]
+    print(f"Saved: build {build_a - build_b:.2f} ms/window, repaint {paint_a - paint_b:.2f} ms, "
+          f"toggles {toggle_a - toggle_b:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""stdout ApplyMeCLI.py hanya berisi data, juga saat database lama perlu di-migrate dulu.
+
+    python -m unittest discover tests
+"""
+import csv
+import io
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, "ApplyMeCLI.py")
+
+
+class ExportToStdoutTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.workdir, "data"))
+        # Database bawaan repo: schema awal, PRAGMA user_version = 0 → semua migration jalan
+        db_path = os.path.join(self.workdir, "data", "apply_me.db")
+        shutil.copy(os.path.join(ROOT, "data", "apply_me.db"), db_path)
+        with sqlite3.connect(db_path) as conn:
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], 0)
+            conn.executemany(
+                "INSERT INTO applications (id, company_name, position, location, date_applied, source, status, "
+                "salary_expectation, notes, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    ("AC001", "Acme", "Backend", "Jakarta", "2024-01-02", "LinkedIn", "Applied", "10",
+                     "first line\nsecond line", "2024-01-02 09:00:00"),
+                    ("GL001", "Globex", "Data", "Bandung", "2024-02-03", "Referral", "Interview", "12",
+                     "", "2024-02-03 10:00:00"),
+                ],
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def test_export_dash_is_clean_csv_on_unmigrated_database(self):
+        result = subprocess.run(
+            [sys.executable, CLI, "export", "-"],
+            cwd=self.workdir, capture_output=True, text=True, encoding="utf-8", timeout=120,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Migration 001 applied", result.stderr)
+        self.assertNotIn("Migration", result.stdout)
+
+        rows = list(csv.reader(io.StringIO(result.stdout)))
+        header, data = rows[0], rows[1:]
+        self.assertIn("Company", header)
+        self.assertEqual(len(data), 2)
+        self.assertTrue(all(len(row) == len(header) for row in data))
+        self.assertEqual(
+            sorted(row[header.index("Company")] for row in data), ["Acme", "Globex"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
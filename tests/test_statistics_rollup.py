@@ -0,0 +1,103 @@
+"""Rollup statistik yang dijaga trigger harus sama dengan rebuild_rollups() dari nol.
+
+    python -m unittest discover tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database.Database import Base  # noqa: E402
+from app.database.Migrations import run_migrations  # noqa: E402
+from app.database.StatisticsRollup import rebuild_rollups  # noqa: E402
+from app.database.WriteCommands import delete_application, save_application  # noqa: E402
+
+
+def _values(company, source, date_applied, status="Applied"):
+    return {
+        "company_name": company, "position": "Engineer", "location": "Jakarta",
+        "date_applied": date_applied, "source": source, "status": status,
+    }
+
+
+class RollupTriggerTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.workdir, 'rollup.db')}")
+        Base.metadata.create_all(bind=self.engine)
+        run_migrations(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def save(self, values, app_id=None):
+        with self.Session() as session:
+            app_id = save_application(session, values, app_id)
+            session.commit()
+            return app_id
+
+    def delete(self, app_id):
+        with self.Session() as session:
+            delete_application(session, app_id)
+            session.commit()
+
+    def snapshot(self, conn):
+        # Trigger bisa menyisakan baris bernilai 0; rebuild tidak membuatnya
+        source = conn.execute(text(
+            "SELECT day, source, applied FROM stats_daily_source WHERE applied != 0 ORDER BY 1, 2"
+        )).all()
+        status = conn.execute(text(
+            "SELECT day, status, entered, responses, ROUND(response_days, 6) FROM stats_daily_status "
+            "WHERE entered != 0 OR responses != 0 OR ROUND(response_days, 6) != 0 ORDER BY 1, 2"
+        )).all()
+        return source, status
+
+    def assert_matches_rebuild(self):
+        with self.engine.begin() as conn:
+            maintained = self.snapshot(conn)
+            rebuild_rollups(conn)
+            rebuilt = self.snapshot(conn)
+            conn.rollback()
+        self.assertTrue(maintained[0] and maintained[1])
+        self.assertEqual(maintained, rebuilt)
+
+    def test_triggers_match_rebuild_through_edits_and_deletes(self):
+        acme = self.save(_values("Acme", "LinkedIn", date(2024, 1, 2)))
+        globex = self.save(_values("Globex", "Referral", date(2024, 1, 5)))
+        initech = self.save(_values("Initech", None, None))
+        self.assert_matches_rebuild()
+
+        # Perpindahan status: tanggapan pertama (dari Applied) lalu lanjut
+        self.save(_values("Acme", "LinkedIn", date(2024, 1, 2), "Interview"), acme)
+        self.save(_values("Globex", "Referral", date(2024, 1, 5), "Rejected"), globex)
+        self.save(_values("Acme", "LinkedIn", date(2024, 1, 2), "Offer"), acme)
+        self.save(_values("Initech", None, None, "Interview"), initech)
+        self.assert_matches_rebuild()
+
+        # Edit tanggal apply sesudah ada tanggapan → response_days digeser (_response_shift)
+        self.save(_values("Acme", "LinkedIn", date(2023, 12, 20), "Offer"), acme)
+        self.save(_values("Initech", None, date(2024, 1, 1), "Interview"), initech)
+        self.save(_values("Globex", "Referral", None, "Rejected"), globex)
+        self.assert_matches_rebuild()
+
+        # Edit source tanpa ganti status
+        self.save(_values("Globex", "Jobstreet", date(2024, 1, 6), "Rejected"), globex)
+        self.assert_matches_rebuild()
+
+        # Delete: history dihapus lewat cascade ORM sebelum lamarannya
+        self.delete(acme)
+        self.delete(initech)
+        self.assert_matches_rebuild()
+
+
+if __name__ == "__main__":
+    unittest.main()